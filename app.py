@@ -1,15 +1,43 @@
-from flask import Flask, request
+import json
+import os
+
+from flask import Flask, Response, request, stream_with_context
 from loguru import logger
 
+from src.api.calculator import Calculator
+from src.api.client_connection import create_disconnection_check
+from src.api.metrics_store import MetricsStore
 from src.api.request_parser import RequestParser
-from src.api.response_builder import ResponseBuilder
-from src.loading.loader.loader_factory import LoaderFactory
+from src.api.response_encoder import ResponseEncoder
+from src.api.result_cache import ResultCache
+from src.jobs.job_worker_pool import JobWorkerPool
+from src.jobs.sqlite_job_queue import SqliteJobQueue
 
 logger.remove()
 logger.add('logs/{time:YYYY-MM-DD}_info.log', level='INFO', rotation='00:00', retention=90)
 logger.add('logs/{time:YYYY-MM-DD}_debug.log', level='DEBUG', rotation='00:00', retention=7)
 
+BATCH_PROCESSES = os.cpu_count() or 1
+MAX_BATCH_SIZE = 100
+# Synchronous calculations stop in time to respond before the gunicorn worker timeout
+MAX_TIME_BUDGET = 280
+# Jobs are solved by `python job_worker.py` processes. Solver threads in web workers would compete
+# with requests for the GIL, so they are started there only when JOB_WORKERS is set
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 0))
+
 app = Flask(__name__)
+result_cache = ResultCache('cache/results.sqlite')
+metrics_store = MetricsStore('metrics/metrics.sqlite')
+calculator = Calculator(result_cache, metrics_store, BATCH_PROCESSES)
+response_encoder = ResponseEncoder()
+job_queue = SqliteJobQueue('jobs/jobs.sqlite')
+job_worker_pool = JobWorkerPool(job_queue, calculator.calculate, JOB_WORKERS)
+
+
+@app.before_request
+def start_job_workers():
+    if JOB_WORKERS > 0:
+        job_worker_pool.start()
 
 
 @app.route('/', methods=['GET'])
@@ -19,24 +47,90 @@ def hello_world():
            "<ol>" \
            "    <li>[GET] /</li>" \
            "    <li>[POST] /calculate</li>" \
+           "    <li>[POST] /calculate?stream=true</li>" \
+           "    <li>[POST] /calculate/batch</li>" \
+           "    <li>[POST] /jobs</li>" \
+           "    <li>[GET] /jobs/&lt;id&gt;</li>" \
+           "    <li>[GET] /cache</li>" \
+           "    <li>[GET] /metrics</li>" \
            "</ol>"
 
 
 @app.route('/calculate', methods=['POST'])
 def calculate():
-    request_parser = RequestParser()
-    request_data = request_parser.parse(request)
-
-    loader_factory = LoaderFactory()
-    loader = loader_factory.create(
-        request_data.shipment_params,
-        request_data.container_params,
-        request_data.loading_type_name
-    )
-    loader.load()
-
-    response_builder = ResponseBuilder()
-    return response_builder.build(loader.containers, loader.shipment_params)
+    try:
+        request_json = Calculator.limit_time_budget(request.json, MAX_TIME_BUDGET)
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    if request.args.get('stream', 'false').lower() != 'true':
+        # Malformed requests are rejected before solving, so errors of the solver itself are not answered with 400
+        try:
+            RequestParser().parse_json(request_json)
+        except (KeyError, TypeError, ValueError) as e:
+            return {'error': f'Malformed request: {type(e).__name__}: {e}'}, 400
+        response_json = calculator.calculate(request_json, is_cancelled=create_disconnection_check(request.environ))
+        return encode(response_json, response_encoder.scene_mimetypes)
+
+    # Malformed requests are answered before the stream starts with its status
+    try:
+        responses = calculator.calculate_iteratively(request_json)
+    except (KeyError, TypeError, ValueError) as e:
+        return {'error': f'Malformed request: {type(e).__name__}: {e}'}, 400
+    # Every container is written as one line as soon as it is loaded, left cargos are the last line
+    lines = (json.dumps(line) + '\n' for line in responses)
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    request_jsons = request.json
+    if not isinstance(request_jsons, list):
+        return {'error': 'Batch should be a list of requests'}, 400
+    if len(request_jsons) > MAX_BATCH_SIZE:
+        return {'error': f'Batch should have at most {MAX_BATCH_SIZE} requests'}, 400
+    # Requests of a batch wait for idle processes, so the whole batch has to respond before the worker timeout
+    results = calculator.calculate_batch(request_jsons, BATCH_PROCESSES, MAX_TIME_BUDGET)
+    return encode({'results': results}, response_encoder.mimetypes)
+
+
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    # Malformed requests are rejected right away instead of failing in a worker
+    try:
+        RequestParser().parse(request)
+    except (KeyError, TypeError, ValueError) as e:
+        return {'error': f'Malformed request: {type(e).__name__}: {e}'}, 400
+    job_id = job_queue.submit(request.json)
+    logger.info(f'Submitted job {job_id}')
+    return {'id': job_id, 'status': 'queued'}, 202
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        return {'error': f'Job {job_id} is not found'}, 404
+    return job.build_response()
+
+
+@app.route('/cache', methods=['GET'])
+def cache_stats():
+    return result_cache.get_stats()
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(metrics_store.render(), mimetype='text/plain; version=0.0.4')
+
+
+def encode(response_json, mimetypes):
+    # Responses stay plain json unless the client asks for MessagePack or a glTF scene or accepts gzip
+    mimetype = request.accept_mimetypes.best_match(mimetypes, ResponseEncoder.JSON_MIMETYPE)
+    with_gzip = request.accept_encodings['gzip'] > 0
+    if mimetype == ResponseEncoder.JSON_MIMETYPE and not with_gzip:
+        return response_json
+    body, headers = response_encoder.encode(response_json, mimetype, with_gzip)
+    return Response(body, mimetype=mimetype, headers=headers)
 
 
 if __name__ == '__main__':
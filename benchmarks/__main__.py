@@ -0,0 +1,92 @@
+"""
+Measures the free places engine and compares the results with the saved baselines:
+
+    python -m benchmarks           fails if any benchmark is slower than its baseline beyond the tolerance
+                                   or its state has another number of free places
+    python -m benchmarks --save    saves the results as the new baselines
+
+Operations per second depend on the machine, baselines should be saved on the one they are checked on.
+"""
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+import click
+
+from benchmarks.places_benchmarks import Benchmark, create_benchmarks
+from benchmarks.scenarios import create_scenarios
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+
+def measure(benchmark: Benchmark, repeats: int, min_time: float) -> float:
+    """Best operations per second of the repeats, each one runs for at least min time."""
+    best_ops_per_sec = 0
+    for _ in range(repeats):
+        ops = 0
+        elapsed = 0
+        run = benchmark.prepare()
+        while elapsed < min_time:
+            if not benchmark.is_repeatable and ops > 0:
+                run = benchmark.prepare()
+            start = time.perf_counter()
+            ops += run()
+            elapsed += time.perf_counter() - start
+        best_ops_per_sec = max(best_ops_per_sec, ops / elapsed)
+    return best_ops_per_sec
+
+
+def compare(results: Dict[str, Dict], baselines: Dict[str, Dict], tolerance: float) -> List[str]:
+    failures = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result['places'] != baseline['places']:
+            failures.append(f'{name}: {result["places"]} places instead of {baseline["places"]}')
+        if result['ops_per_sec'] < baseline['ops_per_sec'] * (1 - tolerance):
+            failures.append(f'{name}: {result["ops_per_sec"]:.1f} ops/sec, baseline {baseline["ops_per_sec"]:.1f}')
+    return failures
+
+
+@click.command()
+@click.option('-s', '--save', is_flag=True, help='Save results as baselines')
+@click.option('-t', '--tolerance', default=0.25, help='Allowed share of ops/sec lost against baselines')
+@click.option('-r', '--repeats', default=5, help='Repeats of every benchmark, the best one counts')
+@click.option('-m', '--min-time', default=0.2, help='Minimal measured time of a repeat in seconds')
+@click.option('-k', '--filter', 'name_filter', default='', help='Run only benchmarks with names containing it')
+def main(save: bool, tolerance: float, repeats: int, min_time: float, name_filter: str):
+    results = {}
+    for benchmark in create_benchmarks(create_scenarios()):
+        if name_filter not in benchmark.name:
+            continue
+        ops_per_sec = measure(benchmark, repeats, min_time)
+        results[benchmark.name] = {'ops_per_sec': round(ops_per_sec, 1), 'places': benchmark.count_places()}
+        print(f'{benchmark.name:<50} {ops_per_sec:>12.1f} ops/sec {results[benchmark.name]["places"]:>6} places')
+
+    if save:
+        baselines = {}
+        if os.path.exists(BASELINES_PATH):
+            with open(BASELINES_PATH) as f:
+                baselines = json.load(f)
+        baselines.update(results)
+        with open(BASELINES_PATH, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Saved baselines to {BASELINES_PATH}')
+        return
+
+    if not os.path.exists(BASELINES_PATH):
+        print(f'No baselines at {BASELINES_PATH}, run with --save first')
+        sys.exit(1)
+    with open(BASELINES_PATH) as f:
+        failures = compare(results, json.load(f), tolerance)
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures how long a fresh interpreter takes to import the API, which is what every gunicorn worker recycled
+after max_requests pays unless the app is preloaded, and checks that no plotting or table modules are loaded:
+
+    python -m benchmarks.import_budget              fails if the import takes longer than the budget
+                                                    or loads any of the forbidden modules
+    python -m benchmarks.import_budget -b 0.5       checks another budget in seconds
+
+The app creates its sqlite files on import, so it is imported in a temporary directory.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List, Tuple
+
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN_MODULES = ['matplotlib', 'mpl_toolkits', 'pandas', 'openpyxl', 'tqdm']
+
+_PROBE = '''
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+print(json.dumps({{'seconds': time.perf_counter() - start, 'modules': sorted(sys.modules)}}))
+'''
+
+
+def measure_import(module: str, directory: str) -> Tuple[float, List[str]]:
+    """Seconds the import takes in a fresh interpreter and the modules loaded by then."""
+    python_path = [ROOT] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+    completed = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(module=module)],
+        cwd=directory,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(python_path)),
+        capture_output=True,
+        text=True,
+        check=True)
+    result = json.loads(completed.stdout.splitlines()[-1])
+    return result['seconds'], result['modules']
+
+
+def find_forbidden_modules(modules: List[str]) -> List[str]:
+    return [
+        forbidden for forbidden in FORBIDDEN_MODULES
+        if any(module == forbidden or module.startswith(forbidden + '.') for module in modules)
+    ]
+
+
+@click.command()
+@click.option('-m', '--module', default='app', help='Module imported by the workers')
+@click.option('-b', '--budget', default=0.75, help='Allowed import time in seconds')
+@click.option('-r', '--repeats', default=5, help='Repeats of the import, the best one counts')
+def main(module: str, budget: float, repeats: int):
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        # The first import may also compile the sources, so only the best repeat counts
+        measurements = [measure_import(module, directory) for _ in range(repeats)]
+    seconds = min(seconds for seconds, _ in measurements)
+    modules = measurements[0][1]
+    print(f'import {module:<44} {seconds:>12.3f} sec {len(modules):>6} modules')
+
+    if seconds > budget:
+        failures.append(f'import {module}: {seconds:.3f} sec, budget {budget:.3f} sec')
+    for forbidden in find_forbidden_modules(modules):
+        failures.append(f'import {module}: loads {forbidden}')
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
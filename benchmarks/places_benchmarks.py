@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from benchmarks.scenarios import Scenario
+from src.items.container import Container
+from src.items.item_fabric import ItemFabric
+from src.iterators.horizontal_points_iterator import HorizontalPointsIterator
+from src.iterators.vertical_points_iterator import VerticalPointsIterator
+from src.loading.loading_type import LoadingType
+from src.loading.point.places_array import PlacesArray
+from src.loading.point.places_index import PlacesIndex
+from src.loading.point.places_manager import PlacesManager
+from src.loading.point.point import Point
+from src.loading.point.points_update_info_resolver import PointsUpdateInfoResolver
+from src.parameters.shipment_parameters import ShipmentParameters
+from src.parameters.util_parameters.volume_parameters import VolumeParameters
+
+# Prepares a fresh state and returns the measured run, which returns the number of operations made
+Run = Callable[[], int]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    prepare: Callable[[], Run]
+    # Number of free places in the state the benchmark measures, changes mean the engine behaves differently
+    count_places: Callable[[], int]
+    # Runs which do not change the state can be repeated without preparing it again
+    is_repeatable: bool = True
+
+
+def create_benchmarks(scenarios: List[Scenario]) -> List[Benchmark]:
+    benchmarks = []
+    for scenario in scenarios:
+        benchmarks.extend([
+            _create_update_benchmark(scenario),
+            _create_resolve_benchmark(scenario),
+            _create_points_iterator_benchmark(scenario),
+            _create_can_load_benchmark(scenario),
+            _create_select_benchmark(scenario, 'scan', None)
+        ])
+        if PlacesArray.is_available():
+            benchmarks.append(_create_select_benchmark(scenario, 'array', 0))
+    return benchmarks
+
+
+def _create_update_benchmark(scenario: Scenario) -> Benchmark:
+    def prepare() -> Run:
+        places_manager = _create_places_manager(scenario)
+
+        def run() -> int:
+            for point, shipment_params in scenario.next_loads:
+                places_manager.update(point, _compute_max_point(point, shipment_params), shipment_params.can_stack)
+            return len(scenario.next_loads)
+        return run
+
+    def count_places() -> int:
+        places_manager = _create_places_manager(scenario)
+        for point, shipment_params in scenario.next_loads:
+            places_manager.update(point, _compute_max_point(point, shipment_params), shipment_params.can_stack)
+        return _count_places(places_manager)
+
+    return Benchmark(f'places_manager_update/{scenario.name}', prepare, count_places, False)
+
+
+def _create_resolve_benchmark(scenario: Scenario) -> Benchmark:
+    def prepare() -> Run:
+        places = PlacesIndex(scenario.container_params)
+        for opening_p, closing_ps in _create_places_manager(scenario).places.items():
+            for closing_p in closing_ps:
+                places.add(opening_p, closing_p)
+        resolver = PointsUpdateInfoResolver()
+
+        def run() -> int:
+            for point, shipment_params in scenario.next_loads:
+                resolver.resolve(places, point, _compute_max_point(point, shipment_params))
+            return len(scenario.next_loads)
+        return run
+
+    return Benchmark(
+        f'points_update_info_resolve/{scenario.name}', prepare,
+        lambda: _count_places(_create_places_manager(scenario)))
+
+
+def _create_points_iterator_benchmark(scenario: Scenario) -> Benchmark:
+    def prepare() -> Run:
+        opening_points = _create_places_manager(scenario).get_opening_points()
+
+        def run() -> int:
+            for _ in VerticalPointsIterator(opening_points):
+                pass
+            for _ in HorizontalPointsIterator(opening_points):
+                pass
+            return 2
+        return run
+
+    return Benchmark(
+        f'points_iterator/{scenario.name}', prepare,
+        lambda: _count_places(_create_places_manager(scenario)))
+
+
+def _create_can_load_benchmark(scenario: Scenario) -> Benchmark:
+    probe_shipment_params = [
+        ShipmentParameters('small', 'box', 300, 300, 300, 1, 'red', True, True, False, False, 0),
+        ShipmentParameters('long', 'box', 1200, 400, 400, 1, 'red', True, True, False, False, 0),
+        ShipmentParameters('large', 'box', 800, 800, 800, 1, 'red', True, True, False, False, 0)
+    ]
+
+    def prepare() -> Run:
+        container = _create_container(scenario)
+        opening_points = container.loadable_points
+
+        def run() -> int:
+            for point in opening_points:
+                for shipment_params in probe_shipment_params:
+                    container.can_load_into_point(point, shipment_params)
+            return len(opening_points) * len(probe_shipment_params)
+        return run
+
+    return Benchmark(
+        f'container_can_load_into_point/{scenario.name}', prepare,
+        lambda: len(_create_container(scenario).loadable_points))
+
+
+def _create_select_benchmark(scenario: Scenario, mode: str, min_array_places: Optional[int]) -> Benchmark:
+    """
+    Opening points selected by scanning places or by the places array. Sizes after the first one fit
+    in fewer places or in none, as for the orientations of a shipment left out of a crowded container.
+    """
+    sizes = [(300, 300, 300), (1200, 400, 400), (400, 1200, 400), (800, 800, 800), (3000, 3000, 3000)]
+
+    def prepare() -> Run:
+        places_manager = _create_places_manager(scenario, min_array_places)
+
+        def run() -> int:
+            for i in range(len(sizes)):
+                for loading_type in LoadingType:
+                    places_manager.select_opening_point(sizes[i:], loading_type)
+            return len(sizes) * len(LoadingType)
+        return run
+
+    return Benchmark(
+        f'places_manager_select/{scenario.name}/{mode}', prepare,
+        lambda: _count_places(_create_places_manager(scenario)))
+
+
+def _create_places_manager(
+        scenario: Scenario,
+        min_array_places: Optional[int] = PlacesManager.MIN_ARRAY_PLACES
+) -> PlacesManager:
+    places_manager = PlacesManager(scenario.container_params, PointsUpdateInfoResolver(), min_array_places)
+    for point, shipment_params in scenario.loads:
+        places_manager.update(point, _compute_max_point(point, shipment_params), shipment_params.can_stack)
+    return places_manager
+
+
+def _create_container(scenario: Scenario) -> Container:
+    item_fabric = ItemFabric()
+    container = item_fabric.create_container(scenario.container_params)
+    for point, shipment_params in scenario.loads:
+        container.load(point, item_fabric.create_shipment(shipment_params))
+    return container
+
+
+def _count_places(places_manager: PlacesManager) -> int:
+    return sum(len(closing_ps) for closing_ps in places_manager.places.values())
+
+
+def _compute_max_point(point: Point, volume_parameters: VolumeParameters) -> Point:
+    return Point(
+        point.x + volume_parameters.get_loading_length() - 1,
+        point.y + volume_parameters.get_loading_width() - 1,
+        point.z + volume_parameters.height - 1)
@@ -0,0 +1,65 @@
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from src.loading.container_layout import ContainerLayout
+from src.loading.loading_type import LoadingType
+from src.loading.orientation_table import OrientationTable
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+Load = Tuple[Point, ShipmentParameters]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Container state after the loads, the next loads are the placements measured on top of it."""
+    name: str
+    container_params: ContainerParameters
+    loads: List[Load]
+    next_loads: List[Load]
+
+
+CONTAINER_PARAMS = ContainerParameters('20DV', length=5895, width=2350, height=2393, lifting_capacity=28200)
+NEXT_LOADS = 40
+
+
+def create_scenarios(seed: int = 1) -> List[Scenario]:
+    """Empty, fragmented (half of all loads of mixed sizes) and near-full (all but the last loads) containers."""
+    loads = _create_loads(CONTAINER_PARAMS, _create_shipment_params(seed))
+    middle = len(loads) // 2
+    end = len(loads) - NEXT_LOADS
+    return [
+        Scenario('empty', CONTAINER_PARAMS, [], loads[:NEXT_LOADS]),
+        Scenario('fragmented', CONTAINER_PARAMS, loads[:middle], loads[middle:middle + NEXT_LOADS]),
+        Scenario('near_full', CONTAINER_PARAMS, loads[:end], loads[end:])
+    ]
+
+
+def _create_shipment_params(seed: int) -> List[ShipmentParameters]:
+    r = random.Random(seed)
+    return [
+        ShipmentParameters(
+            f'sku{i}', 'box', r.randint(250, 700), r.randint(250, 700), r.randint(200, 600), 1, 'red',
+            True, True, False, False, 0)
+        for i in range(12)
+    ]
+
+
+def _create_loads(container_params: ContainerParameters, shipment_params: List[ShipmentParameters]) -> List[Load]:
+    """Shipments of random SKUs are loaded the way the loader does it until none of them fits."""
+    r = random.Random(0)
+    layout = ContainerLayout(container_params)
+    orientation_table = OrientationTable(shipment_params)
+    loads = []
+    while shipment_params:
+        params = r.choice(shipment_params)
+        loading_point_and_params = layout.select_loading_point(orientation_table.get(params), LoadingType.COMPACT)
+        if loading_point_and_params is None:
+            shipment_params = [p for p in shipment_params if p is not params]
+            continue
+        point, params_variation = loading_point_and_params
+        layout.load(point, params_variation)
+        loads.append((point, params_variation))
+    return loads
@@ -1,3 +1,4 @@
+import gc
 import multiprocessing
 
 bind = '0.0.0.0:5000'
@@ -5,3 +6,11 @@ max_requests = 1000
 max_requests_jitter = 50
 timeout = 300
 workers = multiprocessing.cpu_count() * 2 + 1
+# The app is imported once in the master, so workers recycled after max_requests start without importing it again
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Objects of the preloaded app are moved out of the collected generations, so collections in workers
+    # do not write to their pages and the workers keep sharing them with the master
+    gc.freeze()
@@ -0,0 +1,9 @@
+import os
+
+from app import calculator, job_queue
+from src.jobs.job_worker_pool import JobWorkerPool
+
+# Solves queued jobs apart from the gunicorn web workers, one job at a time per process by default,
+# so run as many processes as there are cores to spare for jobs
+if __name__ == '__main__':
+    JobWorkerPool(job_queue, calculator.calculate, int(os.environ.get('JOB_WORKERS', 1))).run()
@@ -1,97 +1,176 @@
-import random
+import glob
+import json
+import multiprocessing
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 import click
 import matplotlib.colors as mcolors
-import pandas as pd
 from loguru import logger
 
 from src.api.response_builder import ResponseBuilder
+from src.gltf_exporter import GltfExporter
 from src.image_3d_creator import Image3dCreator
+from src.image_3d_renderer import Image3dRenderer
 from src.loading.loader.loader_factory import LoaderFactory
+from src.manifests.manifest_reader import ManifestReader
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
 
 COLORS = list(mcolors.CSS4_COLORS.keys())
+SHIPMENTS_SUFFIX = '_shipments'
+CONTAINERS_SUFFIX = '_containers'
+RESULT_SUFFIX = '_result.json'
+MANIFEST_EXTENSIONS = ['.xlsx', '.csv', '.parquet']
 
 
-def parse_container_counts(file_path: str) -> Dict[ContainerParameters, int]:
-    df = pd.read_excel(file_path)
-    logger.debug(f'Read df from {file_path}')
-
-    container_counts = {}
-    for ind, container in df.iterrows():
-        container_params = ContainerParameters(
-            container['Name'],
-            container['Length'],
-            container['Width'],
-            container['Height'],
-            container['Lifting capacity']
-        )
-        container_counts[container_params] = container['Quantity']
-
+def parse_container_counts(file_path: str, use_cache: bool = True) -> Dict[ContainerParameters, int]:
+    manifest_reader = ManifestReader(COLORS, use_cache)
+    container_counts = manifest_reader.read_container_counts(file_path)
     logger.debug(f'Read {len(container_counts)} containers')
     return container_counts
 
 
-def parse_shipment_counts(file_path: str) -> Dict[ShipmentParameters, int]:
-    df = pd.read_excel(file_path)
-    logger.debug(f'Read df from {file_path}')
-
-    shipment_counts = {}
-    for ind, shipment in df.iterrows():
-        cargo_type =  shipment['Cargo type']
-        length = shipment['Length (cm)'] if cargo_type != 'barrel' else shipment['Width / Diameter for barrels (cm)']
-        shipment_params = ShipmentParameters(
-            shipment['Name'],
-            cargo_type,
-            length * 10,
-            shipment['Width / Diameter for barrels (cm)'] * 10,
-            shipment['Height (cm)'] * 10,
-            shipment['Weight (kg)'],
-            random.choice(COLORS),
-            not pd.isna(shipment['Stack']),
-            not pd.isna(shipment['Turn over (height)']),
-            not pd.isna(shipment['Turn over (length)']),
-            not pd.isna(shipment['Turn over (width)']),
-            shipment['Extension'] / 100
-        )
-        shipment_counts[shipment_params] = shipment['Q-ty']
-
+def parse_shipment_counts(file_path: str, use_cache: bool = True) -> Dict[ShipmentParameters, int]:
+    manifest_reader = ManifestReader(COLORS, use_cache)
+    shipment_counts = manifest_reader.read_shipment_counts(file_path)
     logger.info(f'Read {len(shipment_counts)} shipments')
     return shipment_counts
 
 
-@click.command()
+def find_manifests(path_or_pattern: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Shipments manifests of a directory or a glob with their container manifests: 'a_shipments.xlsx'
+    is solved with the containers of 'a_containers.xlsx', or with the default containers if there is no such file.
+    """
+    pattern = path_or_pattern
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, f'*{SHIPMENTS_SUFFIX}.*')
+
+    manifests = []
+    for shipments_path in sorted(glob.glob(pattern)):
+        stem, extension = os.path.splitext(shipments_path)
+        if extension.lower() not in MANIFEST_EXTENSIONS or not stem.endswith(SHIPMENTS_SUFFIX):
+            continue
+        prefix = stem[:-len(SHIPMENTS_SUFFIX)]
+        containers_paths = [
+            prefix + CONTAINERS_SUFFIX + containers_extension for containers_extension in MANIFEST_EXTENSIONS
+            if os.path.exists(prefix + CONTAINERS_SUFFIX + containers_extension)
+        ]
+        manifests.append((shipments_path, containers_paths[0] if containers_paths else None))
+    return manifests
+
+
+def solve_manifest(
+        shipments_path: str,
+        containers_path: Optional[str],
+        result_path: str,
+        loading_type_name: str,
+        block_loading: bool,
+        use_cache: bool,
+        render: bool,
+        with_scene: bool
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    shipment_counts = parse_shipment_counts(shipments_path, use_cache)
+    container_counts = parse_container_counts(containers_path, use_cache) if containers_path is not None else None
+
+    loader_factory = LoaderFactory()
+    loader = loader_factory.create(shipment_counts, container_counts, loading_type_name, with_blocks=block_loading)
+    loader.load()
+
+    response_builder = ResponseBuilder()
+    response = response_builder.build(loader.containers, loader.shipment_params)
+    with open(result_path, 'w') as f:
+        json.dump(response, f)
+
+    if render:
+        image_3d_renderer = Image3dRenderer(os.path.splitext(result_path)[0], datetime.now())
+        image_3d_renderer.render(loader.containers)
+    if with_scene:
+        with open(os.path.splitext(result_path)[0] + '.glb', 'wb') as f:
+            f.write(GltfExporter().export_containers(loader.containers))
+
+    return {
+        'containers': len(loader.containers),
+        'left_shipments': sum(loader.shipment_params.values()),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def init_batch_process(logger_level: str) -> None:
+    logger.remove()
+    logger.add(sys.stderr, level=logger_level)
+
+
+class DefaultCommandGroup(click.Group):
+    """
+    Group which runs its default command when the arguments do not start with a command name,
+    so 'python main.py -s shipments.xlsx' keeps loading as it did before the group had other commands.
+    """
+    _default_command_name: str
+
+    def __init__(self, *args: Any, default_command_name: str, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._default_command_name = default_command_name
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self._default_command_name, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup, default_command_name='load')
+def cli():
+    pass
+
+
+@cli.command('load')
 @click.option('-v', '--logger-level', default='DEBUG')
 @click.option('-s', '--shipments-file-path')
 @click.option('-c', '--containers-file-path', default=None)
 @click.option('-l', '--loading-type-name', default='compact')
+@click.option('-b', '--block-loading', is_flag=True, default=False)
+@click.option('-p', '--trial-processes', default=1)
+@click.option('-n', '--no-cache', is_flag=True, default=False, help='Parse manifests even if they are cached')
+@click.option('-i', '--images-dir', default=None, help='Save images of containers there instead of showing them')
+@click.option('--steps', is_flag=True, default=False, help='Save an image of every step of loading containers')
+@click.option('-g', '--gltf-path', default=None, help='Save loaded containers as a glTF scene instead of showing them')
 def main(
         logger_level: str,
         shipments_file_path: str,
         containers_file_path: Optional[str],
-        loading_type_name: Optional[str]
+        loading_type_name: Optional[str],
+        block_loading: bool,
+        trial_processes: int,
+        no_cache: bool,
+        images_dir: Optional[str],
+        steps: bool,
+        gltf_path: Optional[str]
 ):
+    """Loads shipments of a manifest into containers, also run without a command name."""
     logger.remove()
     logger.add(sys.stdout, level=logger_level)
 
-    shipment_counts = parse_shipment_counts(shipments_file_path)
+    shipment_counts = parse_shipment_counts(shipments_file_path, not no_cache)
     logger.info(f'Parsed shipment counts')
     for shipment_params, cnt in shipment_counts.items():
         logger.debug(str(shipment_params), cnt)
 
     container_counts = None
     if containers_file_path is not None:
-        container_counts = parse_container_counts(containers_file_path)
+        container_counts = parse_container_counts(containers_file_path, not no_cache)
         logger.info(f'Parsed container counts')
         for container_params, cnt in container_counts.items():
             logger.debug(str(container_params), cnt)
 
     loader_factory = LoaderFactory()
-    loader = loader_factory.create(shipment_counts, container_counts, loading_type_name, True)
+    loader = loader_factory.create(
+        shipment_counts, container_counts, loading_type_name, True, block_loading, trial_processes)
     loader.load()
 
     loaded_containers = loader.containers
@@ -101,14 +180,104 @@ def main(
     response = response_builder.build(loaded_containers, left_shipment_counts)
     logger.debug(f'Built response: {response}')
 
-    image_3d_creator = Image3dCreator(datetime.now())
-    for container in loaded_containers:
-        image_3d_creator.create(container)
+    if images_dir is not None:
+        image_3d_renderer = Image3dRenderer(images_dir, datetime.now(), os.cpu_count() or 1)
+        image_paths = image_3d_renderer.render(loaded_containers, steps)
+        logger.info(f'Saved {len(image_paths)} images to {images_dir}')
+    if gltf_path is not None:
+        with open(gltf_path, 'wb') as f:
+            f.write(GltfExporter().export_containers(loaded_containers))
+        logger.info(f'Saved scene of {len(loaded_containers)} containers to {gltf_path}')
+    if images_dir is None and gltf_path is None:
+        image_3d_creator = Image3dCreator(datetime.now())
+        for container in loaded_containers:
+            image_3d_creator.create(container)
 
     for shipment, count in left_shipment_counts.items():
         if count > 0:
             logger.debug(f'Not loaded {shipment}: {count}')
 
 
+@cli.command()
+@click.argument('manifests')
+@click.option('-o', '--output-dir', default=None, help='Directory of results, next to manifests by default')
+@click.option('-w', '--workers', default=os.cpu_count() or 1, help='Manifests solved at once')
+@click.option('-l', '--loading-type-name', default='compact')
+@click.option('-b', '--block-loading', is_flag=True, default=False)
+@click.option('-r', '--render', is_flag=True, default=False, help='Save images of loaded containers next to results')
+@click.option('-g', '--gltf', is_flag=True, default=False, help='Save glTF scenes of loaded containers next to results')
+@click.option('-n', '--no-cache', is_flag=True, default=False, help='Parse manifests even if they are cached')
+@click.option('-v', '--logger-level', default='WARNING')
+def batch(
+        manifests: str,
+        output_dir: Optional[str],
+        workers: int,
+        loading_type_name: str,
+        block_loading: bool,
+        render: bool,
+        gltf: bool,
+        no_cache: bool,
+        logger_level: str
+):
+    """
+    Solves all shipments manifests of a directory or a glob in a pool of processes and writes
+    the response of every manifest as json next to it or into the output directory.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=logger_level)
+
+    manifest_paths = find_manifests(manifests)
+    if not manifest_paths:
+        click.echo(f'No shipments manifests found at {manifests}')
+        sys.exit(1)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = []
+    # Spawned processes do not inherit the state of the parent, e.g. its plotting backend
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(
+            min(workers, len(manifest_paths)), mp_context, init_batch_process, (logger_level,)) as executor:
+        futures = []
+        for shipments_path, containers_path in manifest_paths:
+            name = os.path.basename(shipments_path)
+            result_directory = output_dir if output_dir is not None else os.path.dirname(shipments_path)
+            result_name = os.path.splitext(name)[0][:-len(SHIPMENTS_SUFFIX)] + RESULT_SUFFIX
+            futures.append(executor.submit(
+                solve_manifest,
+                shipments_path,
+                containers_path,
+                os.path.join(result_directory, result_name),
+                loading_type_name,
+                block_loading,
+                not no_cache,
+                render,
+                gltf))
+        for (shipments_path, _), future in zip(manifest_paths, futures):
+            try:
+                results.append((shipments_path, future.result(), None))
+            except Exception as e:
+                logger.exception(f'Failed to solve {shipments_path}')
+                results.append((shipments_path, None, f'{type(e).__name__}: {e}'))
+    wall_seconds = time.perf_counter() - start
+
+    click.echo(f'{"manifest":<50} {"containers":>10} {"left":>8} {"seconds":>10}')
+    for shipments_path, result, error in results:
+        if result is None:
+            click.echo(f'{shipments_path:<50} failed: {error}')
+        else:
+            click.echo(
+                f'{shipments_path:<50} {result["containers"]:>10} {result["left_shipments"]:>8} '
+                f'{result["seconds"]:>10.2f}')
+    solved = [result for _, result, _ in results if result is not None]
+    click.echo(
+        f'{len(solved)} of {len(results)} manifests solved in {wall_seconds:.2f} sec, '
+        f'{sum(result["seconds"] for result in solved):.2f} sec of solving, '
+        f'{sum(result["containers"] for result in solved)} containers, '
+        f'{sum(result["left_shipments"] for result in solved)} shipments left')
+    sys.exit(0 if len(solved) == len(results) else 1)
+
+
 if __name__ == '__main__':
-    main()
+    cli()
@@ -0,0 +1,274 @@
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from src.api.metrics_store import MetricsStore
+from src.api.portfolio import Portfolio
+from src.api.request_canonicalizer import RequestCanonicalizer
+from src.api.request_data import RequestData
+from src.api.request_parser import RequestParser
+from src.api.response_builder import ResponseBuilder
+from src.api.response_format import ResponseFormat
+from src.api.result_cache import ResultCache
+from src.loading.loader.deadline import Deadline
+from src.loading.loader.loader import Loader
+from src.loading.loader.loader_factory import LoaderFactory
+from src.loading.placement_trace import PlacementTrace
+from src.statistics.timings import Timings
+
+
+class Calculator:
+    """
+    Calculates responses to request json, shared by the synchronous route, batches and the job workers.
+    Timings of every calculation are recorded into the metrics store. Placement decisions are traced
+    and the trace is logged when loading fails. Calculations stopped by their time budget or by cancellation
+    respond with what is loaded so far and 'truncated': true, such responses are not cached.
+    Portfolio requests are solved with every configuration in a pool of the given portfolio processes.
+    """
+    _result_cache: ResultCache
+    _metrics_store: MetricsStore
+    _portfolio_processes: int
+
+    def __init__(self, result_cache: ResultCache, metrics_store: MetricsStore, portfolio_processes: int = 1) -> None:
+        self._result_cache = result_cache
+        self._metrics_store = metrics_store
+        self._portfolio_processes = portfolio_processes
+
+    def calculate(
+            self,
+            request_json: Dict[str, Any],
+            on_container_loaded: Optional[Callable[[int, int], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Any]:
+        timings = Timings()
+        trace = PlacementTrace()
+        with timings.measure('total'):
+            request_data, response = self._calculate(request_json, timings, trace, on_container_loaded, is_cancelled)
+        self._metrics_store.record(timings)
+
+        if request_data.with_timings:
+            response = dict(response, timings=timings.build_response())
+        if request_data.with_trace:
+            response = dict(response, trace=trace.dump())
+        return response
+
+    def calculate_iteratively(self, request_json: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the response of every container as soon as it is loaded and then the left cargos as
+        {'left_cargos': [...]}. Loaded containers are not kept, only their responses for the result cache.
+        Loading stops as soon as the caller stops iterating, e.g. when the client disconnects.
+        The request is parsed by the call itself, so malformed requests raise before anything is yielded.
+        """
+        timings = Timings()
+        start = time.perf_counter()
+        with timings.measure('parse'):
+            request_data, request_hash = self._prepare(request_json)
+        return self._calculate_iteratively(request_data, request_hash, timings, start)
+
+    def _calculate_iteratively(
+            self,
+            request_data: RequestData,
+            request_hash: str,
+            timings: Timings,
+            start: float
+    ) -> Iterator[Dict[str, Any]]:
+        trace = PlacementTrace()
+        with timings.measure('cache'):
+            response = self._get_cached_response(request_hash)
+
+        if response is None and request_data.portfolio:
+            # Configurations are compared when all of them are loaded, so nothing is yielded before
+            with timings.measure('portfolio'):
+                response = self._solve_portfolio(request_data, request_hash)
+            yield from response['containers']
+        elif response is not None:
+            yield from response['containers']
+        else:
+            loader = self._create_loader(request_data, timings=timings, trace=trace)
+            response_builder = self._create_response_builder(request_data)
+            response = response_builder.build([], {})
+            try:
+                for container in loader.load_iteratively(keep_containers=False):
+                    with timings.measure('response'):
+                        container_response = response_builder.build_container_response(container)
+                    response['containers'].append(container_response)
+                    yield container_response
+            except Exception:
+                self._log_trace(trace)
+                raise
+
+            with timings.measure('response'):
+                response['left_cargos'] = response_builder.build_left_cargos_response(loader.shipment_params)
+            self._complete_response(request_hash, response, loader.truncated)
+
+        timings.add_phase('total', time.perf_counter() - start)
+        self._metrics_store.record(timings)
+        last_line = {'left_cargos': response['left_cargos']}
+        if response.get('truncated'):
+            last_line['truncated'] = True
+        if 'portfolio' in response:
+            last_line['portfolio'] = response['portfolio']
+        if request_data.with_timings:
+            last_line['timings'] = timings.build_response()
+        if request_data.with_trace:
+            last_line['trace'] = trace.dump()
+        yield last_line
+
+    def calculate_batch(
+            self,
+            request_jsons: List[Dict[str, Any]],
+            processes: int,
+            time_budget: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculates independent requests in a pool of at most the given processes. Results are in the order
+        of requests, each is either {'response': ...} or {'error': ...}. Requests share the time budget
+        of the batch, every request gets at most the budget left when it starts.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(request_jsons)
+        if not request_jsons:
+            return results
+
+        deadline = Deadline(time_budget)
+        pending = deque(enumerate(request_jsons))
+        running: Dict[Future, int] = {}
+        # Spawned processes do not inherit locks held by the job worker threads at the moment of a fork
+        mp_context = multiprocessing.get_context('spawn')
+        processes = min(processes, len(request_jsons))
+        with ProcessPoolExecutor(processes, mp_context, self._init_batch_process) as executor:
+            while pending or running:
+                # Requests are submitted only to idle processes, so their budget is what is left when they start
+                while pending and len(running) < processes:
+                    i, request_json = pending.popleft()
+                    try:
+                        if time_budget is not None:
+                            request_json = self.limit_time_budget(request_json, deadline.get_time_left())
+                    except ValueError as e:
+                        results[i] = {'error': f'{type(e).__name__}: {e}'}
+                        continue
+                    running[executor.submit(self.calculate, request_json)] = i
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    try:
+                        results[i] = {'response': future.result()}
+                    except Exception as e:
+                        logger.exception(f'Batch request {i} failed')
+                        results[i] = {'error': f'{type(e).__name__}: {e}'}
+        return results
+
+    @staticmethod
+    def limit_time_budget(request_json: Dict[str, Any], max_time_budget: float) -> Dict[str, Any]:
+        """Caps the time budget of the request, requests without a budget get the cap."""
+        if not isinstance(request_json, dict):
+            return request_json
+        time_budget = request_json.get('time_budget')
+        if time_budget is not None:
+            RequestParser.check_time_budget(time_budget)
+        if time_budget is None or time_budget > max_time_budget:
+            return dict(request_json, time_budget=max_time_budget)
+        return request_json
+
+    @staticmethod
+    def _init_batch_process() -> None:
+        # Spawned processes start with the default logger which writes debug messages of every container
+        logger.remove()
+        logger.add(sys.stderr, level='INFO')
+
+    def _calculate(
+            self,
+            request_json: Dict[str, Any],
+            timings: Timings,
+            trace: PlacementTrace,
+            on_container_loaded: Optional[Callable[[int, int], None]],
+            is_cancelled: Optional[Callable[[], bool]]
+    ) -> Tuple[RequestData, Dict[str, Any]]:
+        with timings.measure('parse'):
+            request_data, request_hash = self._prepare(request_json)
+        with timings.measure('cache'):
+            cached_response = self._get_cached_response(request_hash)
+        if cached_response is not None:
+            return request_data, cached_response
+        if request_data.portfolio:
+            with timings.measure('portfolio'):
+                return request_data, self._solve_portfolio(request_data, request_hash, is_cancelled)
+
+        loader = self._create_loader(request_data, on_container_loaded, timings, trace, is_cancelled)
+        try:
+            loader.load()
+        except Exception:
+            self._log_trace(trace)
+            raise
+
+        with timings.measure('response'):
+            response_builder = self._create_response_builder(request_data)
+            response = response_builder.build(loader.containers, loader.shipment_params)
+        self._complete_response(request_hash, response, loader.truncated)
+        return request_data, response
+
+    def _solve_portfolio(
+            self,
+            request_data: RequestData,
+            request_hash: str,
+            is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Any]:
+        portfolio = Portfolio(self._portfolio_processes, self._init_batch_process)
+        response = portfolio.solve(request_data, is_cancelled)
+        self._complete_response(request_hash, response, response.get('truncated', False))
+        return response
+
+    @staticmethod
+    def _prepare(request_json: Dict[str, Any]) -> Tuple[RequestData, str]:
+        request_parser = RequestParser()
+        request_data = request_parser.parse_json(request_json)
+
+        request_canonicalizer = RequestCanonicalizer()
+        request_data = request_canonicalizer.canonicalize(request_data)
+        return request_data, request_canonicalizer.compute_hash(request_data)
+
+    def _complete_response(self, request_hash: str, response: Dict[str, Any], truncated: bool) -> None:
+        if truncated:
+            response['truncated'] = True
+        else:
+            self._result_cache.put(request_hash, response)
+
+    def _get_cached_response(self, request_hash: str) -> Optional[Dict[str, Any]]:
+        cached_response = self._result_cache.get(request_hash)
+        if cached_response is not None:
+            logger.info(f'Found cached response for {request_hash}')
+        return cached_response
+
+    @staticmethod
+    def _create_loader(
+            request_data: RequestData,
+            on_container_loaded: Optional[Callable[[int, int], None]] = None,
+            timings: Optional[Timings] = None,
+            trace: Optional[PlacementTrace] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Loader:
+        loader_factory = LoaderFactory()
+        return loader_factory.create(
+            request_data.shipment_params,
+            request_data.container_params,
+            request_data.loading_type_name,
+            with_blocks=request_data.block_loading,
+            on_container_loaded=on_container_loaded,
+            timings=timings,
+            trace=trace,
+            time_budget=request_data.time_budget,
+            is_cancelled=is_cancelled,
+            shipment_ordering_name=request_data.shipment_ordering_name
+        )
+
+    @staticmethod
+    def _create_response_builder(request_data: RequestData) -> ResponseBuilder:
+        return ResponseBuilder(ResponseFormat.from_name(request_data.response_format_name or 'json'))
+
+    @staticmethod
+    def _log_trace(trace: PlacementTrace) -> None:
+        logger.error('Placement trace of the failed calculation:\n' + '\n'.join(trace.format()))
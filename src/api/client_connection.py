@@ -0,0 +1,25 @@
+import select
+import socket
+from typing import Any, Callable, Dict, Optional
+
+
+def create_disconnection_check(environ: Dict[str, Any]) -> Optional[Callable[[], bool]]:
+    """
+    Check whether the client of a request has closed its connection. Only sync gunicorn workers expose
+    the client socket, there is no check for other servers.
+    """
+    client_socket = environ.get('gunicorn.socket')
+    if client_socket is None:
+        return None
+    return lambda: _is_disconnected(client_socket)
+
+
+def _is_disconnected(client_socket: socket.socket) -> bool:
+    # A closed connection is readable and reads as empty, the request body is already consumed
+    try:
+        readable, _, _ = select.select([client_socket], [], [], 0)
+        if not readable:
+            return False
+        return client_socket.recv(1, socket.MSG_PEEK) == b''
+    except (OSError, ValueError):
+        return True
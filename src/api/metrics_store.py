@@ -0,0 +1,107 @@
+import os
+import sqlite3
+from collections import defaultdict
+from contextlib import closing
+from typing import DefaultDict, Dict, List, Tuple
+
+from src.statistics.timings import Timings
+
+Series = Tuple[str, str]
+
+
+class MetricsStore:
+    """
+    Histograms of calculation timings kept in sqlite, so all gunicorn workers add to the same ones.
+    Buckets are stored cumulative as the Prometheus text format exposes them.
+    """
+    _BUCKETS: Tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, float('inf'))
+    _HISTOGRAMS: Dict[str, str] = {
+        'load_calculator_phase_seconds': 'Duration of calculation phases per request.',
+        'load_calculator_container_trial_seconds': 'Duration of trial loads into one container type.'
+    }
+
+    _path: str
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS buckets ('
+                'name TEXT NOT NULL, labels TEXT NOT NULL, le REAL NOT NULL, count INTEGER NOT NULL, '
+                'PRIMARY KEY (name, labels, le))')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS sums ('
+                'name TEXT NOT NULL, labels TEXT NOT NULL, sum REAL NOT NULL, count INTEGER NOT NULL, '
+                'PRIMARY KEY (name, labels))')
+
+    def record(self, timings: Timings) -> None:
+        observations = [
+            (('load_calculator_phase_seconds', self._format_labels(phase=phase)), seconds)
+            for phase, seconds in timings.phases.items()
+        ]
+        observations.extend(
+            (('load_calculator_container_trial_seconds', self._format_labels(container_type=container_type)), seconds)
+            for container_type, seconds in timings.container_trials
+        )
+
+        bucket_counts: DefaultDict[Tuple[Series, float], int] = defaultdict(int)
+        sums: DefaultDict[Series, List[float]] = defaultdict(lambda: [0, 0])
+        for series, seconds in observations:
+            for le in self._BUCKETS:
+                if seconds <= le:
+                    bucket_counts[(series, le)] += 1
+            sums[series][0] += seconds
+            sums[series][1] += 1
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                'INSERT INTO buckets (name, labels, le, count) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(name, labels, le) DO UPDATE SET count = count + excluded.count',
+                [(name, labels, le, count) for ((name, labels), le), count in bucket_counts.items()])
+            connection.executemany(
+                'INSERT INTO sums (name, labels, sum, count) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(name, labels) DO UPDATE SET sum = sum + excluded.sum, count = count + excluded.count',
+                [(name, labels, total, count) for (name, labels), (total, count) in sums.items()])
+
+    def render(self) -> str:
+        """Histograms in the Prometheus text exposition format."""
+        with closing(self._connect()) as connection:
+            bucket_rows = connection.execute('SELECT name, labels, le, count FROM buckets').fetchall()
+            sum_rows = connection.execute('SELECT name, labels, sum, count FROM sums ORDER BY name, labels').fetchall()
+        bucket_counts = {(name, labels, le): count for name, labels, le, count in bucket_rows}
+
+        lines = []
+        for name, description in self._HISTOGRAMS.items():
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} histogram')
+            for series_name, labels, total, count in sum_rows:
+                if series_name != name:
+                    continue
+                for le in self._BUCKETS:
+                    bucket_labels = f'{labels},le="{self._format_le(le)}"'
+                    lines.append(f'{name}_bucket{{{bucket_labels}}} {bucket_counts.get((name, labels, le), 0)}')
+                lines.append(f'{name}_sum{{{labels}}} {total}')
+                lines.append(f'{name}_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30)
+
+    @staticmethod
+    def _format_labels(**labels: str) -> str:
+        return ','.join(f'{key}="{MetricsStore._escape_label_value(value)}"' for key, value in labels.items())
+
+    @staticmethod
+    def _escape_label_value(value: str) -> str:
+        # Container types come from requests
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def _format_le(le: float) -> str:
+        return '+Inf' if le == float('inf') else str(le)
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Iterable, List
+
+from src.loading.point.point import Point
+
+
+class PointColumns:
+    """
+    Points of one cargo group as parallel integer arrays. Every row is the step from the previous point,
+    the first one is the step from (0, 0, 0). Consecutive equal rows are kept once with the number of their
+    repeats, so a row of boxes placed at equal steps takes a single row.
+    """
+    _x: List[int]
+    _y: List[int]
+    _z: List[int]
+    _runs: List[int]
+    _count: int
+    _last_point: Point
+
+    def __init__(self) -> None:
+        self._x = []
+        self._y = []
+        self._z = []
+        self._runs = []
+        self._count = 0
+        self._last_point = Point(0, 0, 0)
+
+    @staticmethod
+    def from_points(points: Iterable[Point]) -> 'PointColumns':
+        point_columns = PointColumns()
+        for point in points:
+            point_columns.add(point)
+        return point_columns
+
+    def add(self, point: Point) -> None:
+        x = point.x - self._last_point.x
+        y = point.y - self._last_point.y
+        z = point.z - self._last_point.z
+        if self._runs and self._x[-1] == x and self._y[-1] == y and self._z[-1] == z:
+            self._runs[-1] += 1
+        else:
+            self._x.append(x)
+            self._y.append(y)
+            self._z.append(z)
+            self._runs.append(1)
+        self._count += 1
+        self._last_point = point
+
+    def build_response(self, shipment_params_id: int) -> Dict[str, Any]:
+        return {
+            'cargo_id': shipment_params_id,
+            'count': self._count,
+            'x': self._x,
+            'y': self._y,
+            'z': self._z,
+            'runs': self._runs
+        }
+
+    @staticmethod
+    def decode(response: Dict[str, Any]) -> List[Point]:
+        points = []
+        x, y, z = 0, 0, 0
+        for step_x, step_y, step_z, run in zip(response['x'], response['y'], response['z'], response['runs']):
+            for _ in range(run):
+                x, y, z = x + step_x, y + step_y, z + step_z
+                points.append(Point(x, y, z))
+        return points
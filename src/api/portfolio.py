@@ -0,0 +1,139 @@
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.synchronize import Event
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.api.portfolio_plan import PortfolioPlan
+from src.api.request_data import RequestData
+from src.api.response_builder import ResponseBuilder
+from src.api.response_format import ResponseFormat
+from src.loading.loader.deadline import Deadline
+from src.loading.loader.loader_factory import LoaderFactory
+from src.loading.loading_type import LoadingType
+from src.loading.shipment_ordering import ShipmentOrdering
+
+# Set in every configuration process by its initializer, configurations stop loading once it is set
+_cancelled: Optional[Event] = None
+
+
+class Portfolio:
+    """
+    Solves one request with every loading type and shipment ordering in a pool of processes and responds
+    with the best plan. All configurations share the time budget of the request: it is counted
+    from the start of the portfolio, so configurations waiting for a process get less of it.
+    Once the request is cancelled, e.g. the client disconnects, every configuration stops and responds
+    with what it has loaded. A failing configuration is reported with its error and the best plan is selected
+    among the others.
+    """
+    CONFIGURATIONS: List[Tuple[str, str]] = [
+        (loading_type.name.lower(), shipment_ordering.name.lower())
+        for loading_type in LoadingType
+        for shipment_ordering in ShipmentOrdering
+    ]
+    _CANCELLATION_CHECK_INTERVAL: float = 0.5
+
+    _processes: int
+    _init_process: Optional[Callable[[], None]]
+
+    def __init__(self, processes: int, init_process: Optional[Callable[[], None]] = None) -> None:
+        self._processes = processes
+        self._init_process = init_process
+
+    def solve(self, request_data: RequestData, is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        deadline = Deadline(request_data.time_budget)
+
+        mp_context = multiprocessing.get_context('spawn')
+        cancelled = mp_context.Event()
+        processes = min(self._processes, len(self.CONFIGURATIONS))
+        with ProcessPoolExecutor(
+                processes, mp_context, self._init_configuration_process, (self._init_process, cancelled)) as executor:
+            futures = [
+                executor.submit(
+                    self._solve_configuration, request_data, loading_type_name, shipment_ordering_name, deadline)
+                for loading_type_name, shipment_ordering_name in self.CONFIGURATIONS
+            ]
+            self._wait(futures, is_cancelled, cancelled)
+
+        plans = []
+        errors = []
+        for (loading_type_name, shipment_ordering_name), future in zip(self.CONFIGURATIONS, futures):
+            try:
+                plans.append(future.result())
+            except Exception as e:
+                logger.exception(
+                    f'Portfolio configuration of {loading_type_name} loading '
+                    f'with {shipment_ordering_name} shipment ordering failed')
+                errors.append(e)
+                plans.append(PortfolioPlan.create_failed(
+                    loading_type_name, shipment_ordering_name, f'{type(e).__name__}: {e}'))
+
+        best_plan = PortfolioPlan.select_best(plans)
+        if best_plan is None:
+            raise errors[0]
+        logger.info(f'Portfolio selected {best_plan.loading_type_name} loading '
+                    f'with {best_plan.shipment_ordering_name} shipment ordering')
+        response = dict(best_plan.response)
+        if best_plan.truncated:
+            response['truncated'] = True
+        response['portfolio'] = {
+            'loading_type': best_plan.loading_type_name,
+            'shipment_ordering': best_plan.shipment_ordering_name,
+            'plans': [plan.build_response() for plan in plans]
+        }
+        return response
+
+    def _wait(
+            self,
+            futures: List[Future],
+            is_cancelled: Optional[Callable[[], bool]],
+            cancelled: Event
+    ) -> None:
+        pending = futures
+        while pending:
+            _, pending = wait(pending, self._CANCELLATION_CHECK_INTERVAL if is_cancelled is not None else None)
+            if pending and is_cancelled is not None and is_cancelled():
+                logger.info('Portfolio is cancelled')
+                cancelled.set()
+                is_cancelled = None
+
+    @staticmethod
+    def _init_configuration_process(init_process: Optional[Callable[[], None]], cancelled: Event) -> None:
+        global _cancelled
+        _cancelled = cancelled
+        if init_process is not None:
+            init_process()
+
+    @staticmethod
+    def _solve_configuration(
+            request_data: RequestData,
+            loading_type_name: str,
+            shipment_ordering_name: str,
+            deadline: Deadline
+    ) -> PortfolioPlan:
+        start = time.perf_counter()
+        loader_factory = LoaderFactory()
+        loader = loader_factory.create(
+            request_data.shipment_params,
+            request_data.container_params,
+            loading_type_name,
+            with_blocks=request_data.block_loading,
+            time_budget=deadline.get_time_left(),
+            is_cancelled=_cancelled.is_set if _cancelled is not None else None,
+            shipment_ordering_name=shipment_ordering_name
+        )
+        loader.load()
+
+        response_builder = ResponseBuilder(ResponseFormat.from_name(request_data.response_format_name or 'json'))
+        response = response_builder.build(loader.containers, loader.shipment_params)
+        return PortfolioPlan(
+            loading_type_name,
+            shipment_ordering_name,
+            response,
+            loader.truncated,
+            sum(loader.shipment_params.values()),
+            len(loader.containers),
+            sum(container.parameters.compute_volume() for container in loader.containers),
+            time.perf_counter() - start)
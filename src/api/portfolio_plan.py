@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class PortfolioPlan:
+    """
+    Response of one portfolio configuration with what plans are compared by: a complete plan beats a plan
+    cut by the time budget, then the plan leaving fewer shipments wins, then the one taking fewer containers,
+    then the one taking less container volume. The earlier configuration wins a tie.
+    Configurations which failed have a plan with their error, it is reported but never selected.
+    """
+    loading_type_name: str
+    shipment_ordering_name: str
+    response: Dict[str, Any] = field(repr=False)
+    truncated: bool
+    left_count: int
+    container_count: int
+    container_volume: int
+    seconds: float
+    error: Optional[str] = None
+
+    @staticmethod
+    def create_failed(loading_type_name: str, shipment_ordering_name: str, error: str) -> 'PortfolioPlan':
+        return PortfolioPlan(loading_type_name, shipment_ordering_name, {}, False, 0, 0, 0, 0.0, error)
+
+    def _rank_key(self) -> Tuple[bool, int, int, int]:
+        return self.truncated, self.left_count, self.container_count, self.container_volume
+
+    def build_response(self) -> Dict[str, Any]:
+        if self.error is not None:
+            return {
+                'loading_type': self.loading_type_name,
+                'shipment_ordering': self.shipment_ordering_name,
+                'error': self.error
+            }
+        return {
+            'loading_type': self.loading_type_name,
+            'shipment_ordering': self.shipment_ordering_name,
+            'truncated': self.truncated,
+            'left_count': self.left_count,
+            'container_count': self.container_count,
+            'container_volume': self.container_volume,
+            'seconds': self.seconds
+        }
+
+    @staticmethod
+    def select_best(plans: List['PortfolioPlan']) -> Optional['PortfolioPlan']:
+        best_plan = None
+        for plan in plans:
+            if plan.error is not None:
+                continue
+            if best_plan is None or plan._rank_key() < best_plan._rank_key():
+                best_plan = plan
+        return best_plan
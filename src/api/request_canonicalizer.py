@@ -0,0 +1,105 @@
+import hashlib
+import json
+from typing import Any, List
+
+from src.api.request_data import RequestData
+from src.api.response_format import ResponseFormat
+from src.loading.loading_type import LoadingType
+from src.loading.shipment_ordering import ShipmentOrdering
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class RequestCanonicalizer:
+    _DEFAULT_LOADING_TYPE_NAME: str = 'compact'
+    _DEFAULT_SHIPMENT_ORDERING_NAME: str = 'default'
+    _DEFAULT_RESPONSE_FORMAT_NAME: str = 'json'
+
+    def canonicalize(self, request_data: RequestData) -> RequestData:
+        """
+        Equivalent requests are brought to the same form: cargos and containers are sorted and the loading type,
+        shipment ordering and response format names are normalized, so they are loaded the same way
+        and share one hash.
+        """
+        shipment_params = dict(sorted(
+            request_data.shipment_params.items(),
+            key=lambda item: (item[0]._key(), self._describe_shipment_params(item[0]))))
+
+        container_params = request_data.container_params
+        if container_params is not None:
+            container_params = dict(sorted(container_params.items(), key=lambda item: item[0]._key()))
+
+        loading_type_name = request_data.loading_type_name or self._DEFAULT_LOADING_TYPE_NAME
+        loading_type_name = LoadingType.from_name(loading_type_name).name.lower()
+
+        shipment_ordering_name = request_data.shipment_ordering_name or self._DEFAULT_SHIPMENT_ORDERING_NAME
+        shipment_ordering_name = ShipmentOrdering.from_name(shipment_ordering_name).name.lower()
+
+        response_format_name = request_data.response_format_name or self._DEFAULT_RESPONSE_FORMAT_NAME
+        response_format_name = ResponseFormat.from_name(response_format_name).name.lower()
+
+        return RequestData(
+            shipment_params,
+            container_params,
+            loading_type_name,
+            request_data.block_loading,
+            request_data.with_timings,
+            request_data.with_trace,
+            request_data.time_budget,
+            shipment_ordering_name,
+            request_data.portfolio,
+            response_format_name)
+
+    def compute_hash(self, request_data: RequestData) -> str:
+        # Timings and traces are attached to responses after caching, so they do not change the hash.
+        # Neither does the time budget, since responses cut by it are not cached
+        description = {
+            'cargo': [
+                self._describe_shipment_params(shipment_params) + [count]
+                for shipment_params, count in request_data.shipment_params.items()
+            ],
+            'containers': None,
+            'loading_type': request_data.loading_type_name,
+            'block_loading': request_data.block_loading
+        }
+        if request_data.container_params is not None:
+            description['containers'] = [
+                self._describe_container_params(container_params) + [count]
+                for container_params, count in request_data.container_params.items()
+            ]
+        # Requests made before shipment orderings, portfolios and response formats keep their hashes
+        if request_data.shipment_ordering_name != self._DEFAULT_SHIPMENT_ORDERING_NAME:
+            description['shipment_ordering'] = request_data.shipment_ordering_name
+        if request_data.portfolio:
+            description['portfolio'] = True
+        if request_data.response_format_name != self._DEFAULT_RESPONSE_FORMAT_NAME:
+            description['response_format'] = request_data.response_format_name
+        serialized = json.dumps(description, separators=(',', ':'))
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _describe_shipment_params(shipment_params: ShipmentParameters) -> List[Any]:
+        return [
+            shipment_params.name,
+            shipment_params.form_type,
+            shipment_params.length,
+            shipment_params.width,
+            shipment_params.height,
+            shipment_params.weight,
+            shipment_params.color,
+            shipment_params.can_stack,
+            shipment_params.height_as_height,
+            shipment_params.length_as_height,
+            shipment_params.width_as_height,
+            shipment_params.extension
+        ]
+
+    @staticmethod
+    def _describe_container_params(container_params: ContainerParameters) -> List[Any]:
+        return [
+            container_params.name,
+            container_params.length,
+            container_params.width,
+            container_params.height,
+            container_params.lifting_capacity
+        ]
@@ -10,3 +10,10 @@ class RequestData:
     shipment_params: Dict[ShipmentParameters, int]
     container_params: Optional[Dict[ContainerParameters, int]]
     loading_type_name: Optional[str]
+    block_loading: bool
+    with_timings: bool = False
+    with_trace: bool = False
+    time_budget: Optional[float] = None
+    shipment_ordering_name: Optional[str] = None
+    portfolio: bool = False
+    response_format_name: Optional[str] = None
@@ -1,8 +1,12 @@
-from typing import Dict, Optional
+from enum import Enum
+from typing import Any, Dict, Optional, Type
 
 from flask import Request
 
 from src.api.request_data import RequestData
+from src.api.response_format import ResponseFormat
+from src.loading.loading_type import LoadingType
+from src.loading.shipment_ordering import ShipmentOrdering
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
 from src.parameters.util_parameters.volume_parameters import VolumeParameters
@@ -13,32 +17,92 @@ class RequestParser:
         pass
 
     def parse(self, request: Request) -> RequestData:
-        shipment_params_to_count = self._parse_shipment_params_to_count(request)
-        container_params_to_count = self._parse_container_params_to_count(request)
-        loading_type_name = self._parse_loading_type_name(request)
-        return RequestData(shipment_params_to_count, container_params_to_count, loading_type_name)
+        return self.parse_json(request.json)
 
-    def _parse_shipment_params_to_count(self, request: Request) -> Dict[ShipmentParameters, int]:
+    @staticmethod
+    def check_time_budget(time_budget: Any) -> None:
+        if isinstance(time_budget, bool) or not isinstance(time_budget, (int, float)) or not time_budget >= 0:
+            raise ValueError(f'time_budget should be a non-negative number of seconds, not {time_budget!r}')
+
+    def parse_json(self, request_json: Dict[str, Any]) -> RequestData:
+        shipment_params_to_count = self._parse_shipment_params_to_count(request_json)
+        container_params_to_count = self._parse_container_params_to_count(request_json)
+        loading_type_name = self._parse_loading_type_name(request_json)
+        block_loading = self._parse_block_loading(request_json)
+        with_timings = self._parse_with_timings(request_json)
+        with_trace = self._parse_with_trace(request_json)
+        time_budget = self._parse_time_budget(request_json)
+        shipment_ordering_name = self._parse_shipment_ordering_name(request_json)
+        portfolio = self._parse_portfolio(request_json)
+        response_format_name = self._parse_response_format_name(request_json)
+        return RequestData(
+            shipment_params_to_count,
+            container_params_to_count,
+            loading_type_name,
+            block_loading,
+            with_timings,
+            with_trace,
+            time_budget,
+            shipment_ordering_name,
+            portfolio,
+            response_format_name)
+
+    def _parse_shipment_params_to_count(self, request_json: Dict[str, Any]) -> Dict[ShipmentParameters, int]:
         shipment_counts = {}
-        for cargo in request.json['cargo']:
+        for cargo in request_json['cargo']:
             shipment_params = self._create_shipment_params(cargo)
             shipment_counts[shipment_params] = cargo['number']
         return shipment_counts
 
-    def _parse_container_params_to_count(self, request: Request) -> Optional[Dict[ContainerParameters, int]]:
-        if 'containers' not in request.json:
+    def _parse_container_params_to_count(
+            self,
+            request_json: Dict[str, Any]
+    ) -> Optional[Dict[ContainerParameters, int]]:
+        if 'containers' not in request_json:
             return None
         container_counts = {}
-        for container in request.json['containers']:
+        for container in request_json['containers']:
             container_params = self._create_container_params(container)
             container_counts[container_params] = container['number']
         return container_counts
 
+    def _parse_loading_type_name(self, request_json: Dict[str, Any]) -> Optional[str]:
+        return self._parse_name(request_json, 'loading_type', LoadingType)
+
+    @staticmethod
+    def _parse_block_loading(request_json: Dict[str, Any]) -> bool:
+        return request_json.get('block_loading', False)
+
+    @staticmethod
+    def _parse_with_timings(request_json: Dict[str, Any]) -> bool:
+        return request_json.get('timings', False)
+
+    @staticmethod
+    def _parse_with_trace(request_json: Dict[str, Any]) -> bool:
+        return request_json.get('trace', False)
+
+    def _parse_time_budget(self, request_json: Dict[str, Any]) -> Optional[float]:
+        time_budget = request_json.get('time_budget', None)
+        if time_budget is not None:
+            self.check_time_budget(time_budget)
+        return time_budget
+
+    def _parse_shipment_ordering_name(self, request_json: Dict[str, Any]) -> Optional[str]:
+        return self._parse_name(request_json, 'shipment_ordering', ShipmentOrdering)
+
+    @staticmethod
+    def _parse_portfolio(request_json: Dict[str, Any]) -> bool:
+        return request_json.get('portfolio', False)
+
+    def _parse_response_format_name(self, request_json: Dict[str, Any]) -> Optional[str]:
+        return self._parse_name(request_json, 'response_format', ResponseFormat)
+
     @staticmethod
-    def _parse_loading_type_name(request: Request) -> Optional[str]:
-        if 'loading_type' in request.json:
-            return request.json['loading_type']
-        return None
+    def _parse_name(request_json: Dict[str, Any], key: str, enum_type: Type[Enum]) -> Optional[str]:
+        name = request_json.get(key, None)
+        if name is not None and (not isinstance(name, str) or name.upper() not in enum_type.__members__):
+            raise ValueError(f'Unknown {key} {name!r}')
+        return name
 
     @staticmethod
     def _create_shipment_params(cargo_request: Dict) -> ShipmentParameters:
@@ -2,24 +2,42 @@ from typing import Dict, List, Any
 
 from flask import Response
 
+from src.api.point_columns import PointColumns
+from src.api.response_format import ResponseFormat
 from src.items.container import Container
 from src.parameters.shipment_parameters import ShipmentParameters
 
 
 class ResponseBuilder:
+    """
+    Load points of containers are lists of points of every cargo group, or point columns of every cargo group
+    in the columnar format, which is much smaller for containers of thousands of boxes.
+    """
+    _response_format: ResponseFormat
+
+    def __init__(self, response_format: ResponseFormat = ResponseFormat.JSON) -> None:
+        self._response_format = response_format
+
     def build(self, containers: List[Container], left_shipment_counts: Dict[ShipmentParameters, int]) -> Response:
         response = {'containers': [], 'left_cargos': []}
+        if self._response_format == ResponseFormat.COLUMNAR:
+            response['format'] = 'columnar'
         for container in containers:
-            response['containers'].append(self._build_container_response(container))
-
-        for shipment_params, left_count in left_shipment_counts.items():
-            response['left_cargos'].append(self._build_left_cargo_response(shipment_params, left_count))
+            response['containers'].append(self.build_container_response(container))
 
+        response['left_cargos'] = self.build_left_cargos_response(left_shipment_counts)
         return response
 
-    def _build_container_response(self, container: Container) -> Dict[str, Any]:
+    def build_left_cargos_response(self, left_shipment_counts: Dict[ShipmentParameters, int]) -> List[Dict[str, Any]]:
+        return [
+            self._build_left_cargo_response(shipment_params, left_count)
+            for shipment_params, left_count in left_shipment_counts.items()
+        ]
+
+    def build_container_response(self, container: Container) -> Dict[str, Any]:
         id_to_shipment_params = {}
         points = []
+        columnar = self._response_format == ResponseFormat.COLUMNAR
         if container.loading_order:
             last_shipment_params = None
             last_shipment_params_id = 0
@@ -30,9 +48,15 @@ class ResponseBuilder:
                 if shipment.parameters != last_shipment_params:
                     last_shipment_params = shipment.parameters
                     last_shipment_params_id += 1
-                    id_to_shipment_params[last_shipment_params_id] = last_shipment_params.build_response()
-                    points.append([])
-                points[-1].append(point.build_response(last_shipment_params_id))
+                    # Keys are strings as in json, so MessagePack encodes fresh and cached responses alike
+                    id_to_shipment_params[str(last_shipment_params_id)] = last_shipment_params.build_response()
+                    points.append(PointColumns() if columnar else [])
+                if columnar:
+                    points[-1].add(point)
+                else:
+                    points[-1].append(point.build_response(last_shipment_params_id))
+        if columnar:
+            points = [point_columns.build_response(i) for i, point_columns in enumerate(points, 1)]
 
         container_response = container.build_response()
         container_response['cargos'] = id_to_shipment_params
@@ -0,0 +1,55 @@
+import gzip
+import json
+from typing import Any, Dict, List, Tuple
+
+from src.gltf_exporter import GltfExporter
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ResponseEncoder:
+    """
+    Encodes responses as json or as MessagePack when msgpack is installed, MessagePack keeps the structure
+    of json with cargo ids of containers as string keys. Responses with containers can also be encoded
+    as binary glTF scenes for clients rendering the plan. Bodies from the minimal size on are compressed
+    with gzip if the client accepts it.
+    """
+    JSON_MIMETYPE: str = 'application/json'
+    MSGPACK_MIMETYPE: str = 'application/msgpack'
+    GLTF_MIMETYPE: str = GltfExporter.MIMETYPE
+    _MIN_GZIP_SIZE: int = 1024
+    _GZIP_LEVEL: int = 6
+
+    @staticmethod
+    def is_msgpack_available() -> bool:
+        return msgpack is not None
+
+    @property
+    def mimetypes(self) -> List[str]:
+        """Mimetypes the encoder can produce, json first as the default one."""
+        if self.is_msgpack_available():
+            return [self.JSON_MIMETYPE, self.MSGPACK_MIMETYPE]
+        return [self.JSON_MIMETYPE]
+
+    @property
+    def scene_mimetypes(self) -> List[str]:
+        """Mimetypes for responses with containers, which can be encoded as scenes too."""
+        return self.mimetypes + [self.GLTF_MIMETYPE]
+
+    def encode(self, response: Dict[str, Any], mimetype: str, with_gzip: bool) -> Tuple[bytes, Dict[str, str]]:
+        """Body and headers of the response, the body is json unless another available mimetype is asked for."""
+        if mimetype == self.MSGPACK_MIMETYPE and self.is_msgpack_available():
+            body = msgpack.packb(response)
+        elif mimetype == self.GLTF_MIMETYPE:
+            body = GltfExporter().export_response(response)
+        else:
+            body = json.dumps(response, separators=(',', ':')).encode('utf-8')
+
+        headers = {'Vary': 'Accept, Accept-Encoding'}
+        if with_gzip and len(body) >= self._MIN_GZIP_SIZE:
+            body = gzip.compress(body, self._GZIP_LEVEL)
+            headers['Content-Encoding'] = 'gzip'
+        return body, headers
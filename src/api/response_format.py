@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ResponseFormat(Enum):
+    JSON = 1
+    COLUMNAR = 2
+
+    @staticmethod
+    def from_name(name: str) -> 'ResponseFormat':
+        return ResponseFormat[name.upper()]
@@ -0,0 +1,80 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, Any, Optional
+
+
+class ResultCache:
+    """
+    LRU cache of calculation responses keyed by request hash. It is kept in sqlite,
+    so all gunicorn workers share the results and the hit/miss counters.
+    """
+    _HITS: str = 'hits'
+    _MISSES: str = 'misses'
+
+    _path: str
+    _max_size: int
+    _max_age: float
+
+    def __init__(self, path: str, max_size: int = 1000, max_age: float = 24 * 60 * 60) -> None:
+        self._path = path
+        self._max_size = max_size
+        self._max_age = max_age
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)')
+            connection.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                'SELECT response FROM results WHERE key = ? AND created_at >= ?',
+                (key, now - self._max_age)).fetchone()
+            if row is None:
+                self._increment(connection, self._MISSES)
+                return None
+            connection.execute('UPDATE results SET accessed_at = ? WHERE key = ?', (now, key))
+            self._increment(connection, self._HITS)
+        return json.loads(row[0])
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO results (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(response), now, now))
+            connection.execute('DELETE FROM results WHERE created_at < ?', (now - self._max_age,))
+            connection.execute(
+                'DELETE FROM results WHERE key IN '
+                '(SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self._max_size,))
+
+    def get_stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as connection:
+            counters = dict(connection.execute('SELECT name, value FROM counters').fetchall())
+            size = connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        return {
+            'hits': counters.get(self._HITS, 0),
+            'misses': counters.get(self._MISSES, 0),
+            'size': size,
+            'max_size': self._max_size
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30)
+
+    @staticmethod
+    def _increment(connection: sqlite3.Connection, name: str) -> None:
+        connection.execute(
+            'INSERT INTO counters (name, value) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1',
+            (name,))
@@ -0,0 +1,103 @@
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+class BoxFaces:
+    """
+    Faces of all boxes of a container as polygons computed at once. A face is hidden by a box which touches it
+    and covers all of it, e.g. the faces between boxes of a row, so a face is only drawn while the box hiding it
+    is not loaded yet. Boxes are given in the loading order.
+    """
+    # Faces in the order of Image3dCreator.POLYGONS
+    UNIT_POLYGONS: np.ndarray = np.array([
+        [[0, 1, 0], [0, 0, 0], [1, 0, 0], [1, 1, 0]],
+        [[0, 0, 0], [0, 0, 1], [1, 0, 1], [1, 0, 0]],
+        [[1, 0, 1], [1, 0, 0], [1, 1, 0], [1, 1, 1]],
+        [[0, 0, 1], [0, 0, 0], [0, 1, 0], [0, 1, 1]],
+        [[0, 1, 0], [0, 1, 1], [1, 1, 1], [1, 1, 0]],
+        [[0, 1, 1], [0, 0, 1], [1, 0, 1], [1, 1, 1]],
+    ], dtype=float)
+    # Faces on the minimal and on the maximal side of the x, y and z axes
+    MIN_FACES: Tuple[int, int, int] = (3, 1, 0)
+    MAX_FACES: Tuple[int, int, int] = (2, 4, 5)
+    NEVER_HIDDEN: int = np.iinfo(np.int64).max
+    # Boxes are compared in parts of at most this number of pairs to bound the memory taken
+    _MAX_PAIRS: int = 1 << 20
+
+    _polygons: np.ndarray
+    _hidden_from: np.ndarray
+
+    def __init__(self, min_points: np.ndarray, sizes: np.ndarray) -> None:
+        min_points = np.asarray(min_points, dtype=np.int64).reshape(-1, 3)
+        sizes = np.asarray(sizes, dtype=np.int64).reshape(-1, 3)
+        self._polygons = self.UNIT_POLYGONS[np.newaxis] * sizes[:, np.newaxis, np.newaxis] \
+            + min_points[:, np.newaxis, np.newaxis]
+        self._hidden_from = self._compute_hidden_from(min_points, min_points + sizes)
+
+    @property
+    def polygons(self) -> np.ndarray:
+        """Polygons of shape (boxes, 6 faces, 4 vertices, 3 coordinates)."""
+        return self._polygons
+
+    @property
+    def hidden_from(self) -> np.ndarray:
+        """Index of the first box hiding every face, NEVER_HIDDEN for faces no box hides."""
+        return self._hidden_from
+
+    def select_visible(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Polygons of faces visible when the first count boxes are loaded and the indexes of their boxes."""
+        visible = self._hidden_from[:count] >= count
+        box_indexes = np.nonzero(visible)[0]
+        return self._polygons[:count][visible], box_indexes
+
+    def _compute_hidden_from(self, min_points: np.ndarray, max_points: np.ndarray) -> np.ndarray:
+        hidden_from = np.full((len(min_points), len(self.UNIT_POLYGONS)), self.NEVER_HIDDEN, dtype=np.int64)
+        if not len(min_points):
+            return hidden_from
+
+        scale = 2 * (int(max_points.max()) + 1)
+        for axis in range(3):
+            side_axis = (axis + 1) % 3
+            other_axes = [other_axis for other_axis in range(3) if other_axis != axis]
+            max_side_size = int((max_points[:, side_axis] - min_points[:, side_axis]).max())
+
+            # Boxes touching the maximal side of a box start where it ends. They are sorted by that plane and then
+            # along a side axis, so a box is compared only with the boxes overlapping it along the side axis
+            keys = min_points[:, axis] * scale + min_points[:, side_axis]
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            planes = max_points[:, axis] * scale
+            starts = np.searchsorted(sorted_keys, planes + min_points[:, side_axis] - max_side_size, 'left')
+            ends = np.searchsorted(sorted_keys, planes + max_points[:, side_axis], 'left')
+
+            for first, second in self._iterate_pairs(order, starts, np.maximum(ends - starts, 0)):
+                first_mins = min_points[first][:, other_axes]
+                first_maxs = max_points[first][:, other_axes]
+                second_mins = min_points[second][:, other_axes]
+                second_maxs = max_points[second][:, other_axes]
+
+                covering = np.all((second_mins <= first_mins) & (second_maxs >= first_maxs), axis=1)
+                np.minimum.at(hidden_from[:, self.MAX_FACES[axis]], first[covering], second[covering])
+                covered = np.all((first_mins <= second_mins) & (first_maxs >= second_maxs), axis=1)
+                np.minimum.at(hidden_from[:, self.MIN_FACES[axis]], second[covered], first[covered])
+        return hidden_from
+
+    def _iterate_pairs(
+            self,
+            order: np.ndarray,
+            starts: np.ndarray,
+            counts: np.ndarray
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Pairs of every box with the boxes order[start:start + count], in parts of limited size."""
+        cumulative_counts = np.cumsum(counts)
+        part_start = 0
+        while part_start < len(counts):
+            limit = (cumulative_counts[part_start - 1] if part_start > 0 else 0) + self._MAX_PAIRS
+            part_end = max(part_start + 1, int(np.searchsorted(cumulative_counts, limit, 'right')))
+            part_counts = counts[part_start:part_end]
+            offsets = np.arange(part_counts.sum()) - np.repeat(np.cumsum(part_counts) - part_counts, part_counts)
+            first = np.repeat(np.arange(part_start, part_end), part_counts)
+            second = order[np.repeat(starts[part_start:part_end], part_counts) + offsets]
+            yield first, second
+            part_start = part_end
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Sequence, Tuple
+
+from src.api.point_columns import PointColumns
+from src.items.container import Container
+
+Size = Tuple[int, int, int]
+CargoKey = Tuple[str, str, Size]
+Boxes = DefaultDict[CargoKey, List[Tuple[int, int, int]]]
+
+
+class GltfExporter:
+    """
+    Exports loaded containers as binary glTF with one scene per container for rendering on clients.
+    Boxes of one cargo type are instances of one box mesh placed by translations in the binary buffer
+    (EXT_mesh_gpu_instancing), so the file grows with cargo types and by 12 bytes per box.
+    Coordinates stay in millimetres with the height along z, the root node of every scene turns them into
+    metres with the height along y as glTF expects. Hex colors of cargos are kept, other colors are replaced
+    by a color derived from their name.
+    """
+    MIMETYPE: str = 'model/gltf-binary'
+    _INSTANCING: str = 'EXT_mesh_gpu_instancing'
+    # Rotation by -90 degrees around x and millimetres to metres
+    _ROOT_ROTATION: List[float] = [-0.7071067811865476, 0.0, 0.0, 0.7071067811865476]
+    _ROOT_SCALE: List[float] = [0.001, 0.001, 0.001]
+    _CONTAINER_COLOR: List[float] = [0.2, 0.2, 0.2, 1.0]
+
+    def export_containers(self, containers: List[Container]) -> bytes:
+        scenes = []
+        for container in containers:
+            boxes = defaultdict(list)
+            for shipment_id in container.loading_order or container.id_to_shipment.keys():
+                shipment_params = container.id_to_shipment[shipment_id].parameters
+                point = container.id_to_min_point_shifted[shipment_id]
+                size = (shipment_params.length, shipment_params.width, shipment_params.height)
+                boxes[(shipment_params.name, shipment_params.color, size)].append((point.x, point.y, point.z))
+            container_size = (container.length, container.width, container.height)
+            scenes.append((f'container_{container.id}', container_size, boxes))
+        return self._build_glb(scenes)
+
+    def export_response(self, response: Dict[str, Any]) -> bytes:
+        """Exports containers of a response in the json or the columnar format, e.g. a cached one."""
+        scenes = []
+        for i, container_response in enumerate(response['containers'], 1):
+            # Cargo ids are strings once the response has been through json
+            cargos = {int(cargo_id): cargo for cargo_id, cargo in container_response['cargos'].items()}
+            boxes = defaultdict(list)
+            for load_points in container_response['load_points']:
+                if isinstance(load_points, dict):
+                    cargo_id = load_points['cargo_id']
+                    points = [tuple(point) for point in PointColumns.decode(load_points)]
+                else:
+                    cargo_id = load_points[0]['cargo_id']
+                    points = [(point['x'], point['y'], point['z']) for point in load_points]
+                cargo = cargos[int(cargo_id)]
+                boxes[(cargo['name'], cargo['color'], (cargo['length'], cargo['width'], cargo['height']))] += points
+            size = (container_response['length'], container_response['width'], container_response['height'])
+            scenes.append((f'{container_response["type"]}_{i}', size, boxes))
+        return self._build_glb(scenes)
+
+    def _build_glb(self, scenes: List[Tuple[str, Size, Boxes]]) -> bytes:
+        builder = _GltfBuilder()
+        for name, container_size, boxes in scenes:
+            children = [builder.add_container_outline(container_size, self._CONTAINER_COLOR)]
+            for (cargo_name, color, size), points in boxes.items():
+                mesh = builder.add_box_mesh(size, color, self._parse_color(color))
+                translations = builder.add_accessor([coordinate for point in points for coordinate in point], 'VEC3')
+                children.append(builder.add_node({
+                    'name': cargo_name,
+                    'mesh': mesh,
+                    'extensions': {self._INSTANCING: {'attributes': {'TRANSLATION': translations}}}
+                }))
+            root = builder.add_node({
+                'name': name, 'rotation': self._ROOT_ROTATION, 'scale': self._ROOT_SCALE, 'children': children})
+            builder.add_scene(name, root)
+        return builder.build_glb([self._INSTANCING])
+
+    @staticmethod
+    def _parse_color(color: str) -> List[float]:
+        """Linear rgba of a hex color, or of a color derived from the name of another color."""
+        hex_color = color[1:] if color.startswith('#') else ''
+        if len(hex_color) == 3:
+            hex_color = ''.join(digit * 2 for digit in hex_color)
+        try:
+            srgb = list(bytes.fromhex(hex_color)) if len(hex_color) == 6 else None
+        except ValueError:
+            srgb = None
+        if srgb is None:
+            srgb = list(hashlib.md5(color.encode('utf-8')).digest()[:3])
+        linear = [c / 255 / 12.92 if c / 255 <= 0.04045 else ((c / 255 + 0.055) / 1.055) ** 2.4 for c in srgb]
+        return linear + [1.0]
+
+
+class _GltfBuilder:
+    """glTF json and its binary buffer built together, meshes of equal sizes and colors are shared."""
+    _ARRAY_BUFFER: int = 34962
+    _ELEMENT_ARRAY_BUFFER: int = 34963
+    _FLOAT: int = 5126
+    _UNSIGNED_SHORT: int = 5123
+    _LINES: int = 1
+    _TRIANGLES: int = 4
+
+    _gltf: Dict[str, Any]
+    _binary: bytearray
+    _materials: Dict[str, int]
+    _box_meshes: Dict[Tuple[Size, str], int]
+    _box_normals: int
+    _box_indices: int
+
+    def __init__(self) -> None:
+        self._gltf = {
+            'asset': {'version': '2.0', 'generator': 'LoadCalculator'},
+            'scene': 0,
+            'scenes': [],
+            'nodes': [],
+            'meshes': [],
+            'materials': [],
+            'accessors': [],
+            'bufferViews': [],
+            'buffers': []
+        }
+        self._binary = bytearray()
+        self._materials = {}
+        self._box_meshes = {}
+        self._box_normals = -1
+        self._box_indices = -1
+
+    def add_scene(self, name: str, root: int) -> None:
+        self._gltf['scenes'].append({'name': name, 'nodes': [root]})
+
+    def add_node(self, node: Dict[str, Any]) -> int:
+        self._gltf['nodes'].append(node)
+        return len(self._gltf['nodes']) - 1
+
+    def add_box_mesh(self, size: Size, color: str, rgba: List[float]) -> int:
+        mesh = self._box_meshes.get((size, color))
+        if mesh is not None:
+            return mesh
+
+        positions = []
+        normals = []
+        indices = []
+        for axis in range(3):
+            for side in (0, 1):
+                # Corners go counterclockwise seen from outside the box
+                corners = [(0, 0), (1, 0), (1, 1), (0, 1)] if side else [(0, 0), (0, 1), (1, 1), (1, 0)]
+                first = len(positions) // 3
+                for u, v in corners:
+                    corner = [0, 0, 0]
+                    corner[axis] = side
+                    corner[(axis + 1) % 3] = u
+                    corner[(axis + 2) % 3] = v
+                    positions += [corner[i] * size[i] for i in range(3)]
+                    normals += [(2 * side - 1) if i == axis else 0 for i in range(3)]
+                indices += [first, first + 1, first + 2, first, first + 2, first + 3]
+
+        if self._box_normals < 0:
+            self._box_normals = self.add_accessor(normals, 'VEC3', self._ARRAY_BUFFER)
+            self._box_indices = self.add_accessor(indices, 'SCALAR', self._ELEMENT_ARRAY_BUFFER, self._UNSIGNED_SHORT)
+        primitive = {
+            'attributes': {
+                'POSITION': self.add_accessor(positions, 'VEC3', self._ARRAY_BUFFER, with_bounds=True),
+                'NORMAL': self._box_normals
+            },
+            'indices': self._box_indices,
+            'material': self._add_material(color, rgba),
+            'mode': self._TRIANGLES
+        }
+        mesh = self._box_meshes[(size, color)] = self._add_mesh(color, primitive)
+        return mesh
+
+    def add_container_outline(self, size: Size, rgba: List[float]) -> int:
+        positions = [
+            coordinate
+            for x in (0, size[0]) for y in (0, size[1]) for z in (0, size[2])
+            for coordinate in (x, y, z)
+        ]
+        # Corners are numbered by bits of x, y and z, edges join corners differing in one bit
+        indices = [i for a in range(8) for bit in (4, 2, 1) if not a & bit for i in (a, a | bit)]
+        primitive = {
+            'attributes': {'POSITION': self.add_accessor(positions, 'VEC3', self._ARRAY_BUFFER, with_bounds=True)},
+            'indices': self.add_accessor(indices, 'SCALAR', self._ELEMENT_ARRAY_BUFFER, self._UNSIGNED_SHORT),
+            'material': self._add_material('container', rgba),
+            'mode': self._LINES
+        }
+        return self.add_node({'name': 'container', 'mesh': self._add_mesh('container', primitive)})
+
+    def add_accessor(
+            self,
+            values: Sequence[float],
+            accessor_type: str,
+            target: int = 0,
+            component_type: int = _FLOAT,
+            with_bounds: bool = False
+    ) -> int:
+        components = {'SCALAR': 1, 'VEC3': 3}[accessor_type]
+        data = array('H' if component_type == self._UNSIGNED_SHORT else 'f', values)
+        if sys.byteorder == 'big':
+            data.byteswap()
+
+        # Every view starts at a multiple of 4 bytes, which suits all component types
+        self._binary += b'\0' * (-len(self._binary) % 4)
+        buffer_view = {'buffer': 0, 'byteOffset': len(self._binary), 'byteLength': len(data) * data.itemsize}
+        if target:
+            buffer_view['target'] = target
+        self._binary += data.tobytes()
+        self._gltf['bufferViews'].append(buffer_view)
+
+        accessor = {
+            'bufferView': len(self._gltf['bufferViews']) - 1,
+            'componentType': component_type,
+            'count': len(values) // components,
+            'type': accessor_type
+        }
+        if with_bounds:
+            accessor['min'] = [min(values[i::components]) for i in range(components)]
+            accessor['max'] = [max(values[i::components]) for i in range(components)]
+        self._gltf['accessors'].append(accessor)
+        return len(self._gltf['accessors']) - 1
+
+    def build_glb(self, required_extensions: List[str]) -> bytes:
+        # Arrays of glTF are not empty when present, e.g. there is no buffer for no containers
+        gltf = {key: value for key, value in self._gltf.items() if value != []}
+        if self._binary:
+            gltf['buffers'] = [{'byteLength': len(self._binary) + (-len(self._binary) % 4)}]
+        if not self._gltf['scenes']:
+            del gltf['scene']
+        if required_extensions and self._gltf['nodes']:
+            gltf['extensionsUsed'] = required_extensions
+            gltf['extensionsRequired'] = required_extensions
+        json_chunk = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+        json_chunk += b' ' * (-len(json_chunk) % 4)
+        chunks = [struct.pack('<I4s', len(json_chunk), b'JSON'), json_chunk]
+        if self._binary:
+            binary_chunk = bytes(self._binary) + b'\0' * (-len(self._binary) % 4)
+            chunks += [struct.pack('<I4s', len(binary_chunk), b'BIN\0'), binary_chunk]
+
+        length = 12 + sum(len(chunk) for chunk in chunks)
+        return b''.join([struct.pack('<4sII', b'glTF', 2, length)] + chunks)
+
+    def _add_material(self, name: str, rgba: List[float]) -> int:
+        material = self._materials.get(name)
+        if material is None:
+            self._gltf['materials'].append({
+                'name': name,
+                'pbrMetallicRoughness': {'baseColorFactor': rgba, 'metallicFactor': 0.0, 'roughnessFactor': 0.9}
+            })
+            material = self._materials[name] = len(self._gltf['materials']) - 1
+        return material
+
+    def _add_mesh(self, name: str, primitive: Dict[str, Any]) -> int:
+        self._gltf['meshes'].append({'name': name, 'primitives': [primitive]})
+        return len(self._gltf['meshes']) - 1
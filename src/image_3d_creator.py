@@ -1,5 +1,6 @@
+import os
 from datetime import datetime
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -46,9 +47,12 @@ class Image3dCreator:
     ]
 
     _current_time: datetime
+    _output_directory: Optional[str]
 
-    def __init__(self, current_time: datetime):
+    def __init__(self, current_time: datetime, output_directory: Optional[str] = None):
+        """Images are shown in a window, or saved as png files when an output directory is given."""
         self._current_time = current_time
+        self._output_directory = output_directory
 
     def create(self, container: Container) -> None:
         self._create(container, len(container.id_to_shipment))
@@ -93,7 +97,12 @@ class Image3dCreator:
 
         ax.set_title(f'{self._current_time.strftime("%H:%M:%S")}\n{container}\nShipments:{shipments_num}')
 
-        plt.show()
+        if self._output_directory is None:
+            plt.show()
+            return
+        os.makedirs(self._output_directory, exist_ok=True)
+        fig.savefig(os.path.join(self._output_directory, f'container_{container.id}_{shipments_num}.png'))
+        plt.close(fig)
 
     def _create_poly_3d_collection(self, container: Container, shipments_num: int) -> Poly3DCollection:
         cubes = []
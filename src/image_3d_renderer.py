@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import repeat
+from typing import List, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+from src.box_faces import BoxFaces
+from src.items.container import Container
+
+
+@dataclass(frozen=True)
+class ContainerScene:
+    """Boxes of a loaded container in the loading order, which is all processes rendering it need."""
+    name: str
+    title: str
+    size: Tuple[int, int, int]
+    min_points: np.ndarray
+    sizes: np.ndarray
+    colors: np.ndarray
+    step_counts: List[int]
+
+    @staticmethod
+    def from_container(container: Container, title: str) -> 'ContainerScene':
+        min_points = []
+        sizes = []
+        colors = []
+        step_counts = []
+        last_shipment_params = None
+        for n, shipment_id in enumerate(container.loading_order):
+            shipment_params = container.id_to_shipment[shipment_id].parameters
+            if shipment_params != last_shipment_params and n > 0:
+                step_counts.append(n)
+            last_shipment_params = shipment_params
+            min_points.append(container.id_to_min_point_shifted[shipment_id])
+            sizes.append((shipment_params.length, shipment_params.width, shipment_params.height))
+            colors.append(shipment_params.color)
+        step_counts.append(len(container.loading_order))
+
+        return ContainerScene(
+            f'container_{container.id}',
+            title,
+            (container.length, container.width, container.height),
+            np.array(min_points, dtype=np.int64).reshape(-1, 3),
+            np.array(sizes, dtype=np.int64).reshape(-1, 3),
+            to_rgba_array(colors) if colors else np.zeros((0, 4)),
+            step_counts)
+
+
+class Image3dRenderer:
+    """
+    Renders loaded containers into png files without a display. Faces of all boxes are computed at once
+    and faces hidden by neighbouring boxes are not drawn. Step images of a container are drawn on one figure,
+    every step only selects the faces visible after it. Containers are rendered in parallel processes.
+    """
+    _output_directory: str
+    _current_time: datetime
+    _processes: int
+    _dpi: int
+
+    def __init__(self, output_directory: str, current_time: datetime, processes: int = 1, dpi: int = 100) -> None:
+        self._output_directory = output_directory
+        self._current_time = current_time
+        self._processes = processes
+        self._dpi = dpi
+
+    def render(self, containers: List[Container], with_steps: bool = False) -> List[str]:
+        """Renders every container, or every step of loading it, and returns paths of the images."""
+        os.makedirs(self._output_directory, exist_ok=True)
+        time = self._current_time.strftime("%H:%M:%S")
+        scenes = [ContainerScene.from_container(container, f'{time}\n{container}') for container in containers]
+        arguments = (scenes, repeat(self._output_directory), repeat(with_steps), repeat(self._dpi))
+        if self._processes <= 1 or len(scenes) <= 1:
+            paths = map(self._render_scene, *arguments)
+            return [path for scene_paths in paths for path in scene_paths]
+
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(min(self._processes, len(scenes)), mp_context) as executor:
+            paths = executor.map(self._render_scene, *arguments)
+            return [path for scene_paths in paths for path in scene_paths]
+
+    @staticmethod
+    def _render_scene(scene: ContainerScene, output_directory: str, with_steps: bool, dpi: int) -> List[str]:
+        box_faces = BoxFaces(scene.min_points, scene.sizes)
+
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot(111, projection='3d')
+        axes.set_box_aspect(scene.size)
+        axes.set_xlim(0, scene.size[0])
+        axes.set_ylim(0, scene.size[1])
+        axes.set_zlim(0, scene.size[2])
+        axes.set_xlabel('Length')
+        axes.set_ylabel('Width')
+        axes.set_zlabel('Height')
+
+        paths = []
+        collection = None
+        for count in scene.step_counts if with_steps else scene.step_counts[-1:]:
+            if collection is not None:
+                collection.remove()
+            polygons, box_indexes = box_faces.select_visible(count)
+            collection = Poly3DCollection(
+                polygons, facecolors=scene.colors[box_indexes], edgecolors='k', linewidths=0.2)
+            axes.add_collection3d(collection)
+            axes.set_title(f'{scene.title}\nShipments:{count}')
+
+            path = os.path.join(output_directory, f'{scene.name}_{count}.png')
+            figure.savefig(path, dpi=dpi)
+            paths.append(path)
+        return paths
@@ -1,38 +1,34 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 
 from src.items.shipment import Shipment
 from src.items.util_items.item import Item
 from src.items.util_items.name_item import NameItem
 from src.items.util_items.volume_item import VolumeItem
+from src.loading.container_layout import ContainerLayout
 from src.loading.point.point import Point
-from src.loading.point.places_manager import PlacesManager
-from src.loading.point.points_update_info_resolver import PointsUpdateInfoResolver
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
-from src.parameters.util_parameters.volume_parameters import VolumeParameters
 from src.statistics.container_statistics import ContainerStatistics
 
 
 class Container(Item[ContainerParameters], VolumeItem, NameItem):
     _parameters: ContainerParameters
-    _points_manager: PlacesManager
+    _layout: ContainerLayout
     _id_to_min_point_shifted: Dict[int, Point]
     _min_point_to_id: Dict[Point, int]
     _id_to_shipment: Dict[int, Shipment]
     _loading_order: List[int]
-    _container_statistics: ContainerStatistics
 
-    def __init__(self, parameters: ContainerParameters, id_: int):
+    def __init__(self, parameters: ContainerParameters, id_: int, layout: Optional[ContainerLayout] = None):
         Item.__init__(self, id_)
         VolumeItem.__init__(self, parameters)
         NameItem.__init__(self, parameters)
         self._parameters = parameters
-        self._points_manager = PlacesManager(parameters, PointsUpdateInfoResolver())
+        self._layout = layout if layout is not None else ContainerLayout(parameters)
         self._id_to_min_point_shifted = {}
         self._min_point_to_id = {}
         self._id_to_shipment = {}
         self._loading_order = []
-        self._container_statistics = ContainerStatistics()
 
     @property
     def parameters(self) -> ContainerParameters:
@@ -40,7 +36,7 @@ class Container(Item[ContainerParameters], VolumeItem, NameItem):
 
     @property
     def loadable_points(self) -> List[Point]:
-        return self._points_manager.get_opening_points()
+        return self._layout.get_loadable_points()
 
     @property
     def id_to_min_point_shifted(self) -> Dict[int, Point]:
@@ -60,7 +56,7 @@ class Container(Item[ContainerParameters], VolumeItem, NameItem):
 
     @property
     def container_statistics(self) -> ContainerStatistics:
-        return self._container_statistics
+        return self._layout.container_statistics
 
     def _key(self) -> Tuple:
         return self.id, self._parameters.length, self._parameters.width, \
@@ -77,8 +73,16 @@ class Container(Item[ContainerParameters], VolumeItem, NameItem):
                f')'
 
     def load(self, point: Point, shipment: Shipment) -> None:
-        self._update_loadable_points(point, shipment)
+        self._layout.load(point, shipment.parameters)
+        self.place(point, shipment)
 
+    def load_block(self, point: Point, shipments: List[Shipment], columns: int, rows: int, layers: int) -> None:
+        points = self._layout.load_block(point, shipments[0].parameters, columns, rows, layers)
+        for shipment_point, shipment in zip(points, shipments):
+            self.place(shipment_point, shipment)
+
+    def place(self, point: Point, shipment: Shipment) -> None:
+        """Records the shipment at the point, which is already taken in the layout."""
         x = int(point.x + shipment.parameters.get_length_diff() / 2)
         y = int(point.y + shipment.parameters.get_width_diff() / 2)
         self._id_to_min_point_shifted[shipment.id] = Point(x, y, point.z)
@@ -86,58 +90,30 @@ class Container(Item[ContainerParameters], VolumeItem, NameItem):
         self._min_point_to_id[point] = shipment.id
         self._id_to_shipment[shipment.id] = shipment
         self._loading_order.append(shipment.id)
-        self._container_statistics.update(point, shipment.parameters)
+
+    def reorder(self, loading_order: List[int]) -> None:
+        """Sets the order of loading the shipments, which are already placed."""
+        self._loading_order = loading_order
 
     def unload(self) -> None:
-        self._points_manager.reset()
+        self._layout.reset()
         self._id_to_min_point_shifted = {}
         self._min_point_to_id = {}
         self._id_to_shipment = {}
         self._loading_order = []
-        self._container_statistics.reset()
 
     def can_load_into_point(self, point: Point, shipment_params: ShipmentParameters) -> bool:
-        if not self._volume_fits(point, shipment_params):
-            return False
-        if not self._weight_fits(shipment_params.weight):
-            return False
-        return True
+        return self._layout.can_load_into_point(point, shipment_params)
+
+    def compute_block_size(self, point: Point, shipment_params: ShipmentParameters, count: int) -> Tuple[int, int, int]:
+        return self._layout.compute_block_size(point, shipment_params, count)
 
     def get_loaded_volume(self) -> float:
-        return self._container_statistics.loaded_volume
+        return self._layout.get_loaded_volume()
 
     def build_response(self) -> Dict:
         response = self.parameters.build_response()
         volume = self.parameters.compute_volume()
-        response['loaded_volume_share'] = self._container_statistics.loaded_volume / volume
-        response['ldm'] = self._container_statistics.ldm
+        response['loaded_volume_share'] = self.container_statistics.loaded_volume / volume
+        response['ldm'] = self.container_statistics.ldm
         return response
-
-    def _volume_fits(self, point: Point, shipment_params: ShipmentParameters) -> bool:
-        max_points = self._points_manager.get_closing_points(point)
-        for max_point in max_points:
-            v = VolumeParameters.from_points(point, max_point)
-            if v.length < shipment_params.get_loading_length():
-                continue
-            if v.width < shipment_params.get_loading_width():
-                continue
-            if v.height < shipment_params.height:
-                continue
-            return True
-        return False
-
-    def _weight_fits(self, weight: int) -> bool:
-        total_weight = sum([shipment.weight for shipment in self._id_to_shipment.values()])
-        total_weight += weight
-        return total_weight <= self._parameters.lifting_capacity
-
-    def _update_loadable_points(self, loading_p: Point, shipment: Shipment) -> None:
-        loading_max_p = self._compute_max_point(loading_p, shipment.parameters)
-        self._points_manager.update(loading_p, loading_max_p, shipment.can_stack)
-
-    @staticmethod
-    def _compute_max_point(point: Point, volume_parameters: VolumeParameters) -> Point:
-        return Point(
-            point.x + volume_parameters.get_loading_length() - 1,
-            point.y + volume_parameters.get_loading_width() - 1,
-            point.z + volume_parameters.height - 1)
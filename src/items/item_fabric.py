@@ -1,5 +1,6 @@
 from src.items.container import Container
 from src.items.shipment import Shipment
+from src.loading.container_layout import ContainerLayout
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
 
@@ -15,6 +16,13 @@ class ItemFabric:
         self._current_id += 1
         return container
 
+    def create_loaded_container(self, layout: ContainerLayout) -> Container:
+        container = Container(layout.parameters, self._current_id, layout)
+        self._current_id += 1
+        for point, shipment_params in layout.get_placements():
+            container.place(point, self.create_shipment(shipment_params))
+        return container
+
     def create_shipment(self, shipment_parameters: ShipmentParameters) -> Shipment:
         shipment = Shipment(shipment_parameters, self._current_id)
         self._current_id += 1
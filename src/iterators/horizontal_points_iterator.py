@@ -5,5 +5,6 @@ from src.loading.point.point import Point
 
 
 class HorizontalPointsIterator(PointsIterator):
-    def _get_point_order_key(self, point: Point) -> Tuple:
+    @staticmethod
+    def get_point_order_key(point: Point) -> Tuple:
         return point.z, point.x, point.y
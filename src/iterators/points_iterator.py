@@ -1,28 +1,24 @@
 from abc import abstractmethod, ABC
-from typing import Optional, List, Tuple, Iterable
+from typing import Optional, Iterator, Tuple, Iterable
 
 from src.iterators.space_iterator import SpaceIterator
 from src.loading.point.point import Point
 
 
 class PointsIterator(SpaceIterator, ABC):
-    _points: List[Point]
-    _i: int
+    _points: Iterator[Point]
 
     def __init__(self, points: Iterable[Point]) -> None:
         super().__init__()
-        self._points = sorted(points, key=lambda p: self._get_point_order_key(p))
-        self._i = 0
+        self._points = iter(sorted(points, key=self.get_point_order_key))
 
     def _compute_start_point(self) -> Optional[Point]:
-        return self._points[self._i]
+        return next(self._points, None)
 
     def _compute_next_empty_point(self) -> Optional[Point]:
-        self._i += 1
-        if self._i < len(self._points):
-            return self._points[self._i]
-        return None
+        return next(self._points, None)
 
+    @staticmethod
     @abstractmethod
-    def _get_point_order_key(self, point: Point) -> Tuple:
+    def get_point_order_key(point: Point) -> Tuple:
         pass
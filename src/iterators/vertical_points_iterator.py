@@ -5,5 +5,6 @@ from src.loading.point.point import Point
 
 
 class VerticalPointsIterator(PointsIterator):
-    def _get_point_order_key(self, point: Point) -> Tuple:
+    @staticmethod
+    def get_point_order_key(point: Point) -> Tuple:
         return point.x, point.y, point.z
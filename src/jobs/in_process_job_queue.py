@@ -0,0 +1,59 @@
+import copy
+import uuid
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, Optional
+
+from src.jobs.job import Job, JobStatus
+from src.jobs.job_queue import JobQueue
+
+
+class InProcessJobQueue(JobQueue):
+    """Job queue kept in memory, only the workers of the same process can take its jobs."""
+    _jobs: Dict[str, Job]
+    _queued_job_ids: Deque[str]
+    _lock: Lock
+
+    def __init__(self) -> None:
+        self._jobs = {}
+        self._queued_job_ids = deque()
+        self._lock = Lock()
+
+    def submit(self, request: Dict[str, Any]) -> str:
+        job = Job(uuid.uuid4().hex, JobStatus.QUEUED, request)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._queued_job_ids.append(job.id)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return copy.deepcopy(self._jobs.get(job_id))
+
+    def claim(self) -> Optional[Job]:
+        with self._lock:
+            if not self._queued_job_ids:
+                return None
+            job = self._jobs[self._queued_job_ids.popleft()]
+            job.status = JobStatus.RUNNING
+            return copy.deepcopy(job)
+
+    def refresh_lease(self, job_id: str) -> None:
+        # Running jobs are never taken again, they have no lease
+        pass
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job_id].progress = progress
+
+    def complete(self, job_id: str, response: Dict[str, Any]) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status = JobStatus.DONE
+            job.response = response
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status = JobStatus.FAILED
+            job.error = error
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class JobStatus(Enum):
+    QUEUED = 1
+    RUNNING = 2
+    DONE = 3
+    FAILED = 4
+
+    @staticmethod
+    def from_name(name: str) -> 'JobStatus':
+        return JobStatus[name.upper()]
+
+
+@dataclass
+class Job:
+    id: str
+    status: JobStatus
+    request: Dict[str, Any]
+    progress: Dict[str, Any] = field(default_factory=dict)
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def build_response(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'status': self.status.name.lower(),
+            'progress': self.progress,
+            'response': self.response,
+            'error': self.error
+        }
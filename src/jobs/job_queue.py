@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from src.jobs.job import Job
+
+
+class JobQueue(ABC):
+    @abstractmethod
+    def submit(self, request: Dict[str, Any]) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def claim(self) -> Optional[Job]:
+        """Takes the oldest queued job and marks it running."""
+        pass
+
+    @abstractmethod
+    def refresh_lease(self, job_id: str) -> None:
+        """Tells that the solver of a running job is still alive."""
+        pass
+
+    @abstractmethod
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, response: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> None:
+        pass
@@ -0,0 +1,117 @@
+import os
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from src.jobs.job import Job
+from src.jobs.job_queue import JobQueue
+
+JobHandler = Callable[[Dict[str, Any], Callable[[int, int], None]], Dict[str, Any]]
+
+
+class JobWorkerPool:
+    """
+    Solver threads taking jobs from the queue. Threads do not survive a fork,
+    so a pool serving requests too is started lazily in every process.
+    """
+    _job_queue: JobQueue
+    _job_handler: JobHandler
+    _workers: int
+    _poll_interval: float
+    _heartbeat_interval: float
+    _threads: List[Thread]
+    _stopped: Event
+    _pid: Optional[int]
+    _lock: Lock
+
+    def __init__(
+            self,
+            job_queue: JobQueue,
+            job_handler: JobHandler,
+            workers: int = 1,
+            poll_interval: float = 1,
+            heartbeat_interval: float = 60
+    ) -> None:
+        self._job_queue = job_queue
+        self._job_handler = job_handler
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._threads = []
+        self._stopped = Event()
+        self._pid = None
+        self._lock = Lock()
+
+    def start(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._stopped = Event()
+            self._threads = [Thread(target=self._run, daemon=True) for _ in range(self._workers)]
+            for thread in self._threads:
+                thread.start()
+            self._pid = os.getpid()
+            logger.info(f'Started {self._workers} job workers in process {self._pid}')
+
+    def run(self) -> None:
+        """Takes jobs until interrupted, in a process which only solves jobs."""
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            logger.info(f'Stopping job workers in process {self._pid}')
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped.set()
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+            self._pid = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                job = self._job_queue.claim()
+            except Exception:
+                logger.exception('Failed to claim a job')
+                job = None
+            if job is None:
+                self._stopped.wait(self._poll_interval)
+                continue
+            self._process(job)
+
+    def _process(self, job: Job) -> None:
+        logger.info(f'Processing job {job.id}')
+
+        def on_container_loaded(loaded_containers: int, left_cargo_count: int) -> None:
+            progress = {'loaded_containers': loaded_containers, 'left_cargo_count': left_cargo_count}
+            self._job_queue.update_progress(job.id, progress)
+
+        # The lease is refreshed while the job runs, so a long container is not taken by another solver
+        processed = Event()
+        heartbeat = Thread(target=self._beat, args=(job.id, processed), daemon=True)
+        heartbeat.start()
+        try:
+            response = self._job_handler(job.request, on_container_loaded)
+        except Exception as e:
+            logger.exception(f'Job {job.id} failed')
+            self._job_queue.fail(job.id, str(e))
+            return
+        finally:
+            processed.set()
+            heartbeat.join()
+        self._job_queue.complete(job.id, response)
+        logger.info(f'Processed job {job.id}')
+
+    def _beat(self, job_id: str, processed: Event) -> None:
+        while not processed.wait(self._heartbeat_interval):
+            try:
+                self._job_queue.refresh_lease(job_id)
+            except Exception:
+                logger.exception(f'Failed to refresh the lease of job {job_id}')
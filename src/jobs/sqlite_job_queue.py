@@ -0,0 +1,140 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+from src.jobs.job import Job, JobStatus
+from src.jobs.job_queue import JobQueue
+
+
+class SqliteJobQueue(JobQueue):
+    """
+    Job queue kept in sqlite, so jobs submitted to one gunicorn worker can be taken by the solvers of any other.
+    A running job whose lease was not refreshed for the lease time is taken again, as its solver is considered dead,
+    and it fails after max attempts. Finished jobs are dropped after max age.
+    """
+    _path: str
+    _lease: float
+    _max_attempts: int
+    _max_age: float
+
+    def __init__(
+            self,
+            path: str,
+            lease: float = 10 * 60,
+            max_attempts: int = 3,
+            max_age: float = 24 * 60 * 60
+    ) -> None:
+        self._path = path
+        self._lease = lease
+        self._max_attempts = max_attempts
+        self._max_age = max_age
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL, progress TEXT NOT NULL, '
+                'response TEXT, error TEXT, attempts INTEGER NOT NULL, '
+                'created_at REAL NOT NULL, updated_at REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at)')
+
+    def submit(self, request: Dict[str, Any]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'INSERT INTO jobs (id, status, request, progress, attempts, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, 0, ?, ?)',
+                (job_id, self._status_name(JobStatus.QUEUED), json.dumps(request), json.dumps({}), now, now))
+            connection.execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?',
+                (self._status_name(JobStatus.DONE), self._status_name(JobStatus.FAILED), now - self._max_age))
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                'SELECT id, status, request, progress, response, error FROM jobs WHERE id = ?',
+                (job_id,)).fetchone()
+        if row is None:
+            return None
+        return self._create_job(row)
+
+    def claim(self) -> Optional[Job]:
+        now = time.time()
+        running = self._status_name(JobStatus.RUNNING)
+        with closing(self._connect()) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'UPDATE jobs SET status = ?, error = ?, updated_at = ? '
+                    'WHERE status = ? AND updated_at < ? AND attempts >= ?',
+                    (self._status_name(JobStatus.FAILED), 'Solver stopped', now,
+                     running, now - self._lease, self._max_attempts))
+                row = connection.execute(
+                    'SELECT id, status, request, progress, response, error FROM jobs '
+                    'WHERE status = ? OR (status = ? AND updated_at < ?) ORDER BY created_at LIMIT 1',
+                    (self._status_name(JobStatus.QUEUED), running, now - self._lease)).fetchone()
+                if row is not None:
+                    connection.execute(
+                        'UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?',
+                        (running, now, row[0]))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        if row is None:
+            return None
+        job = self._create_job(row)
+        job.status = JobStatus.RUNNING
+        return job
+
+    def refresh_lease(self, job_id: str) -> None:
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'UPDATE jobs SET updated_at = ? WHERE id = ? AND status = ?',
+                (time.time(), job_id, self._status_name(JobStatus.RUNNING)))
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ?',
+                (json.dumps(progress), time.time(), job_id))
+
+    def complete(self, job_id: str, response: Dict[str, Any]) -> None:
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'UPDATE jobs SET status = ?, response = ?, updated_at = ? WHERE id = ?',
+                (self._status_name(JobStatus.DONE), json.dumps(response), time.time(), job_id))
+
+    def fail(self, job_id: str, error: str) -> None:
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?',
+                (self._status_name(JobStatus.FAILED), error, time.time(), job_id))
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit, claims open their transaction explicitly
+        return sqlite3.connect(self._path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def _create_job(row: tuple) -> Job:
+        job_id, status, request, progress, response, error = row
+        return Job(
+            job_id,
+            JobStatus.from_name(status),
+            json.loads(request),
+            json.loads(progress),
+            json.loads(response) if response is not None else None,
+            error)
+
+    @staticmethod
+    def _status_name(status: JobStatus) -> str:
+        return status.name.lower()
@@ -0,0 +1,184 @@
+from array import array
+from typing import Dict, List, Tuple, Iterator, Optional
+
+from src.loading.loading_type import LoadingType
+from src.loading.orientation_table import Orientations
+from src.loading.point.places_manager import PlacesManager
+from src.loading.point.point import Point
+from src.loading.point.points_update_info_resolver import PointsUpdateInfoResolver
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+from src.parameters.util_parameters.volume_parameters import VolumeParameters
+from src.statistics.container_statistics import ContainerStatistics
+
+
+class ContainerLayout:
+    """
+    Free places and placements of a container without any items. Placements are kept in an array of
+    (x, y, z, shipment params id) together with running weight and volume totals, so trial loads stay cheap.
+    """
+    _parameters: ContainerParameters
+    _points_manager: PlacesManager
+    _shipment_params: List[ShipmentParameters]
+    _shipment_params_ids: Dict[ShipmentParameters, int]
+    _placements: array
+    _loaded_weight: float
+    _container_statistics: ContainerStatistics
+
+    def __init__(self, parameters: ContainerParameters) -> None:
+        self._parameters = parameters
+        self._points_manager = PlacesManager(parameters, PointsUpdateInfoResolver())
+        self._container_statistics = ContainerStatistics()
+        self.reset()
+
+    @property
+    def parameters(self) -> ContainerParameters:
+        return self._parameters
+
+    @property
+    def container_statistics(self) -> ContainerStatistics:
+        return self._container_statistics
+
+    @property
+    def shipment_params(self) -> List[ShipmentParameters]:
+        return self._shipment_params
+
+    @property
+    def placements(self) -> array:
+        return self._placements
+
+    def get_loadable_points(self) -> List[Point]:
+        return self._points_manager.get_opening_points()
+
+    def get_placements(self) -> Iterator[Tuple[Point, ShipmentParameters]]:
+        placements = self._placements
+        for i in range(0, len(placements), 4):
+            point = Point(placements[i], placements[i + 1], placements[i + 2])
+            yield point, self._shipment_params[placements[i + 3]]
+
+    def get_loaded_volume(self) -> float:
+        return self._container_statistics.loaded_volume
+
+    def get_loaded_weight(self) -> float:
+        return self._loaded_weight
+
+    def reset(self) -> None:
+        self._points_manager.reset()
+        self._shipment_params = []
+        self._shipment_params_ids = {}
+        self._placements = array('q')
+        self._loaded_weight = 0
+        self._container_statistics.reset()
+
+    def load(self, point: Point, shipment_params: ShipmentParameters) -> None:
+        max_point = self._compute_max_point(point, shipment_params)
+        self._points_manager.update(point, max_point, shipment_params.can_stack)
+        self._place(point, shipment_params)
+
+    def load_block(
+            self,
+            point: Point,
+            shipment_params: ShipmentParameters,
+            columns: int,
+            rows: int,
+            layers: int
+    ) -> List[Point]:
+        """
+        Loads columns x rows x layers shipments as one solid block starting at the point and returns their points.
+        Free places are updated once for the whole block since there is no free space inside it.
+        """
+        length = shipment_params.get_loading_length()
+        width = shipment_params.get_loading_width()
+        height = shipment_params.height
+
+        block_max_point = Point(
+            point.x + columns * length - 1,
+            point.y + rows * width - 1,
+            point.z + layers * height - 1)
+        self._points_manager.update(point, block_max_point, shipment_params.can_stack)
+
+        points = []
+        for column in range(columns):
+            for row in range(rows):
+                for layer in range(layers):
+                    shipment_point = Point(point.x + column * length, point.y + row * width, point.z + layer * height)
+                    self._place(shipment_point, shipment_params)
+                    points.append(shipment_point)
+        return points
+
+    def select_loading_point(
+            self,
+            orientations: Orientations,
+            loading_type: LoadingType
+    ) -> Optional[Tuple[Point, ShipmentParameters]]:
+        """
+        First opening point in the loading type order where one of the orientations can be loaded,
+        trying the orientations in turn. All orientations are checked against all free places at once.
+        """
+        if not orientations.sizes or not self._weight_fits(orientations.weight):
+            return None
+        selected = self._points_manager.select_opening_point(orientations.sizes, loading_type)
+        if selected is None:
+            return None
+        i, point = selected
+        return point, orientations.variations[i]
+
+    def can_load_into_point(self, point: Point, shipment_params: ShipmentParameters) -> bool:
+        if not self._volume_fits(point, shipment_params):
+            return False
+        if not self._weight_fits(shipment_params.weight):
+            return False
+        return True
+
+    def compute_block_size(self, point: Point, shipment_params: ShipmentParameters, count: int) -> Tuple[int, int, int]:
+        """
+        Columns along length, rows along width and layers of the largest block of at most count shipments
+        fitting into one of the places opened by the point and into the lifting capacity left.
+        """
+        if shipment_params.weight > 0:
+            weight_left = self._parameters.lifting_capacity - self._loaded_weight
+            count = min(count, int(weight_left // shipment_params.weight))
+
+        best_block_size = (0, 0, 0)
+        if count <= 0:
+            return best_block_size
+
+        for max_point in self._points_manager.get_closing_points(point):
+            columns = (max_point.x - point.x + 1) // shipment_params.get_loading_length()
+            rows = (max_point.y - point.y + 1) // shipment_params.get_loading_width()
+            layers = (max_point.z - point.z + 1) // shipment_params.height if shipment_params.can_stack else 1
+            if columns == 0 or rows == 0 or layers == 0:
+                continue
+
+            layers = min(layers, max(1, count // rows))
+            rows = min(rows, count)
+            columns = min(columns, count // (rows * layers))
+            if columns * rows * layers > best_block_size[0] * best_block_size[1] * best_block_size[2]:
+                best_block_size = (columns, rows, layers)
+        return best_block_size
+
+    def _place(self, point: Point, shipment_params: ShipmentParameters) -> None:
+        shipment_params_id = self._shipment_params_ids.get(shipment_params)
+        if shipment_params_id is None:
+            shipment_params_id = self._shipment_params_ids[shipment_params] = len(self._shipment_params)
+            self._shipment_params.append(shipment_params)
+        self._placements.extend((point.x, point.y, point.z, shipment_params_id))
+        self._loaded_weight += shipment_params.weight
+        self._container_statistics.update(point, shipment_params)
+
+    def _volume_fits(self, point: Point, shipment_params: ShipmentParameters) -> bool:
+        shipment_max_point = self._compute_max_point(point, shipment_params)
+        for max_point in self._points_manager.get_closing_points(point):
+            if shipment_max_point <= max_point:
+                return True
+        return False
+
+    def _weight_fits(self, weight: int) -> bool:
+        return self._loaded_weight + weight <= self._parameters.lifting_capacity
+
+    @staticmethod
+    def _compute_max_point(point: Point, volume_parameters: VolumeParameters) -> Point:
+        return Point(
+            point.x + volume_parameters.get_loading_length() - 1,
+            point.y + volume_parameters.get_loading_width() - 1,
+            point.z + volume_parameters.height - 1)
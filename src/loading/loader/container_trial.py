@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from src.items.container import Container
+from src.items.item_fabric import ItemFabric
+from src.loading.container_layout import ContainerLayout
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+@dataclass(frozen=True)
+class ContainerTrial:
+    """
+    Picklable result of a trial load of one container type. Placements are (x, y, z, shipment params index)
+    in loading order, enough to rebuild the loaded container. Duration is the time of the trial in seconds.
+    """
+    container_params: ContainerParameters
+    loaded_volume: float
+    shipment_counts: Dict[ShipmentParameters, int]
+    shipment_params: List[ShipmentParameters]
+    placements: List[Tuple[int, int, int, int]]
+    duration: float
+
+    @staticmethod
+    def from_layout(
+            layout: ContainerLayout,
+            shipment_counts: Dict[ShipmentParameters, int],
+            duration: float
+    ) -> 'ContainerTrial':
+        placements = layout.placements
+        return ContainerTrial(
+            layout.parameters,
+            layout.get_loaded_volume(),
+            dict(shipment_counts),
+            list(layout.shipment_params),
+            [tuple(placements[i:i + 4]) for i in range(0, len(placements), 4)],
+            duration)
+
+    def materialize(self, item_fabric: ItemFabric) -> Container:
+        layout = ContainerLayout(self.container_params)
+        for x, y, z, shipment_params_id in self.placements:
+            layout.load(Point(x, y, z), self.shipment_params[shipment_params_id])
+        return item_fabric.create_loaded_container(layout)
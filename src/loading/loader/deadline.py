@@ -0,0 +1,48 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class Deadline:
+    """
+    Time budget of a calculation together with an optional check whether the calculation is still needed,
+    e.g. whether the client is still connected. The check may be slow, so it runs at most once an interval.
+    Once expired the deadline stays expired. Deadlines passed to other processes keep only the time budget left.
+    """
+    _CANCELLATION_CHECK_INTERVAL: float = 0.5
+
+    _end: Optional[float]
+    _is_cancelled: Optional[Callable[[], bool]]
+    _next_cancellation_check: float
+    _expired: bool
+
+    def __init__(self, time_budget: Optional[float] = None, is_cancelled: Optional[Callable[[], bool]] = None) -> None:
+        now = time.monotonic()
+        self._end = now + time_budget if time_budget is not None else None
+        self._is_cancelled = is_cancelled
+        self._next_cancellation_check = now + self._CANCELLATION_CHECK_INTERVAL
+        self._expired = False
+
+    def expired(self) -> bool:
+        if self._expired:
+            return True
+        now = time.monotonic()
+        if self._end is not None and now >= self._end:
+            self._expired = True
+        elif self._is_cancelled is not None and now >= self._next_cancellation_check:
+            self._next_cancellation_check = now + self._CANCELLATION_CHECK_INTERVAL
+            self._expired = self._is_cancelled()
+        return self._expired
+
+    def get_time_left(self) -> Optional[float]:
+        """Seconds left of the time budget, None without a budget."""
+        if self._end is None:
+            return None
+        return max(0.0, self._end - time.monotonic())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Monotonic clocks of different processes are not comparable, so the end is rebuilt from the budget left
+        return {'time_left': self.get_time_left(), 'expired': self._expired}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['time_left'])
+        self._expired = state['expired']
@@ -1,28 +1,51 @@
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, Executor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, ClassVar
 
 from loguru import logger
 
 from src.items.container import Container
 from src.items.item_fabric import ItemFabric
-from src.iterators.horizontal_points_iterator import HorizontalPointsIterator
-from src.iterators.points_iterator import PointsIterator
-from src.iterators.vertical_points_iterator import VerticalPointsIterator
+from src.loading.container_layout import ContainerLayout
+from src.loading.loader.container_trial import ContainerTrial
+from src.loading.loader.deadline import Deadline
+from src.loading.loader.loading_order_resolver import LoadingOrderResolver
+from src.loading.loader.trial_pruner import TrialPruner
 from src.loading.loading_type import LoadingType
+from src.loading.orientation_table import OrientationTable
+from src.loading.placement_trace import PlacementTrace, TraceEvent
+from src.loading.shipment_ordering import ShipmentOrdering
 from src.loading.point.point import Point
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
+from src.statistics.timings import Timings
 
 
 @dataclass
 class Loader:
+    _MIN_BLOCK_SHIPMENTS: ClassVar[int] = 10
+
     _shipment_params: Dict[ShipmentParameters, int]
     _container_params: Dict[ContainerParameters, int]
     _loading_type: LoadingType
     _with_order: bool
+    _with_blocks: bool
+    _trial_processes: int
     _item_fabric: ItemFabric
+    _on_container_loaded: Optional[Callable[[int, int], None]] = None
+    _timings: Timings = field(default_factory=Timings)
+    _trace: Optional[PlacementTrace] = None
+    _deadline: Optional[Deadline] = None
+    _shipment_ordering: ShipmentOrdering = ShipmentOrdering.DEFAULT
     _containers: List[Container] = field(init=False, default_factory=list)
+    _truncated: bool = field(init=False, default=False)
+    _orientation_table: OrientationTable = field(init=False)
+
+    def __post_init__(self):
+        self._orientation_table = OrientationTable(self._shipment_params.keys())
 
     @property
     def shipment_params(self) -> Dict[ShipmentParameters, int]:
@@ -32,66 +55,92 @@ class Loader:
     def containers(self) -> List[Container]:
         return self._containers
 
+    @property
+    def truncated(self) -> bool:
+        """Whether loading stopped at the deadline with shipments left, which may have fit into more containers."""
+        return self._truncated
+
+    @property
+    def timings(self) -> Timings:
+        return self._timings
+
+    @property
+    def trace(self) -> Optional[PlacementTrace]:
+        return self._trace
+
     def load(self) -> None:
-        self._compute_loading_locations()
-        if self._with_order:
-            self._compute_loading_order()
-        logger.info(f'Loaded, '
-                    f'containers: {len(self._containers)}, '
-                    f'loaded shipments: {sum([c.container_statistics.shipments for c in self.containers])}, '
-                    f'left shipments: {self._count_shipments()}')
+        for _ in self.load_iteratively():
+            pass
 
-    def _compute_loading_locations(self) -> None:
+    def load_iteratively(self, keep_containers: bool = True) -> Iterator[Container]:
+        """
+        Yields every container as soon as it is chosen and its loading order is computed.
+        Without keeping containers they are left to the caller and the loader holds only one at a time.
+        """
         self._containers = []
+        executor = ProcessPoolExecutor(self._trial_processes) if self._trial_processes > 1 else None
+        with executor if executor is not None else nullcontext():
+            for container in self._load_containers(executor):
+                if keep_containers:
+                    self._containers.append(container)
+                yield container
+
+    def _load_containers(self, executor: Optional[Executor] = None) -> Iterator[Container]:
+        loaded_containers = 0
+        loaded_shipments = 0
         shipment_params_order = self._calculate_shipment_params_order()
         while self._count_shipments() > 0:
-            containers_to_shipment_counts = self._load_shipments_into_available_containers(shipment_params_order)
-            max_loaded_container = self._select_max_loaded_container(list(containers_to_shipment_counts.keys()))
-            if not max_loaded_container:
+            with self._timings.measure('container_trials'):
+                if executor is None:
+                    loaded_container = self._load_max_loaded_container(shipment_params_order)
+                else:
+                    loaded_container = self._load_max_loaded_container_in_executor(shipment_params_order, executor)
+            if self._is_expired():
+                # Trials of the round may have been stopped halfway, so none of them is taken
+                self._truncated = True
+                logger.info(f'Stopped at the deadline, left shipments: {self._count_shipments()}')
+                break
+            if not loaded_container:
                 break
-            self._containers.append(max_loaded_container)
+            max_loaded_container, container_shipment_counts = loaded_container
+            loaded_containers += 1
+            if self._trace is not None:
+                self._trace.add(
+                    TraceEvent.CONTAINER_SELECTED, max_loaded_container.parameters,
+                    max_loaded_container.get_loaded_volume())
             self._container_params[max_loaded_container.parameters] -= 1
-            for shipment_params, count in containers_to_shipment_counts[max_loaded_container].items():
+            for shipment_params, count in container_shipment_counts.items():
                 self._reduce_shipments(shipment_params, count)
-            logger.debug(f'Loaded containers: {len(self._containers)}')
+            logger.debug(f'Loaded containers: {loaded_containers}')
             logger.debug(f'Left shipments: {self._count_shipments()}')
 
-    def _compute_loading_order(self) -> None:
-        for container in self._containers:
-            logger.debug(f'Computing loading order for {container}')
-            min_point_to_id = container.min_point_to_id
-            id_to_shipment = container.id_to_shipment
-            container.unload()
-            while len(min_point_to_id) > 0:
-
-                points_start = len(min_point_to_id)
-                last_loaded_point = None
-                for point in VerticalPointsIterator(min_point_to_id.keys()):
-                    shipment = id_to_shipment[min_point_to_id[point]]
-
-                    can_load = container.can_load_into_point(point, shipment.parameters)
-                    if can_load:
-                        if last_loaded_point is not None and last_loaded_point.x != point.x:
-                            # or last_loaded_point.z != point.z):
-                            break
-                        container.load(point, shipment)
-                        min_point_to_id.pop(point)
-                        last_loaded_point = point
-
-                        logger.debug(f'Loaded to {point} {shipment}')
-
-                points_finish = len(min_point_to_id)
-                if points_start == points_finish:
-                    break
+            if self._with_order:
+                with self._timings.measure('loading_order'):
+                    self._compute_loading_order(max_loaded_container)
+            if self._on_container_loaded is not None:
+                self._on_container_loaded(loaded_containers, self._count_shipments())
+            loaded_shipments += max_loaded_container.container_statistics.shipments
+            yield max_loaded_container
+
+        logger.info(f'Loaded, '
+                    f'containers: {loaded_containers}, '
+                    f'loaded shipments: {loaded_shipments}, '
+                    f'left shipments: {self._count_shipments()}')
+
+    def _compute_loading_order(self, container: Container) -> None:
+        logger.debug(f'Computing loading order for {container}')
+        loading_order_resolver = LoadingOrderResolver(container.parameters)
+        container.reorder(loading_order_resolver.resolve(container))
 
-            for point in min_point_to_id.keys():
-                logger.debug(f'Left {point}')
+        if self._trace is not None:
+            id_to_min_point = {shipment_id: point for point, shipment_id in container.min_point_to_id.items()}
+            for shipment_id in container.loading_order:
+                point = id_to_min_point[shipment_id]
+                shipment_params = container.id_to_shipment[shipment_id].parameters
+                self._trace.add(TraceEvent.ORDER_LOADED, shipment_params, point.x, point.y, point.z)
 
     def _calculate_shipment_params_order(self) -> List[ShipmentParameters]:
-        return list(sorted(
-            self._shipment_params.keys(),
-            key=lambda s: [s.form_type == 'barrel', s.weight, s.can_stack] + s.get_volume_params_sorted(),
-            reverse=True))
+        return self._shipment_ordering.sort(list(self._shipment_params.keys()))
 
     def _count_shipments(self) -> int:
         return sum(list(self._shipment_params.values()))
@@ -102,75 +151,195 @@ class Loader:
         elif shipment_params in self._shipment_params:
             self._shipment_params.pop(shipment_params)
 
-    def _load_shipments_into_available_containers(
+    def _load_max_loaded_container(
             self,
             shipment_params_order: List[ShipmentParameters]
-    ) -> Dict[Container, Dict[ShipmentParameters, int]]:
-        containers_to_shipment_counts = {}
-        for container_params in self._get_available_container_params():
-            logger.debug(f'Loading into {container_params}')
-            container = self._item_fabric.create_container(container_params)
-            container_shipment_counts = self._load_shipments(shipment_params_order, container)
-            containers_to_shipment_counts[container] = container_shipment_counts
-        return containers_to_shipment_counts
+    ) -> Optional[Tuple[Container, Dict[ShipmentParameters, int]]]:
+        """
+        Trial loads are made into container layouts, only the selected one is turned into a container with shipments.
+        """
+        layouts_to_shipment_counts = self._load_shipments_into_available_layouts(shipment_params_order)
+        max_loaded_layout = self._select_max_loaded_layout(list(layouts_to_shipment_counts.keys()))
+        if not max_loaded_layout or self._is_expired():
+            return None
+        max_loaded_container = self._item_fabric.create_loaded_container(max_loaded_layout)
+        return max_loaded_container, layouts_to_shipment_counts[max_loaded_layout]
+
+    def _load_max_loaded_container_in_executor(
+            self,
+            shipment_params_order: List[ShipmentParameters],
+            executor: Executor
+    ) -> Optional[Tuple[Container, Dict[ShipmentParameters, int]]]:
+        """
+        Trial loads run in worker processes and only the selected container is rebuilt here.
+        Trials which have not started yet are cancelled once they cannot be selected.
+        Trials are compared in the order of available containers, so the result is the same as the serial one.
+        """
+        available_container_params = self._get_available_container_params()
+        trial_pruner = TrialPruner(self._shipment_params, available_container_params, self._orientation_table)
+        futures = {
+            i: executor.submit(
+                Loader._load_trial,
+                self._shipment_params,
+                shipment_params_order,
+                available_container_params[i],
+                self._loading_type,
+                self._with_blocks,
+                self._deadline)
+            for i in trial_pruner.order()
+        }
+        trials = {}
+        for i, future in futures.items():
+            if self._is_expired():
+                future.cancel()
+                continue
+            if not trial_pruner.can_win(i) and future.cancel():
+                self._trace_skipped_trial(available_container_params[i], trial_pruner.bounds[i])
+                continue
+            trial = trials[i] = future.result()
+            trial_pruner.add_trial(i, trial.loaded_volume, trial.shipment_counts)
+            self._timings.add_container_trial(trial.container_params.name, trial.duration)
+        max_loaded_trial = self._select_max_loaded_trial([trial for _, trial in sorted(trials.items())])
+        if not max_loaded_trial or self._is_expired():
+            return None
+        return max_loaded_trial.materialize(self._item_fabric), max_loaded_trial.shipment_counts
+
+    @staticmethod
+    def _load_trial(
+            shipment_params: Dict[ShipmentParameters, int],
+            shipment_params_order: List[ShipmentParameters],
+            container_params: ContainerParameters,
+            loading_type: LoadingType,
+            with_blocks: bool,
+            deadline: Optional[Deadline]
+    ) -> ContainerTrial:
+        start = time.perf_counter()
+        loader = Loader(
+            shipment_params,
+            {container_params: 1},
+            loading_type,
+            False,
+            with_blocks,
+            1,
+            ItemFabric(),
+            _deadline=deadline)
+        layout = ContainerLayout(container_params)
+        container_shipment_counts = loader._load_shipments(shipment_params_order, layout)
+        return ContainerTrial.from_layout(layout, container_shipment_counts, time.perf_counter() - start)
+
+    @staticmethod
+    def _select_max_loaded_trial(trials: List[ContainerTrial]) -> Optional[ContainerTrial]:
+        max_loaded_trial = None
+        for trial in trials:
+            logger.debug(f'{trial.container_params} loaded volume: {trial.loaded_volume}')
+            if trial.loaded_volume <= 0:
+                continue
+            if max_loaded_trial is None or trial.loaded_volume > max_loaded_trial.loaded_volume:
+                max_loaded_trial = trial
+        return max_loaded_trial
+
+    def _load_shipments_into_available_layouts(
+            self,
+            shipment_params_order: List[ShipmentParameters]
+    ) -> Dict[ContainerLayout, Dict[ShipmentParameters, int]]:
+        """
+        Trials are made from the container type with the highest bound of loaded volume and skipped
+        once the container type cannot be selected. Layouts are returned in the order of available containers.
+        """
+        available_container_params = self._get_available_container_params()
+        trial_pruner = TrialPruner(self._shipment_params, available_container_params, self._orientation_table)
+        layouts = {}
+        for i in trial_pruner.order():
+            if self._is_expired():
+                break
+            container_params = available_container_params[i]
+            if not trial_pruner.can_win(i):
+                self._trace_skipped_trial(container_params, trial_pruner.bounds[i])
+                continue
+            if self._trace is not None:
+                self._trace.add(TraceEvent.CONTAINER_TRIAL, container_params)
+            start = time.perf_counter()
+            layout = ContainerLayout(container_params)
+            container_shipment_counts = self._load_shipments(shipment_params_order, layout)
+            layouts[i] = layout, container_shipment_counts
+            trial_pruner.add_trial(i, layout.get_loaded_volume(), container_shipment_counts)
+            self._timings.add_container_trial(container_params.name, time.perf_counter() - start)
+        return dict(layout_and_counts for _, layout_and_counts in sorted(layouts.items()))
+
+    def _is_expired(self) -> bool:
+        return self._deadline is not None and self._deadline.expired()
+
+    def _trace_skipped_trial(self, container_params: ContainerParameters, bound: float) -> None:
+        if self._trace is not None:
+            self._trace.add(TraceEvent.CONTAINER_SKIPPED, container_params, bound)
 
     def _get_available_container_params(self) -> List[ContainerParameters]:
         return list(map(lambda x: x[0], filter(lambda x: x[1] != 0, self._container_params.items())))
 
     @staticmethod
-    def _select_max_loaded_container(containers: List[Container]) -> Container:
-        max_loaded_container = None
-        for container in containers:
-            logger.debug(f'{container} loaded volume: {container.get_loaded_volume()}')
-            if container.get_loaded_volume() <= 0:
+    def _select_max_loaded_layout(layouts: List[ContainerLayout]) -> Optional[ContainerLayout]:
+        max_loaded_layout = None
+        for layout in layouts:
+            logger.debug(f'{layout.parameters} loaded volume: {layout.get_loaded_volume()}')
+            if layout.get_loaded_volume() <= 0:
                 continue
-            if max_loaded_container is None or container.get_loaded_volume() > max_loaded_container.get_loaded_volume():
-                max_loaded_container = container
-        logger.debug(f'{max_loaded_container} has max loaded volume: {max_loaded_container.get_loaded_volume()}')
-        return max_loaded_container
+            if max_loaded_layout is None or layout.get_loaded_volume() > max_loaded_layout.get_loaded_volume():
+                max_loaded_layout = layout
+        return max_loaded_layout
 
     def _load_shipments(
             self,
             shipment_params_order: List[ShipmentParameters],
-            container: Container
+            layout: ContainerLayout
     ) -> Dict[ShipmentParameters, int]:
         container_shipment_counts = defaultdict(int)
         for shipment_params in shipment_params_order:
             shipment_count_left = self._shipment_params.get(shipment_params, 0)
             while shipment_count_left > 0:
-                if not self._load_shipment(shipment_params, container):
+                if self._is_expired():
+                    return container_shipment_counts
+                loaded_count = self._load_shipment(shipment_params, shipment_count_left, layout)
+                if loaded_count == 0:
+                    if self._trace is not None:
+                        self._trace.add(TraceEvent.SHIPMENT_NOT_LOADED, shipment_params, shipment_count_left)
                     break
-                container_shipment_counts[shipment_params] += 1
-                shipment_count_left -= 1
-                logger.debug(f'Loaded {shipment_params}, left {shipment_count_left}')
+                container_shipment_counts[shipment_params] += loaded_count
+                shipment_count_left -= loaded_count
         return container_shipment_counts
 
-    def _load_shipment(self, shipment_params: ShipmentParameters, container: Container) -> bool:
-        shipment_params_variations = shipment_params.get_volume_params_variations()
-        loading_point_and_shipment_params = self._select_loading_point(shipment_params_variations, container)
-        if loading_point_and_shipment_params:
-            loading_point, shipment_params = loading_point_and_shipment_params
-            shipment = self._item_fabric.create_shipment(shipment_params)
-            container.load(loading_point, shipment)
-            return True
-        return False
-
-    def _select_loading_point(
+    def _load_shipment(self, shipment_params: ShipmentParameters, count: int, layout: ContainerLayout) -> int:
+        orientations = self._orientation_table.get(shipment_params)
+        loading_point_and_shipment_params = layout.select_loading_point(orientations, self._loading_type)
+        if not loading_point_and_shipment_params:
+            return 0
+
+        loading_point, shipment_params = loading_point_and_shipment_params
+        if self._with_blocks and count >= self._MIN_BLOCK_SHIPMENTS:
+            block_count = self._load_block(loading_point, shipment_params, count, layout)
+            if block_count > 0:
+                return block_count
+
+        layout.load(loading_point, shipment_params)
+        if self._trace is not None:
+            self._trace.add(
+                TraceEvent.SHIPMENT_LOADED, shipment_params, loading_point.x, loading_point.y, loading_point.z)
+        return 1
+
+    def _load_block(
             self,
-            shipment_params_variations: List[ShipmentParameters],
-            container: Container
-    ) -> Optional[Tuple[Point, ShipmentParameters]]:
-        for shipment_params in shipment_params_variations:
-            for point in self._get_points_iterator(container):
-                can_load = container.can_load_into_point(point, shipment_params)
-                if can_load:
-                    logger.debug(f'Found {point} for {shipment_params}')
-                    return point, shipment_params
-        return None
-
-    def _get_points_iterator(self, container: Container) -> PointsIterator:
-        points = container.loadable_points
-        if self._loading_type == LoadingType.STABLE:
-            return HorizontalPointsIterator(points)
-        else:
-            return VerticalPointsIterator(points)
+            loading_point: Point,
+            shipment_params: ShipmentParameters,
+            count: int,
+            layout: ContainerLayout
+    ) -> int:
+        columns, rows, layers = layout.compute_block_size(loading_point, shipment_params, count)
+        block_count = columns * rows * layers
+        if block_count <= 1:
+            return 0
+
+        layout.load_block(loading_point, shipment_params, columns, rows, layers)
+        if self._trace is not None:
+            self._trace.add(
+                TraceEvent.BLOCK_LOADED, shipment_params, loading_point.x, loading_point.y, loading_point.z,
+                columns, rows, layers)
+        return block_count
@@ -1,10 +1,14 @@
-from typing import Dict, Optional, ClassVar
+from typing import Callable, Dict, Optional, ClassVar
 
 from src.items.item_fabric import ItemFabric
+from src.loading.loader.deadline import Deadline
 from src.loading.loader.loader import Loader
 from src.loading.loading_type import LoadingType
+from src.loading.placement_trace import PlacementTrace
+from src.loading.shipment_ordering import ShipmentOrdering
 from src.parameters.container_parameters import ContainerParameters
 from src.parameters.shipment_parameters import ShipmentParameters
+from src.statistics.timings import Timings
 
 
 class LoaderFactory:
@@ -20,17 +24,47 @@ class LoaderFactory:
             shipment_params: Dict[ShipmentParameters, int],
             container_params: Optional[Dict[ContainerParameters, int]] = None,
             loading_type_name: Optional[str] = 'compact',
-            with_order: Optional[bool] = True
+            with_order: Optional[bool] = True,
+            with_blocks: Optional[bool] = False,
+            trial_processes: Optional[int] = 1,
+            on_container_loaded: Optional[Callable[[int, int], None]] = None,
+            timings: Optional[Timings] = None,
+            trace: Optional[PlacementTrace] = None,
+            time_budget: Optional[float] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+            shipment_ordering_name: Optional[str] = 'default'
     ) -> Loader:
+        """
+        Loading stops when the time budget in seconds runs out or is_cancelled returns true,
+        the loader then has the containers loaded so far and the shipments left.
+        """
+        deadline = None
+        if time_budget is not None or is_cancelled is not None:
+            deadline = Deadline(time_budget, is_cancelled)
         container_params = self._resolve_container_params(container_params)
         loading_type = LoadingType.from_name(loading_type_name)
+        shipment_ordering = ShipmentOrdering.from_name(shipment_ordering_name or 'default')
         item_factory = ItemFabric()
-        return Loader(shipment_params, container_params, loading_type, with_order, item_factory)
+        return Loader(
+            shipment_params,
+            container_params,
+            loading_type,
+            with_order,
+            with_blocks,
+            trial_processes or 1,
+            item_factory,
+            on_container_loaded,
+            timings or Timings(),
+            trace,
+            deadline,
+            shipment_ordering)
 
     def _resolve_container_params(
             self,
             container_params: Optional[Dict[ContainerParameters, int]]
     ) -> Dict[ContainerParameters, int]:
+        # Loaders count the containers they load down, so they get a copy, and the default containers
+        # built once at import stay shared by all requests and by the gunicorn workers forked from the master
         if container_params is None:
             container_params = self._DEFAULT_CONTAINER_PARAMS
-        return container_params
+        return dict(container_params)
@@ -0,0 +1,100 @@
+import heapq
+from collections import defaultdict
+from typing import DefaultDict, Iterable, List, Set, Tuple
+
+from src.items.container import Container
+from src.parameters.container_parameters import ContainerParameters
+
+Box = Tuple[int, int, int, int, int, int]
+
+
+class LoadingOrderResolver:
+    """
+    Loading order derived from the final placements without loading the container again. A shipment has to be
+    loaded after the shipments it rests on and after the shipments it touches from the door side.
+    Among shipments which can be loaded, the one with the least (x, y, z) goes first, so the container
+    is still loaded wall by wall from the back.
+    """
+    _BUCKETS: int = 16
+
+    _bucket_length: int
+
+    def __init__(self, container_params: ContainerParameters) -> None:
+        self._bucket_length = max(1, -(-container_params.length // self._BUCKETS))
+
+    def resolve(self, container: Container) -> List[int]:
+        points_and_ids = sorted(container.min_point_to_id.items(), key=lambda item: (item[0].x, item[0].y, item[0].z))
+        boxes = []
+        for point, shipment_id in points_and_ids:
+            shipment_params = container.id_to_shipment[shipment_id].parameters
+            boxes.append((
+                point.x,
+                point.y,
+                point.z,
+                point.x + shipment_params.get_loading_length() - 1,
+                point.y + shipment_params.get_loading_width() - 1,
+                point.z + shipment_params.height - 1))
+
+        next_boxes = self._find_next_boxes(boxes)
+        preceding_counts = [0] * len(boxes)
+        for i in range(len(boxes)):
+            for j in next_boxes[i]:
+                preceding_counts[j] += 1
+
+        # Boxes are sorted, so the least box left is the next one when a cycle blocks all of them
+        loading_order = []
+        loaded = [False] * len(boxes)
+        ready = [i for i, count in enumerate(preceding_counts) if count == 0]
+        least_left = 0
+        while len(loading_order) < len(boxes):
+            if not ready:
+                while loaded[least_left]:
+                    least_left += 1
+                ready.append(least_left)
+            i = heapq.heappop(ready)
+            if loaded[i]:
+                continue
+            loaded[i] = True
+            loading_order.append(points_and_ids[i][1])
+            for j in next_boxes[i]:
+                preceding_counts[j] -= 1
+                if preceding_counts[j] == 0 and not loaded[j]:
+                    heapq.heappush(ready, j)
+        return loading_order
+
+    def _find_next_boxes(self, boxes: List[Box]) -> List[Set[int]]:
+        """Boxes resting on every box and boxes touching it from the door side."""
+        next_boxes = [set() for _ in boxes]
+
+        bottoms: DefaultDict[Tuple[int, int], List[int]] = defaultdict(list)
+        backs: DefaultDict[int, List[int]] = defaultdict(list)
+        for i, (x, y, z, max_x, max_y, max_z) in enumerate(boxes):
+            for bucket in self._get_buckets(x, max_x):
+                bottoms[(z, bucket)].append(i)
+            backs[x].append(i)
+
+        for i, (x, y, z, max_x, max_y, max_z) in enumerate(boxes):
+            for j in self._iterate_candidates(bottoms, max_z + 1, self._get_buckets(x, max_x)):
+                other = boxes[j]
+                if other[0] <= max_x and x <= other[3] and other[1] <= max_y and y <= other[4]:
+                    next_boxes[i].add(j)
+            for j in backs.get(max_x + 1, ()):
+                other = boxes[j]
+                if other[1] <= max_y and y <= other[4] and other[2] <= max_z and z <= other[5]:
+                    next_boxes[i].add(j)
+        return next_boxes
+
+    def _get_buckets(self, min_x: int, max_x: int) -> range:
+        return range(self._compute_bucket(min_x), self._compute_bucket(max_x) + 1)
+
+    def _compute_bucket(self, x: int) -> int:
+        return min(self._BUCKETS - 1, x // self._bucket_length)
+
+    @staticmethod
+    def _iterate_candidates(
+            index: DefaultDict[Tuple[int, int], List[int]],
+            z: int,
+            buckets: Iterable[int]
+    ) -> Iterable[int]:
+        for bucket in buckets:
+            yield from index.get((z, bucket), ())
@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional
+
+from src.loading.orientation_table import OrientationTable
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TrialPruner:
+    """
+    Upper bounds of the volume trial loads of container types can reach with the shipments left: the bound
+    is the least of the container volume and the volume of fitting shipments within the lifting capacity.
+    Trials are run from the highest bound, and a trial is not needed when its container type can no longer
+    be selected, that is its bound is below the best loaded volume or an earlier container type
+    has already taken all shipments. Loaded volumes are compared as the selection does:
+    the largest one wins and the earlier container type wins a tie.
+    """
+    # Bounds are sums of floats, so they are widened before comparing
+    _BOUND_TOLERANCE: float = 1e-9
+    _MAX_EXACT_VOLUME: float = 2.0 ** 53
+
+    _shipment_params: Dict[ShipmentParameters, int]
+    _bounds: List[float]
+    _exact: bool
+    _best_index: Optional[int]
+    _best_volume: float
+    _best_takes_all: bool
+
+    def __init__(
+            self,
+            shipment_params: Dict[ShipmentParameters, int],
+            container_params: List[ContainerParameters],
+            orientation_table: OrientationTable
+    ) -> None:
+        self._shipment_params = {params: count for params, count in shipment_params.items() if count > 0}
+        self._bounds = [self._compute_bound(params, orientation_table) for params in container_params]
+        self._exact = self._volumes_are_exact()
+        self._best_index = None
+        self._best_volume = 0
+        self._best_takes_all = False
+
+    @property
+    def bounds(self) -> List[float]:
+        return self._bounds
+
+    def order(self) -> List[int]:
+        """Indexes of container types from the highest bound, container types which can load nothing are left out."""
+        indexes = [i for i, bound in enumerate(self._bounds) if bound > 0]
+        return sorted(indexes, key=lambda i: -self._bounds[i])
+
+    def can_win(self, index: int) -> bool:
+        if self._best_index is None:
+            return self._bounds[index] > 0
+        if self._bounds[index] * (1 + self._BOUND_TOLERANCE) < self._best_volume:
+            return False
+        # Equal volumes are only certain when all loading volumes are whole numbers
+        if self._best_takes_all and self._exact and index > self._best_index:
+            return False
+        return True
+
+    def add_trial(self, index: int, loaded_volume: float, shipment_counts: Dict[ShipmentParameters, int]) -> None:
+        if loaded_volume <= 0:
+            return
+        if self._best_index is not None:
+            if loaded_volume < self._best_volume:
+                return
+            if loaded_volume == self._best_volume and index > self._best_index:
+                return
+        self._best_index = index
+        self._best_volume = loaded_volume
+        self._best_takes_all = all(
+            shipment_counts.get(params, 0) >= count for params, count in self._shipment_params.items())
+
+    def _compute_bound(self, container_params: ContainerParameters, orientation_table: OrientationTable) -> float:
+        fitting = []
+        max_volume_share = 0
+        for shipment_params, count in self._shipment_params.items():
+            orientations = orientation_table.get(shipment_params)
+            if shipment_params.weight > container_params.lifting_capacity:
+                continue
+            sizes = [
+                (length, width, height) for length, width, height in orientations.sizes
+                if length <= container_params.length and width <= container_params.width
+                and height <= container_params.height
+            ]
+            if not sizes:
+                continue
+            loading_volume = max(v.compute_loading_volume() for v in orientations.variations)
+            fitting.append((shipment_params.weight, count, loading_volume))
+            # Loading volumes may be a little larger than the volume taken in the container
+            taken_volume = min(length * width * height for length, width, height in sizes)
+            max_volume_share = max(max_volume_share, loading_volume / taken_volume)
+
+        # Fractional knapsack of the shipments by volume per weight is the most a lifting capacity can take
+        fitting.sort(key=lambda f: -f[2] / f[0] if f[0] > 0 else float('-inf'))
+        capacity_left = container_params.lifting_capacity
+        volume = 0
+        for weight, count, loading_volume in fitting:
+            if weight * count <= capacity_left:
+                volume += loading_volume * count
+                capacity_left -= weight * count
+            else:
+                volume += loading_volume * capacity_left / weight
+                break
+        return min(volume, container_params.compute_volume() * max_volume_share)
+
+    def _volumes_are_exact(self) -> bool:
+        total = 0
+        for shipment_params, count in self._shipment_params.items():
+            for variation in shipment_params.get_volume_params_variations():
+                loading_volume = variation.compute_loading_volume()
+                if not float(loading_volume).is_integer():
+                    return False
+            total += shipment_params.compute_loading_volume() * count
+        return total < self._MAX_EXACT_VOLUME
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+from src.loading.point.places_array import Size
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+@dataclass(frozen=True)
+class Orientations:
+    """
+    Distinct orientations of one shipment params in the order they are tried, with their loading length,
+    loading width and height.
+    """
+    variations: Tuple[ShipmentParameters, ...]
+    sizes: Tuple[Size, ...]
+    weight: int
+
+
+class OrientationTable:
+    """Orientations of all shipment params of a request, built once so loading never recomputes them."""
+    _orientations: Dict[ShipmentParameters, Orientations]
+
+    def __init__(self, shipment_params: Iterable[ShipmentParameters]) -> None:
+        self._orientations = {params: self._create_orientations(params) for params in shipment_params}
+
+    def get(self, shipment_params: ShipmentParameters) -> Orientations:
+        orientations = self._orientations.get(shipment_params)
+        if orientations is None:
+            orientations = self._orientations[shipment_params] = self._create_orientations(shipment_params)
+        return orientations
+
+    @staticmethod
+    def _create_orientations(shipment_params: ShipmentParameters) -> Orientations:
+        variations = tuple(shipment_params.get_volume_params_variations())
+        sizes = tuple((v.get_loading_length(), v.get_loading_width(), v.height) for v in variations)
+        return Orientations(variations, sizes, shipment_params.weight)
@@ -0,0 +1,69 @@
+from collections import deque
+from enum import IntEnum
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TraceEvent(IntEnum):
+    CONTAINER_TRIAL = 1
+    SHIPMENT_LOADED = 2
+    BLOCK_LOADED = 3
+    SHIPMENT_NOT_LOADED = 4
+    CONTAINER_SELECTED = 5
+    ORDER_LOADED = 6
+    CONTAINER_SKIPPED = 7
+
+
+class PlacementTrace:
+    """
+    Ring buffer of the last placement decisions of one calculation. Events are stored as plain tuples
+    and described only when dumped, so tracing costs one append per decision. Dumps are JSON lists
+    which can be turned into a readable log later.
+    """
+    _TEMPLATES: Dict[str, str] = {
+        TraceEvent.CONTAINER_TRIAL.name: 'Trial load into {0}',
+        TraceEvent.SHIPMENT_LOADED.name: 'Loaded {0} to ({1}, {2}, {3})',
+        TraceEvent.BLOCK_LOADED.name: 'Loaded block {4}x{5}x{6} of {0} to ({1}, {2}, {3})',
+        TraceEvent.SHIPMENT_NOT_LOADED.name: 'No place for {0}, left {1}',
+        TraceEvent.CONTAINER_SELECTED.name: 'Selected {0} with loaded volume {1}',
+        TraceEvent.ORDER_LOADED.name: 'Loading order: {0} to ({1}, {2}, {3})',
+        TraceEvent.CONTAINER_SKIPPED.name: 'Skipped trial load into {0} with loaded volume bound {1}'
+    }
+
+    _events: Deque[Tuple]
+    _added: int
+
+    def __init__(self, capacity: int = 10000) -> None:
+        self._events = deque(maxlen=capacity)
+        self._added = 0
+
+    def add(self, event: TraceEvent, *values: Any) -> None:
+        self._events.append((event, *values))
+        self._added += 1
+
+    def dump(self) -> Dict[str, Any]:
+        """Kept events as [event name, values...] and the number of older events dropped from the buffer."""
+        return {
+            'events': [[event.name] + [self._describe(value) for value in values] for event, *values in self._events],
+            'dropped': self._added - len(self._events)
+        }
+
+    def format(self) -> List[str]:
+        return list(self.format_dump(self.dump()))
+
+    @staticmethod
+    def format_dump(dump: Dict[str, Any]) -> Iterator[str]:
+        if dump['dropped'] > 0:
+            yield f'... {dump["dropped"]} earlier events dropped'
+        for name, *values in dump['events']:
+            yield PlacementTrace._TEMPLATES[name].format(*values)
+
+    @staticmethod
+    def _describe(value: Any) -> Any:
+        if isinstance(value, ShipmentParameters):
+            return f'{value.name} {value.length}x{value.width}x{value.height}'
+        if isinstance(value, ContainerParameters):
+            return value.name
+        return value
@@ -0,0 +1,37 @@
+from bisect import bisect_left
+from typing import Callable, Iterator, List, Tuple
+
+from src.loading.point.point import Point
+
+
+class OrderedPoints:
+    """Points kept sorted by an order key, updated in place on every insert and remove."""
+    _key: Callable[[Point], Tuple]
+    _keys: List[Tuple]
+    _points: List[Point]
+
+    def __init__(self, key: Callable[[Point], Tuple]) -> None:
+        self._key = key
+        self._keys = []
+        self._points = []
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._points)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._points.clear()
+
+    def add(self, point: Point) -> None:
+        key = self._key(point)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._points.insert(i, point)
+
+    def remove(self, point: Point) -> None:
+        i = bisect_left(self._keys, self._key(point))
+        del self._keys[i]
+        del self._points[i]
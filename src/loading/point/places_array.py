@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.loading.loading_type import LoadingType
+from src.loading.point.point import Point
+
+Size = Tuple[int, int, int]
+
+
+class PlacesArray:
+    """
+    NumPy mirror of free places: opening points and sizes of all places are kept in one slot array,
+    so the places fitting any of several sizes are found with a few array operations.
+    Free slots have a negative size and never fit. Order keys are computed on coordinate columns
+    and packed into one integer, which needs coordinates below 2 ** 21.
+    """
+    _INITIAL_CAPACITY: int = 256
+    _COORDINATE_BITS: int = 21
+
+    _order_keys: Dict[LoadingType, Callable[[Point], Tuple]]
+    _slots: Dict[Tuple[Point, Point], int]
+    _free_slots: List[int]
+    _size: int
+    _opening_points: List[Optional[Point]]
+    _places: 'np.ndarray'
+
+    def __init__(self, order_keys: Dict[LoadingType, Callable[[Point], Tuple]]) -> None:
+        self._order_keys = order_keys
+        self._slots = {}
+        self._free_slots = []
+        self._size = 0
+        self._opening_points = [None] * self._INITIAL_CAPACITY
+        self._places = self._create_places(self._INITIAL_CAPACITY)
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._free_slots.clear()
+        self._places[:self._size, 3:] = -1
+        self._opening_points[:self._size] = [None] * self._size
+        self._size = 0
+
+    def add(self, opening_p: Point, closing_p: Point) -> None:
+        place = (opening_p, closing_p)
+        if place in self._slots:
+            return
+        slot = self._free_slots.pop() if self._free_slots else self._allocate_slot()
+        self._slots[place] = slot
+        self._opening_points[slot] = opening_p
+        x, y, z = opening_p.x, opening_p.y, opening_p.z
+        self._places[slot] = (x, y, z, closing_p.x - x + 1, closing_p.y - y + 1, closing_p.z - z + 1)
+
+    def discard(self, opening_p: Point, closing_p: Point) -> None:
+        slot = self._slots.pop((opening_p, closing_p), None)
+        if slot is None:
+            return
+        self._opening_points[slot] = None
+        self._places[slot, 3:] = -1
+        self._free_slots.append(slot)
+
+    def find_fitting(self, sizes: Sequence[Size]) -> 'np.ndarray':
+        """Mask of (size, slot) pairs where the place of the slot is large enough for the size."""
+        sizes = np.asarray(sizes, dtype=np.int64)
+        return (self._places[np.newaxis, :self._size, 3:] >= sizes[:, np.newaxis]).all(axis=2)
+
+    def select_opening_point(self, sizes: Sequence[Size], loading_type: LoadingType) -> Optional[Tuple[int, Point]]:
+        """
+        Index of the first size fitting any place and the first opening point in the loading type order
+        among the places it fits.
+        """
+        for i, fitting in enumerate(self.find_fitting(sizes)):
+            slots = np.flatnonzero(fitting)
+            if len(slots) > 0:
+                slot = slots[self._compute_packed_order_keys(slots, loading_type).argmin()]
+                return i, self._opening_points[slot]
+        return None
+
+    def _compute_packed_order_keys(self, slots: 'np.ndarray', loading_type: LoadingType) -> 'np.ndarray':
+        opening_ps = self._places[slots, :3]
+        columns = SimpleNamespace(x=opening_ps[:, 0], y=opening_ps[:, 1], z=opening_ps[:, 2])
+        packed = np.zeros(len(slots), dtype=np.int64)
+        for column in self._order_keys[loading_type](columns):
+            packed = (packed << self._COORDINATE_BITS) | column
+        return packed
+
+    def _allocate_slot(self) -> int:
+        if self._size == len(self._opening_points):
+            self._grow()
+        self._size += 1
+        return self._size - 1
+
+    def _grow(self) -> None:
+        capacity = len(self._opening_points)
+        self._opening_points.extend([None] * capacity)
+        self._places = np.concatenate([self._places, self._create_places(capacity)])
+
+    @staticmethod
+    def _create_places(capacity: int) -> 'np.ndarray':
+        return np.full((capacity, 6), -1, dtype=np.int64)
@@ -0,0 +1,176 @@
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Set, Tuple, Sequence, Optional
+
+from src.loading.point.ordered_points import OrderedPoints
+from src.loading.point.places_array import PlacesArray
+from src.loading.point.point import Point
+from src.parameters.util_parameters.volume_parameters import VolumeParameters
+
+
+class PlacesIndex:
+    """
+    Free places stored as opening point -> closing points. Every opening point is also bucketed by its z-level
+    and by the slices of container length covered by its places, so the places touching an area
+    are found without scanning the whole container. Opening points with places are mirrored into
+    the given ordered points and places into the given places array.
+    """
+    _BUCKETS: int = 16
+
+    _bucket_length: int
+    _places: Dict[Point, Set[Point]]
+    _order: Dict[Point, int]
+    _next_order: int
+    _buckets: Dict[Point, Tuple[int, int]]
+    _levels: DefaultDict[int, DefaultDict[int, Set[Point]]]
+    _touched: Set[Point]
+    _ordered_points: Sequence[OrderedPoints]
+    _places_array: Optional[PlacesArray]
+
+    def __init__(
+            self,
+            params: VolumeParameters,
+            ordered_points: Sequence[OrderedPoints] = (),
+            places_array: Optional[PlacesArray] = None
+    ) -> None:
+        self._bucket_length = max(1, -(-params.length // self._BUCKETS))
+        self._places = {}
+        self._order = {}
+        self._next_order = 0
+        self._buckets = {}
+        self._levels = defaultdict(lambda: defaultdict(set))
+        self._touched = set()
+        self._ordered_points = ordered_points
+        self._places_array = places_array
+
+    @property
+    def places(self) -> Dict[Point, Set[Point]]:
+        return self._places
+
+    def clear(self) -> None:
+        self._places.clear()
+        self._order.clear()
+        self._buckets.clear()
+        self._levels.clear()
+        self._touched.clear()
+        for ordered_points in self._ordered_points:
+            ordered_points.clear()
+        if self._places_array is not None:
+            self._places_array.clear()
+
+    def attach_places_array(self, places_array: Optional[PlacesArray]) -> None:
+        """Mirrors all places into the given places array from now on, or stops mirroring them for None."""
+        self._places_array = places_array
+        if places_array is None:
+            return
+        places_array.clear()
+        for opening_p, closing_ps in self._places.items():
+            for closing_p in closing_ps:
+                places_array.add(opening_p, closing_p)
+
+    def get_opening_points(self) -> List[Point]:
+        return list(self._places.keys())
+
+    def get_closing_points(self, opening_p: Point) -> Set[Point]:
+        closing_ps = self._places.get(opening_p)
+        if closing_ps is None:
+            # Looked up points take a slot in the places order until the next prune, as a defaultdict key would
+            closing_ps = self._create(opening_p)
+            self._touched.add(opening_p)
+        return closing_ps
+
+    def add(self, opening_p: Point, closing_p: Point) -> None:
+        closing_ps = self._places.get(opening_p)
+        if closing_ps is None:
+            closing_ps = self._create(opening_p)
+        closing_ps.add(closing_p)
+        if self._places_array is not None:
+            self._places_array.add(opening_p, closing_p)
+
+        buckets = self._buckets.get(opening_p)
+        if buckets is None:
+            self._index(opening_p, closing_ps)
+            for ordered_points in self._ordered_points:
+                ordered_points.add(opening_p)
+        elif self._compute_bucket(closing_p.x) > buckets[1]:
+            self._index(opening_p, closing_ps)
+
+    def remove(self, opening_p: Point, closing_p: Point) -> None:
+        self._places[opening_p].remove(closing_p)
+        self._touched.add(opening_p)
+        if self._places_array is not None:
+            self._places_array.discard(opening_p, closing_p)
+
+    def discard(self, opening_p: Point, closing_ps: Set[Point]) -> None:
+        self._places[opening_p] -= closing_ps
+        self._touched.add(opening_p)
+        if self._places_array is not None:
+            for closing_p in closing_ps:
+                self._places_array.discard(opening_p, closing_p)
+
+    def prune(self) -> None:
+        """
+        Drops opening points left without places and shrinks the indexed range of the others.
+        Removals are applied lazily so that an opening point emptied and refilled within one update
+        keeps its position.
+        """
+        for opening_p in self._touched:
+            closing_ps = self._places.get(opening_p)
+            if closing_ps is None:
+                continue
+            if closing_ps:
+                self._index(opening_p, closing_ps)
+                continue
+            if opening_p in self._buckets:
+                self._unindex(opening_p)
+                for ordered_points in self._ordered_points:
+                    ordered_points.remove(opening_p)
+            self._places.pop(opening_p)
+            self._order.pop(opening_p)
+        self._touched.clear()
+
+    def find(self, z: int, min_x: int, max_x: int) -> List[Point]:
+        """Opening points on z-level which places may cross the [min_x, max_x] slice, in insertion order."""
+        level = self._levels.get(z)
+        if not level:
+            return []
+        found = set()
+        for i in range(self._compute_bucket(min_x), self._compute_bucket(max_x) + 1):
+            opening_ps = level.get(i)
+            if opening_ps:
+                found |= opening_ps
+        return sorted(found, key=self._order.__getitem__)
+
+    def _create(self, opening_p: Point) -> Set[Point]:
+        closing_ps = self._places[opening_p] = set()
+        self._order[opening_p] = self._next_order
+        self._next_order += 1
+        return closing_ps
+
+    def _index(self, opening_p: Point, closing_ps: Set[Point]) -> None:
+        buckets = (
+            self._compute_bucket(opening_p.x),
+            self._compute_bucket(max(closing_p.x for closing_p in closing_ps))
+        )
+        if self._buckets.get(opening_p) == buckets:
+            return
+        self._unindex(opening_p)
+        self._buckets[opening_p] = buckets
+        level = self._levels[opening_p.z]
+        for i in range(buckets[0], buckets[1] + 1):
+            level[i].add(opening_p)
+
+    def _unindex(self, opening_p: Point) -> None:
+        buckets = self._buckets.pop(opening_p, None)
+        if buckets is None:
+            return
+        level = self._levels[opening_p.z]
+        for i in range(buckets[0], buckets[1] + 1):
+            opening_ps = level[i]
+            opening_ps.discard(opening_p)
+            if not opening_ps:
+                level.pop(i)
+        if not level:
+            self._levels.pop(opening_p.z)
+
+    def _compute_bucket(self, x: int) -> int:
+        return min(self._BUCKETS - 1, max(0, x // self._bucket_length))
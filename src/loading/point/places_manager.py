@@ -1,7 +1,14 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import DefaultDict, Set, List, Tuple, Optional
+from itertools import islice
+from typing import ClassVar, DefaultDict, Set, List, Tuple, Optional, Dict, Iterable, Sequence
 
+from src.iterators.horizontal_points_iterator import HorizontalPointsIterator
+from src.iterators.vertical_points_iterator import VerticalPointsIterator
+from src.loading.loading_type import LoadingType
+from src.loading.point.ordered_points import OrderedPoints
+from src.loading.point.places_array import PlacesArray, Size
+from src.loading.point.places_index import PlacesIndex
 from src.loading.point.point import Point
 from src.loading.point.points_update_info_resolver import PointsUpdateInfoResolver
 from src.parameters.util_parameters.volume_parameters import VolumeParameters
@@ -9,28 +16,82 @@ from src.parameters.util_parameters.volume_parameters import VolumeParameters
 
 @dataclass
 class PlacesManager:
+    """
+    Free places of a container. Stored points are interned, so places share equal points and lookups
+    of stored points are answered by identity. Interned points are rebuilt from the stored ones
+    once there are several times more of them.
+
+    Places are mirrored into a places array only while there are at least min array places opening points,
+    since keeping the array in sync costs more than scanning a few places. The mirror is dropped once
+    they fall below half of that, and never made for None or without numpy.
+    """
+    _SCANNED_OPENING_POINTS: ClassVar[int] = 8
+    _INTERNED_POINTS_FACTOR: ClassVar[int] = 4
+    MIN_ARRAY_PLACES: ClassVar[int] = 128
+
     _params: VolumeParameters
     _points_update_info_resolver: PointsUpdateInfoResolver
-    _places: DefaultDict[Point, Set[Point]] = field(init=False, default_factory=lambda: defaultdict(set))
+    _min_array_places: Optional[int] = MIN_ARRAY_PLACES
+    _places: PlacesIndex = field(init=False)
+    _ordered_opening_points: Dict[LoadingType, OrderedPoints] = field(init=False)
+    _places_array: Optional[PlacesArray] = field(init=False)
+    _is_array_attached: bool = field(init=False)
+    _interned_points: Dict[Point, Point] = field(init=False)
 
     def __post_init__(self):
+        order_keys = {
+            LoadingType.COMPACT: VerticalPointsIterator.get_point_order_key,
+            LoadingType.STABLE: HorizontalPointsIterator.get_point_order_key
+        }
+        self._ordered_opening_points = {
+            loading_type: OrderedPoints(order_key) for loading_type, order_key in order_keys.items()
+        }
+        with_places_array = self._min_array_places is not None and PlacesArray.is_available()
+        self._places_array = PlacesArray(order_keys) if with_places_array else None
+        self._places = PlacesIndex(self._params, list(self._ordered_opening_points.values()))
         self.reset()
 
     @property
-    def places(self) -> DefaultDict[Point, Set[Point]]:
-        return self._places
+    def places(self) -> Dict[Point, Set[Point]]:
+        return self._places.places
+
+    @property
+    def is_array_attached(self) -> bool:
+        return self._is_array_attached
 
     def reset(self) -> None:
         opening_point = Point(0, 0, 0)
         closing_point = Point(self._params.length - 1, self._params.width - 1, self._params.height - 1)
+        self._interned_points = {}
+        self._is_array_attached = False
+        self._places.attach_places_array(None)
         self._places.clear()
-        self._places[opening_point].add(closing_point)
+        self._places.add(self._intern(opening_point), self._intern(closing_point))
+        self._update_places_array()
 
     def get_opening_points(self) -> List[Point]:
-        return list(self._places.keys())
+        return self._places.get_opening_points()
+
+    def get_ordered_opening_points(self, loading_type: LoadingType) -> Iterable[Point]:
+        return self._ordered_opening_points[loading_type]
 
     def get_closing_points(self, point: Point) -> Set[Point]:
-        return self._places[point]
+        return self._places.get_closing_points(point)
+
+    def select_opening_point(self, sizes: Sequence[Size], loading_type: LoadingType) -> Optional[Tuple[int, Point]]:
+        """
+        Index of the first size fitting into any place and the first opening point in the loading type order
+        of the places it fits. The first opening points are scanned directly since the first size
+        usually fits one of them, the rest is left to the places array while it is attached.
+        """
+        opening_ps = self._ordered_opening_points[loading_type]
+        if not self._is_array_attached:
+            return self._scan_opening_points(sizes, opening_ps)
+
+        selected = self._scan_opening_points(sizes[:1], islice(opening_ps, self._SCANNED_OPENING_POINTS))
+        if selected is not None:
+            return selected
+        return self._places_array.select_opening_point(sizes, loading_type)
 
     def update(self, used_opening_p: Point, used_closing_p: Point, with_top_places: bool) -> None:
         points_update_info = self._points_update_info_resolver.resolve(self._places, used_opening_p, used_closing_p)
@@ -45,9 +106,10 @@ class PlacesManager:
         if with_top_places:
             self._update_top_places(used_opening_p, used_closing_p, points_update_info.top_border_points)
 
-        for opening_p in self.get_opening_points():
-            if len(self._places[opening_p]) == 0:
-                self._places.pop(opening_p)
+        self._places.prune()
+        self._update_places_array()
+        if len(self._interned_points) > self._INTERNED_POINTS_FACTOR * len(self._places.places):
+            self._reintern_points()
 
     def _update_bottom_places(
             self,
@@ -58,7 +120,7 @@ class PlacesManager:
     ) -> None:
         for opening_p, closing_ps in places.items():
             for closing_p in closing_ps:
-                self._places[opening_p].remove(closing_p)
+                self._places.remove(opening_p, closing_p)
                 if opening_p.x < used_opening_p.x:
                     new_closing_p = closing_p.with_x(used_opening_p.x - 1)
                     self._insert_bottom_place(opening_p, new_closing_p, border_places)
@@ -88,10 +150,10 @@ class PlacesManager:
 
         for border_opening_p, border_closing_ps in border_places_to_remove.items():
             border_places[border_opening_p] -= border_closing_ps
-            self._places[border_opening_p] -= border_closing_ps
+            self._places.discard(border_opening_p, border_closing_ps)
 
         border_places[new_opening_p].add(new_closing_p)
-        self._places[new_opening_p].add(new_closing_p)
+        self._places.add(self._intern(new_opening_p), self._intern(new_closing_p))
 
     def _update_top_places(
             self,
@@ -111,7 +173,7 @@ class PlacesManager:
         for border_opening_p, border_closing_ps in border_places.items():
             for border_closing_p in border_closing_ps:
                 if self._should_remove_place(border_opening_p, border_closing_p, extension_places):
-                    self._places[border_opening_p].remove(border_closing_p)
+                    self._places.remove(border_opening_p, border_closing_p)
 
         self._save_places(extension_places)
 
@@ -176,7 +238,42 @@ class PlacesManager:
     def _save_places(self, places: DefaultDict[Point, Set[Point]]) -> None:
         for opening_p, closing_ps in places.items():
             for closing_p in closing_ps:
-                self._places[opening_p].add(closing_p)
+                self._places.add(self._intern(opening_p), self._intern(closing_p))
+
+    def _scan_opening_points(self, sizes: Sequence[Size], opening_ps: Iterable[Point]) -> Optional[Tuple[int, Point]]:
+        opening_ps = list(opening_ps)
+        for i, (length, width, height) in enumerate(sizes):
+            for opening_p in opening_ps:
+                for closing_p in self._places.get_closing_points(opening_p):
+                    if closing_p.x - opening_p.x + 1 < length:
+                        continue
+                    if closing_p.y - opening_p.y + 1 < width:
+                        continue
+                    if closing_p.z - opening_p.z + 1 < height:
+                        continue
+                    return i, opening_p
+        return None
+
+    def _update_places_array(self) -> None:
+        if self._places_array is None:
+            return
+        opening_points = len(self._places.places)
+        if not self._is_array_attached and opening_points >= self._min_array_places:
+            self._places.attach_places_array(self._places_array)
+            self._is_array_attached = True
+        elif self._is_array_attached and opening_points < self._min_array_places // 2:
+            self._places.attach_places_array(None)
+            self._is_array_attached = False
+
+    def _intern(self, point: Point) -> Point:
+        return self._interned_points.setdefault(point, point)
+
+    def _reintern_points(self) -> None:
+        self._interned_points = {}
+        for opening_p, closing_ps in self._places.places.items():
+            self._intern(opening_p)
+            for closing_p in closing_ps:
+                self._intern(closing_p)
 
     @staticmethod
     def _place_is_inside(p: Point, max_p: Point, other_p: Point, other_max_p: Point) -> bool:
@@ -1,23 +1,14 @@
-from typing import Dict
+from typing import Dict, NamedTuple
 
 
-class Point:
-    def __init__(self, x: int, y: int, z: int) -> None:
-        self._x = x
-        self._y = y
-        self._z = z
-
-    @property
-    def x(self):
-        return self._x
-
-    @property
-    def y(self):
-        return self._y
-
-    @property
-    def z(self):
-        return self._z
+class Point(NamedTuple):
+    """
+    Immutable point backed by a tuple, so coordinates, hashing and equality are done in C.
+    Order comparisons are overridden and hold only if they hold for every coordinate.
+    """
+    x: int
+    y: int
+    z: int
 
     def with_x(self, x: int) -> 'Point':
         return Point(x, self.y, self.z)
@@ -28,25 +19,17 @@ class Point:
     def with_z(self, z: int) -> 'Point':
         return Point(self.x, self.y, z)
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Point):
-            return self.x == other.x and self.y == other.y and self.z == other.z
-        return False
-
     def __lt__(self, other: 'Point') -> bool:
-        return self._x < other.x and self._y < other.y and self._z < other.z
+        return self.x < other.x and self.y < other.y and self.z < other.z
 
     def __gt__(self, other: 'Point') -> bool:
-        return self._x > other.x and self._y > other.y and self._z > other.z
+        return self.x > other.x and self.y > other.y and self.z > other.z
 
     def __le__(self, other: 'Point') -> bool:
-        return self._x <= other.x and self._y <= other.y and self._z <= other.z
+        return self.x <= other.x and self.y <= other.y and self.z <= other.z
 
     def __ge__(self, other: 'Point') -> bool:
-        return self._x >= other.x and self._y >= other.y and self._z >= other.z
-
-    def __hash__(self):
-        return hash((self.x, self.y, self.z))
+        return self.x >= other.x and self.y >= other.y and self.z >= other.z
 
     def __str__(self):
         return f'Point: ({self.x}, {self.y}, {self.z})'
@@ -1,6 +1,6 @@
 from collections import defaultdict
-from typing import DefaultDict, Set
 
+from src.loading.point.places_index import PlacesIndex
 from src.loading.point.point import Point
 from src.loading.point.points_update_info import PointsUpdateInfo
 
@@ -8,7 +8,7 @@ from src.loading.point.points_update_info import PointsUpdateInfo
 class PointsUpdateInfoResolver:
     def resolve(
             self,
-            points: DefaultDict[Point, Set[Point]],
+            places: PlacesIndex,
             used_opening_p: Point,
             used_closing_p: Point
     ) -> PointsUpdateInfo:
@@ -17,26 +17,28 @@ class PointsUpdateInfoResolver:
         Top slots can be extended with new area on top of new shipment.
         Other slots are not affected since shipment can be placed only on top of another shipment or ground
         and there are no slots hanging in between.
+        Only slots of the two affected z-levels around the shipment footprint are looked up in the index.
         """
 
         bottom_points = defaultdict(set)
         bottom_border_points = defaultdict(set)
         top_border_points = defaultdict(set)
 
-        for opening_p, closing_ps in points.items():
-            if not self._opening_point_meets_update(opening_p, used_opening_p, used_closing_p):
-                continue
-            for closing_p in closing_ps:
-                if not self._closing_point_meets_update(closing_p, used_opening_p):
+        for z in (used_opening_p.z, used_closing_p.z + 1):
+            for opening_p in places.find(z, used_opening_p.x - 1, used_closing_p.x + 1):
+                if not self._opening_point_meets_update(opening_p, used_opening_p, used_closing_p):
                     continue
-
-                if opening_p.z == used_opening_p.z:
-                    if self._is_border_point(opening_p, closing_p, used_opening_p, used_closing_p):
-                        bottom_border_points[opening_p].add(closing_p)
+                for closing_p in places.get_closing_points(opening_p):
+                    if not self._closing_point_meets_update(closing_p, used_opening_p):
+                        continue
+
+                    if opening_p.z == used_opening_p.z:
+                        if self._is_border_point(opening_p, closing_p, used_opening_p, used_closing_p):
+                            bottom_border_points[opening_p].add(closing_p)
+                        else:
+                            bottom_points[opening_p].add(closing_p)
                     else:
-                        bottom_points[opening_p].add(closing_p)
-                else:
-                    top_border_points[opening_p].add(closing_p)
+                        top_border_points[opening_p].add(closing_p)
 
         return PointsUpdateInfo(bottom_points, bottom_border_points, top_border_points)
 
@@ -0,0 +1,31 @@
+from enum import Enum
+from typing import List
+
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class ShipmentOrdering(Enum):
+    """Orders in which shipment params are loaded, the default one is used unless a request asks for another."""
+    DEFAULT = 1
+    VOLUME = 2
+    FOOTPRINT = 3
+    WEIGHT = 4
+
+    @staticmethod
+    def from_name(name: str) -> 'ShipmentOrdering':
+        return ShipmentOrdering[name.upper()]
+
+    def sort(self, shipment_params: List[ShipmentParameters]) -> List[ShipmentParameters]:
+        return sorted(shipment_params, key=self._get_order_key, reverse=True)
+
+    def _get_order_key(self, shipment_params: ShipmentParameters) -> List:
+        # Ties are broken by the default order
+        key = [shipment_params.form_type == 'barrel', shipment_params.weight, shipment_params.can_stack]
+        key += shipment_params.get_volume_params_sorted()
+        if self == ShipmentOrdering.VOLUME:
+            return [shipment_params.compute_volume()] + key
+        if self == ShipmentOrdering.FOOTPRINT:
+            return [shipment_params.compute_area()] + key
+        if self == ShipmentOrdering.WEIGHT:
+            return [shipment_params.weight, shipment_params.compute_volume()] + key
+        return key
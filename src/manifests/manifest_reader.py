@@ -0,0 +1,181 @@
+import json
+import os
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+from src.parameters.util_parameters.volume_parameters import VolumeParameters
+
+Columns = Dict[str, List[Any]]
+
+
+class ManifestReader:
+    """
+    Reads shipment and container manifests from xlsx, csv or parquet files, parquet needs pyarrow.
+    Columns of the whole manifest are validated and converted at once. The converted columns are cached
+    next to the manifest, so a manifest which has not changed since is not parsed again.
+    """
+    _CACHE_VERSION: int = 2
+    _SHIPMENT_COLUMNS: List[str] = [
+        'Name', 'Cargo type', 'Length (cm)', 'Width / Diameter for barrels (cm)', 'Height (cm)', 'Weight (kg)',
+        'Stack', 'Turn over (height)', 'Turn over (length)', 'Turn over (width)', 'Extension', 'Q-ty'
+    ]
+    _CONTAINER_COLUMNS: List[str] = ['Name', 'Length', 'Width', 'Height', 'Lifting capacity', 'Quantity']
+
+    _colors: List[str]
+    _use_cache: bool
+
+    def __init__(self, colors: List[str], use_cache: bool = True) -> None:
+        self._colors = colors
+        self._use_cache = use_cache
+
+    def read_shipment_counts(self, file_path: str) -> Dict[ShipmentParameters, int]:
+        columns = self._read_columns(file_path, 'shipments', self._SHIPMENT_COLUMNS, self._convert_shipment_columns)
+        shipment_params = map(
+            ShipmentParameters,
+            columns['name'],
+            columns['form_type'],
+            columns['length'],
+            columns['width'],
+            columns['height'],
+            columns['weight'],
+            random.choices(self._colors, k=len(columns['name'])),
+            columns['can_stack'],
+            columns['height_as_height'],
+            columns['length_as_height'],
+            columns['width_as_height'],
+            columns['extension'])
+        return dict(zip(shipment_params, columns['count']))
+
+    def read_container_counts(self, file_path: str) -> Dict[ContainerParameters, int]:
+        columns = self._read_columns(
+            file_path, 'containers', self._CONTAINER_COLUMNS, self._convert_container_columns)
+        container_params = map(
+            ContainerParameters,
+            columns['name'],
+            columns['length'],
+            columns['width'],
+            columns['height'],
+            columns['lifting_capacity'])
+        return dict(zip(container_params, columns['count']))
+
+    def _read_columns(
+            self,
+            file_path: str,
+            kind: str,
+            required_columns: List[str],
+            convert: Callable[[pd.DataFrame], Columns]
+    ) -> Columns:
+        cache_path = os.path.join(
+            os.path.dirname(file_path), f'.{os.path.basename(file_path)}.{kind}.cache')
+        stat = os.stat(file_path)
+        cache_key = [self._CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+        if self._use_cache:
+            columns = self._load_cache(cache_path, cache_key)
+            if columns is not None:
+                logger.debug(f'Read cached {kind} of {file_path}')
+                return columns
+
+        df = self._read_frame(file_path, required_columns)
+        logger.debug(f'Read df from {file_path}')
+        missing_columns = [column for column in required_columns if column not in df.columns]
+        if missing_columns:
+            raise ValueError(f'{file_path} has no columns {missing_columns}')
+        columns = convert(df)
+
+        if self._use_cache:
+            self._save_cache(cache_path, cache_key, columns)
+        return columns
+
+    @staticmethod
+    def _read_frame(file_path: str, required_columns: List[str]) -> pd.DataFrame:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.csv':
+            return pd.read_csv(file_path, usecols=lambda column: column in required_columns)
+        if extension == '.parquet':
+            return pd.read_parquet(file_path)
+        return pd.read_excel(file_path, usecols=lambda column: column in required_columns)
+
+    def _convert_shipment_columns(self, df: pd.DataFrame) -> Columns:
+        form_types = df['Cargo type'].astype(str)
+        # Barrels are given by their diameter, which is both their length and width
+        widths = self._to_numbers(df, 'Width / Diameter for barrels (cm)')
+        lengths = pd.Series(
+            np.where(form_types == 'barrel', widths, pd.to_numeric(df['Length (cm)'], errors='coerce')),
+            index=df.index)
+        self._check_numbers(lengths, 'Length (cm)')
+        extensions = pd.to_numeric(df['Extension'], errors='coerce').fillna(VolumeParameters.DEFAULT_EXTENSION * 100)
+        return {
+            'name': df['Name'].astype(str).tolist(),
+            'form_type': form_types.tolist(),
+            'length': self._to_millimeters(lengths),
+            'width': self._to_millimeters(widths),
+            'height': self._to_millimeters(self._to_numbers(df, 'Height (cm)')),
+            'weight': self._to_numbers(df, 'Weight (kg)').tolist(),
+            'can_stack': df['Stack'].notna().tolist(),
+            'height_as_height': df['Turn over (height)'].notna().tolist(),
+            'length_as_height': df['Turn over (length)'].notna().tolist(),
+            'width_as_height': df['Turn over (width)'].notna().tolist(),
+            'extension': (extensions / 100).tolist(),
+            'count': self._to_counts(df, 'Q-ty')
+        }
+
+    def _convert_container_columns(self, df: pd.DataFrame) -> Columns:
+        return {
+            'name': df['Name'].astype(str).tolist(),
+            'length': self._to_numbers(df, 'Length').round().astype('int64').tolist(),
+            'width': self._to_numbers(df, 'Width').round().astype('int64').tolist(),
+            'height': self._to_numbers(df, 'Height').round().astype('int64').tolist(),
+            'lifting_capacity': self._to_numbers(df, 'Lifting capacity').tolist(),
+            'count': self._to_counts(df, 'Quantity')
+        }
+
+    def _to_numbers(self, df: pd.DataFrame, column: str) -> pd.Series:
+        numbers = pd.to_numeric(df[column], errors='coerce')
+        self._check_numbers(numbers, column)
+        return numbers
+
+    @staticmethod
+    def _check_numbers(numbers: pd.Series, column: str) -> None:
+        invalid = numbers.isna()
+        if invalid.any():
+            # Rows are numbered as in the manifest, where the first row is the header
+            rows = (numbers.index[invalid.to_numpy()] + 2).tolist()
+            raise ValueError(f'Column {column} has no numbers in rows {rows[:10]}')
+
+    @staticmethod
+    def _to_millimeters(centimeters: pd.Series) -> List[int]:
+        return (centimeters * 10).round().astype('int64').tolist()
+
+    def _to_counts(self, df: pd.DataFrame, column: str) -> List[int]:
+        counts = self._to_numbers(df, column)
+        if (counts < 0).any():
+            raise ValueError(f'Column {column} has negative counts')
+        return counts.astype('int64').tolist()
+
+    @staticmethod
+    def _load_cache(cache_path: str, cache_key: List[int]) -> Optional[Columns]:
+        # Caches are json, so a broken or foreign file is only parsed again
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get('key') != cache_key or not isinstance(cache.get('columns'), dict):
+            return None
+        return cache['columns']
+
+    @staticmethod
+    def _save_cache(cache_path: str, cache_key: List[int], columns: Columns) -> None:
+        temporary_path = f'{cache_path}.{os.getpid()}'
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'columns': columns}, f)
+            os.replace(temporary_path, cache_path)
+        except OSError as e:
+            logger.warning(f'Could not cache the manifest at {cache_path}: {e}')
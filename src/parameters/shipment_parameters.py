@@ -94,15 +94,19 @@ class ShipmentParameters(VolumeParameters, NameParameters):
         }
 
     def _create_volume_params_variations(self) -> None:
+        volume_params = []
         if self.height_as_height:
-            self._variations.append(self.with_volume_params(self.length, self.width, self.height))
-            self._variations.append(self.with_volume_params(self.width, self.length, self.height))
+            volume_params.append((self.length, self.width, self.height))
+            volume_params.append((self.width, self.length, self.height))
         if self.length_as_height:
-            self._variations.append(self.with_volume_params(self.height, self.width, self.length))
-            self._variations.append(self.with_volume_params(self.width, self.height, self.length))
+            volume_params.append((self.height, self.width, self.length))
+            volume_params.append((self.width, self.height, self.length))
         if self.width_as_height:
-            self._variations.append(self.with_volume_params(self.length, self.height, self.width))
-            self._variations.append(self.with_volume_params(self.height, self.length, self.width))
+            volume_params.append((self.length, self.height, self.width))
+            volume_params.append((self.height, self.length, self.width))
+        # Square sides and barrels give the same orientation more than once
+        for length, width, height in dict.fromkeys(volume_params):
+            self._variations.append(self.with_volume_params(length, width, height))
 
         if not self.can_stack:
             self._variations.sort(key=lambda v: [v.height, v.length, v.width], reverse=True)
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 class Parameters(ABC):
+    """Parameters never change once created, so the key and the hash are computed once."""
+    _cached_key: Optional[Tuple] = None
+    _cached_hash: Optional[int] = None
 
     @abstractmethod
     def _key(self) -> Tuple:
@@ -13,9 +16,18 @@ class Parameters(ABC):
         ...
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if isinstance(other, type(self)):
-            return self._key() == other._key()
+            return self._get_key() == other._get_key()
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._key())
+        if self._cached_hash is None:
+            self._cached_hash = hash(self._get_key())
+        return self._cached_hash
+
+    def _get_key(self) -> Tuple:
+        if self._cached_key is None:
+            self._cached_key = self._key()
+        return self._cached_key
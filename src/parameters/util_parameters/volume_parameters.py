@@ -12,12 +12,18 @@ class VolumeParameters(Parameters):
     _width: int
     _height: int
     _extension: float
+    _loading_length: int
+    _loading_width: int
+    _loading_volume: float
 
     def __init__(self, length: int, width: int, height: int, extension: float) -> None:
         self._length = length
         self._width = width
         self._height = height
         self._extension = extension
+        self._loading_length = int(length * math.sqrt((1 + extension)))
+        self._loading_width = int(width * math.sqrt((1 + extension)))
+        self._loading_volume = length * width * (1 + extension) * height
 
     @staticmethod
     def from_points(point: Point, max_point: Point) -> 'VolumeParameters':
@@ -49,13 +55,13 @@ class VolumeParameters(Parameters):
         return self._extension
 
     def get_loading_length(self) -> int:
-        return int(self.length * math.sqrt((1 + self._extension)))
+        return self._loading_length
 
     def get_length_diff(self) -> float:
         return self.get_loading_length() - self.length
 
     def get_loading_width(self) -> int:
-        return int(self.width * math.sqrt((1 + self._extension)))
+        return self._loading_width
 
     def get_width_diff(self) -> float:
         return self.get_loading_width() - self.width
@@ -70,7 +76,7 @@ class VolumeParameters(Parameters):
         return self.compute_area() * self.height
 
     def compute_loading_volume(self) -> float:
-        return self.compute_loading_area() * self.height
+        return self._loading_volume
 
     def _key(self) -> Tuple:
         return self.length, self.width, self.height, self.extension
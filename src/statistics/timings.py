@@ -0,0 +1,44 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+
+class Timings:
+    """Durations of the phases of one calculation and of every container trial made in it."""
+    _phases: Dict[str, float]
+    _container_trials: List[Tuple[str, float]]
+
+    def __init__(self) -> None:
+        self._phases = {}
+        self._container_trials = []
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return self._phases
+
+    @property
+    def container_trials(self) -> List[Tuple[str, float]]:
+        return self._container_trials
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Adds the duration of the block to the phase, so a phase may be measured in several parts."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        self._phases[phase] = self._phases.get(phase, 0) + seconds
+
+    def add_container_trial(self, container_type: str, seconds: float) -> None:
+        self._container_trials.append((container_type, seconds))
+
+    def build_response(self) -> Dict:
+        container_trials = {}
+        for container_type, seconds in self._container_trials:
+            container_trial = container_trials.setdefault(container_type, {'count': 0, 'seconds': 0})
+            container_trial['count'] += 1
+            container_trial['seconds'] += seconds
+        return {'phases': dict(self._phases), 'container_trials': container_trials}
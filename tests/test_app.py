@@ -0,0 +1,183 @@
+import json
+import os
+import tempfile
+import unittest
+
+try:
+    import flask
+    import loguru
+except ImportError:
+    flask = None
+
+app = None
+directory = None
+cwd = None
+
+
+def setUpModule():
+    # The app keeps its cache, metrics, jobs and logs under the working directory
+    global app, directory, cwd
+    if flask is None:
+        return
+    cwd = os.getcwd()
+    directory = tempfile.TemporaryDirectory()
+    os.chdir(directory.name)
+    import app
+
+
+def tearDownModule():
+    if flask is None:
+        return
+    app.job_worker_pool.stop()
+    os.chdir(cwd)
+    directory.cleanup()
+
+
+def create_request_json(number=10):
+    cargo = {
+        'name': 'box',
+        'type': 'box',
+        'length': 500,
+        'width': 400,
+        'height': 300,
+        'weight': 5,
+        'color': 'red',
+        'stack': True,
+        'height_as_height': True,
+        'length_as_height': False,
+        'width_as_height': False,
+        'number': number
+    }
+    container = {'type': '20DV', 'length': 5898, 'width': 2352, 'height': 2393, 'weight': 28200, 'number': 1}
+    return {'cargo': [cargo], 'containers': [container]}
+
+
+@unittest.skipIf(flask is None, 'flask or loguru is not installed')
+class TestApp(unittest.TestCase):
+    def setUp(self):
+        self._client = app.app.test_client()
+
+    def test_stream(self):
+        request_json = create_request_json(700)
+        request_json['containers'][0]['number'] = 2
+        lines = self._stream(request_json)
+
+        self.assertEqual(len(lines), 3)
+        for line in lines[:-1]:
+            self.assertEqual(line['type'], '20DV')
+            self.assertGreater(len(line['load_points']), 0)
+        self.assertListEqual(list(lines[-1].keys()), ['left_cargos'])
+        loaded_count = sum(len(points) for line in lines[:-1] for points in line['load_points'])
+        left_count = sum(cargo['number'] for cargo in lines[-1]['left_cargos'])
+        self.assertEqual(loaded_count + left_count, 700)
+
+        hits = self._client.get('/cache').json['hits']
+        self.assertListEqual(self._stream(request_json), lines)
+        self.assertEqual(self._client.get('/cache').json['hits'], hits + 1)
+
+    def test_malformed_request(self):
+        for malformed_json in [{'containers': []}, dict(create_request_json(), loading_type='dense'),
+                               dict(create_request_json(), response_format=1)]:
+            response = self._client.post('/calculate', json=malformed_json)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('Malformed request', response.json['error'])
+
+    def test_msgpack_before_and_after_caching(self):
+        if not app.response_encoder.is_msgpack_available():
+            self.skipTest('msgpack is not installed')
+        import msgpack
+
+        hits = self._client.get('/cache').json['hits']
+        headers = {'Accept': app.ResponseEncoder.MSGPACK_MIMETYPE}
+        bodies = [self._client.post('/calculate', json=create_request_json(41), headers=headers).data
+                  for _ in range(2)]
+
+        self.assertEqual(self._client.get('/cache').json['hits'], hits + 1)
+        self.assertEqual(bodies[0], bodies[1])
+        self.assertListEqual(list(msgpack.unpackb(bodies[0])['containers'][0]['cargos']), ['1'])
+
+    def test_stream_malformed_request(self):
+        for malformed_json in [{'containers': []}, dict(create_request_json(), loading_type='dense'),
+                               dict(create_request_json(), response_format=1)]:
+            response = self._client.post('/calculate?stream=true', json=malformed_json)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.json)
+
+    def test_batch(self):
+        request_jsons = [create_request_json(10), {'containers': []}, create_request_json(20)]
+        response = self._client.post('/calculate/batch', json=request_jsons)
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json['results']
+        self.assertEqual(len(results), 3)
+        self.assertIn('error', results[1])
+        self.assertNotIn('response', results[1])
+        for result, number in [(results[0], 10), (results[2], 20)]:
+            load_points = result['response']['containers'][0]['load_points']
+            self.assertEqual(sum(len(points) for points in load_points), number)
+
+    def test_malformed_batch(self):
+        response = self._client.post('/calculate/batch', json=create_request_json())
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json)
+
+        response = self._client.post('/calculate/batch', json=[create_request_json()] * (app.MAX_BATCH_SIZE + 1))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json)
+
+    def test_invalid_time_budget(self):
+        for time_budget in ['60', -1, True, [60]]:
+            request_json = dict(create_request_json(), time_budget=time_budget)
+            for path in ['/calculate', '/calculate?stream=true', '/jobs']:
+                response = self._client.post(path, json=request_json)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('time_budget', response.json['error'])
+
+            # Only the request with the invalid budget fails in a batch
+            response = self._client.post('/calculate/batch', json=[request_json, create_request_json()])
+            self.assertEqual(response.status_code, 200)
+            results = response.json['results']
+            self.assertIn('time_budget', results[0]['error'])
+            self.assertIn('response', results[1])
+
+    def test_batch_time_budget(self):
+        # The budget of the batch caps the budgets of its requests
+        max_time_budget = app.MAX_TIME_BUDGET
+        app.MAX_TIME_BUDGET = 0
+        try:
+            response = self._client.post('/calculate/batch', json=[create_request_json(31), create_request_json(32)])
+        finally:
+            app.MAX_TIME_BUDGET = max_time_budget
+
+        for result in response.json['results']:
+            self.assertTrue(result['response']['truncated'])
+
+    def test_create_job(self):
+        response = self._client.post('/jobs', json=create_request_json())
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json['status'], 'queued')
+        # Web workers leave jobs to the job worker processes
+        self.assertEqual(self._client.get(f'/jobs/{response.json["id"]}').json['status'], 'queued')
+
+    def test_create_malformed_job(self):
+        request_json = create_request_json()
+        del request_json['cargo'][0]['width']
+        for malformed_json in [{'containers': []}, request_json, {'cargo': 'box'}]:
+            response = self._client.post('/jobs', json=malformed_json)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.json)
+
+    def _stream(self, request_json):
+        response = self._client.post('/calculate?stream=true', json=request_json)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        return [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+
+
+if __name__ == '__main__':
+    unittest.main()
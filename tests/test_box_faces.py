@@ -0,0 +1,38 @@
+import unittest
+
+try:
+    import numpy as np
+    from src.box_faces import BoxFaces
+except ImportError:
+    BoxFaces = None
+
+
+@unittest.skipIf(BoxFaces is None, 'numpy is not installed')
+class TestBoxFaces(unittest.TestCase):
+    def test_polygons(self):
+        box_faces = BoxFaces(np.array([[10, 20, 30]]), np.array([[1, 2, 3]]))
+
+        self.assertTupleEqual(box_faces.polygons.shape, (1, 6, 4, 3))
+        self.assertListEqual(
+            box_faces.polygons[0, 5].tolist(), [[10, 22, 33], [10, 20, 33], [11, 20, 33], [11, 22, 33]])
+
+    def test_row(self):
+        box_faces = BoxFaces(np.array([[0, 0, 0], [10, 0, 0]]), np.array([[10, 10, 10], [10, 10, 10]]))
+
+        self.assertEqual(box_faces.hidden_from[0, BoxFaces.MAX_FACES[0]], 1)
+        self.assertEqual(box_faces.hidden_from[1, BoxFaces.MIN_FACES[0]], 0)
+        self.assertEqual(len(box_faces.select_visible(1)[0]), 6)
+        polygons, box_indexes = box_faces.select_visible(2)
+        self.assertEqual(len(polygons), 10)
+        self.assertListEqual(box_indexes.tolist(), [0] * 5 + [1] * 5)
+
+    def test_partly_covered_faces(self):
+        box_faces = BoxFaces(np.array([[0, 0, 0], [0, 0, 10]]), np.array([[20, 20, 10], [10, 10, 10]]))
+
+        self.assertEqual(box_faces.hidden_from[0, BoxFaces.MAX_FACES[2]], BoxFaces.NEVER_HIDDEN)
+        self.assertEqual(box_faces.hidden_from[1, BoxFaces.MIN_FACES[2]], 0)
+        self.assertEqual(len(box_faces.select_visible(2)[0]), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.items.container import Container
+from src.items.shipment import Shipment
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestContainer(unittest.TestCase):
+    def setUp(self):
+        self._container = Container(ContainerParameters('test', 1000, 1000, 1000, 1000), 1)
+        self._shipment_params = ShipmentParameters(
+            'box', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+
+    def test_block_size(self):
+        block_size = self._container.compute_block_size(Point(0, 0, 0), self._shipment_params, 100)
+        self.assertTupleEqual(block_size, (3, 2, 2))
+
+    def test_block_size_limited_by_count(self):
+        block_size = self._container.compute_block_size(Point(0, 0, 0), self._shipment_params, 5)
+        self.assertTupleEqual(block_size, (1, 2, 2))
+
+    def test_block_size_limited_by_weight(self):
+        heavy_shipment_params = ShipmentParameters(
+            'box', 'box', 300, 400, 500, 250, 'red', True, True, False, False, 0)
+        block_size = self._container.compute_block_size(Point(0, 0, 0), heavy_shipment_params, 100)
+        self.assertTupleEqual(block_size, (1, 2, 2))
+
+    def test_block_size_without_stack(self):
+        shipment_params = ShipmentParameters(
+            'box', 'box', 300, 400, 500, 10, 'red', False, True, False, False, 0)
+        block_size = self._container.compute_block_size(Point(0, 0, 0), shipment_params, 100)
+        self.assertTupleEqual(block_size, (3, 2, 1))
+
+    def test_load_block(self):
+        shipments = [Shipment(self._shipment_params, id_) for id_ in range(2, 14)]
+        self._container.load_block(Point(0, 0, 0), shipments, 3, 2, 2)
+
+        self.assertEqual(self._container.container_statistics.shipments, 12)
+        self.assertEqual(self._container.get_loaded_volume(), 12 * self._shipment_params.compute_volume())
+        self.assertSetEqual(
+            set(self._container.min_point_to_id.keys()),
+            {Point(x, y, z) for x in (0, 300, 600) for y in (0, 400) for z in (0, 500)})
+        small_shipment_params = self._shipment_params.with_volume_params(100, 100, 100)
+        self.assertTrue(self._container.can_load_into_point(Point(900, 0, 0), small_shipment_params))
+        self.assertFalse(self._container.can_load_into_point(Point(0, 800, 0), self._shipment_params))
@@ -0,0 +1,38 @@
+import unittest
+
+from src.items.item_fabric import ItemFabric
+from src.loading.container_layout import ContainerLayout
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestContainerLayout(unittest.TestCase):
+    def setUp(self):
+        self._layout = ContainerLayout(ContainerParameters('test', 1000, 1000, 1000, 25))
+        self._shipment_params = ShipmentParameters(
+            'box', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+
+    def test_running_weight(self):
+        self._layout.load(Point(0, 0, 0), self._shipment_params)
+        self._layout.load(Point(300, 0, 0), self._shipment_params)
+
+        self.assertEqual(self._layout.get_loaded_weight(), 20)
+        self.assertFalse(self._layout.can_load_into_point(Point(600, 0, 0), self._shipment_params))
+
+    def test_reset(self):
+        self._layout.load_block(Point(0, 0, 0), self._shipment_params, 2, 1, 1)
+        self._layout.reset()
+
+        self.assertEqual(self._layout.get_loaded_weight(), 0)
+        self.assertEqual(self._layout.get_loaded_volume(), 0)
+        self.assertListEqual(list(self._layout.get_placements()), [])
+        self.assertListEqual(self._layout.get_loadable_points(), [Point(0, 0, 0)])
+
+    def test_create_loaded_container(self):
+        points = self._layout.load_block(Point(0, 0, 0), self._shipment_params, 2, 1, 1)
+        container = ItemFabric().create_loaded_container(self._layout)
+
+        self.assertListEqual(list(container.min_point_to_id.keys()), points)
+        self.assertEqual(container.container_statistics.shipments, 2)
+        self.assertEqual(len(container.loading_order), 2)
@@ -0,0 +1,30 @@
+import pickle
+import unittest
+
+from src.items.item_fabric import ItemFabric
+from src.loading.container_layout import ContainerLayout
+from src.loading.loader.container_trial import ContainerTrial
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestContainerTrial(unittest.TestCase):
+    def test_materialize(self):
+        layout = ContainerLayout(ContainerParameters('test', 1000, 1000, 1000, 1000))
+        shipment_params = ShipmentParameters('box', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+        layout.load(Point(0, 0, 0), shipment_params)
+        layout.load(Point(300, 0, 0), shipment_params)
+        layout.load(Point(0, 0, 500), shipment_params)
+        container = ItemFabric().create_loaded_container(layout)
+
+        trial = pickle.loads(pickle.dumps(ContainerTrial.from_layout(layout, {shipment_params: 3}, 0.5)))
+        materialized_container = trial.materialize(ItemFabric())
+
+        self.assertEqual(trial.loaded_volume, layout.get_loaded_volume())
+        self.assertDictEqual(trial.shipment_counts, {shipment_params: 3})
+        self.assertEqual(trial.duration, 0.5)
+        self.assertEqual(materialized_container.get_loaded_volume(), container.get_loaded_volume())
+        self.assertListEqual(
+            [materialized_container.id_to_min_point_shifted[id_] for id_ in materialized_container.loading_order],
+            [container.id_to_min_point_shifted[id_] for id_ in container.loading_order])
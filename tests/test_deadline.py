@@ -0,0 +1,41 @@
+import pickle
+import unittest
+
+from src.loading.loader.deadline import Deadline
+
+
+class TestDeadline(unittest.TestCase):
+    def test_without_budget(self):
+        self.assertFalse(Deadline().expired())
+
+    def test_time_budget(self):
+        self.assertTrue(Deadline(0).expired())
+        self.assertFalse(Deadline(60).expired())
+
+    def test_cancellation_is_checked_once_an_interval(self):
+        checks = []
+        deadline = Deadline(is_cancelled=lambda: checks.append(True) or True)
+        self.assertFalse(deadline.expired())
+        self.assertListEqual(checks, [])
+
+        deadline._next_cancellation_check = 0
+        self.assertTrue(deadline.expired())
+        self.assertTrue(deadline.expired())
+        self.assertListEqual(checks, [True])
+
+    def test_pickled_deadline_keeps_time_budget(self):
+        deadline = pickle.loads(pickle.dumps(Deadline(0, is_cancelled=lambda: False)))
+        self.assertTrue(deadline.expired())
+
+    def test_pickled_deadline_keeps_time_left(self):
+        deadline = Deadline(60)
+        deadline._end -= 30
+        time_left = pickle.loads(pickle.dumps(deadline)).get_time_left()
+
+        self.assertLessEqual(time_left, 30)
+        self.assertGreater(time_left, 29)
+        self.assertIsNone(Deadline().get_time_left())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import struct
+import unittest
+from array import array
+
+from src.api.point_columns import PointColumns
+from src.gltf_exporter import GltfExporter
+from src.loading.point.point import Point
+
+
+class TestGltfExporter(unittest.TestCase):
+    def setUp(self):
+        self._exporter = GltfExporter()
+        self._points = [(0, 0, 0), (400, 0, 0), (800, 0, 0), (0, 300, 0)]
+        cargos = {
+            '1': {'name': 'box', 'color': '#ff0000', 'length': 400, 'width': 300, 'height': 200},
+            '2': {'name': 'crate', 'color': 'blue', 'length': 500, 'width': 500, 'height': 500}
+        }
+        self._response = {
+            'containers': [{
+                'type': '20DV',
+                'length': 5898,
+                'width': 2352,
+                'height': 2393,
+                'cargos': cargos,
+                'load_points': [
+                    [{'cargo_id': 1, 'x': x, 'y': y, 'z': z} for x, y, z in self._points],
+                    [{'cargo_id': 2, 'x': 0, 'y': 0, 'z': 200}]
+                ]
+            }],
+            'left_cargos': []
+        }
+
+    def test_glb_layout(self):
+        glb = self._exporter.export_response(self._response)
+        gltf, binary = self._parse(glb)
+
+        self.assertEqual(len(glb) % 4, 0)
+        self.assertEqual(gltf['buffers'][0]['byteLength'], len(binary))
+        self.assertIn('EXT_mesh_gpu_instancing', gltf['extensionsRequired'])
+        for buffer_view in gltf['bufferViews']:
+            self.assertEqual(buffer_view['byteOffset'] % 4, 0)
+            self.assertLessEqual(buffer_view['byteOffset'] + buffer_view['byteLength'], len(binary))
+
+    def test_instances(self):
+        gltf, binary = self._parse(self._exporter.export_response(self._response))
+
+        self.assertEqual(len(gltf['scenes']), 1)
+        self.assertEqual(len(gltf['meshes']), 3)
+        translations = {node['name']: self._read_translations(gltf, binary, node) for node in gltf['nodes']
+                        if 'extensions' in node}
+        self.assertListEqual(translations['box'], self._points)
+        self.assertListEqual(translations['crate'], [(0, 0, 200)])
+
+    def test_columnar_response(self):
+        columnar_response = json.loads(json.dumps(self._response))
+        container_response = columnar_response['containers'][0]
+        container_response['load_points'] = [
+            PointColumns.from_points([Point(*point) for point in self._points]).build_response(1),
+            PointColumns.from_points([Point(0, 0, 200)]).build_response(2)
+        ]
+
+        self.assertEqual(
+            self._exporter.export_response(columnar_response), self._exporter.export_response(self._response))
+
+    def test_size_does_not_grow_with_faces(self):
+        small_size = len(self._exporter.export_response(self._response))
+        self._response['containers'][0]['load_points'][0] = [
+            {'cargo_id': 1, 'x': x, 'y': 0, 'z': 0} for x in range(0, 100 * 400, 400)]
+        large_size = len(self._exporter.export_response(self._response))
+
+        # Only the translations and a few digits of offsets in the json grow
+        self.assertLess(large_size - small_size, (100 - len(self._points)) * 12 + 32)
+
+    def test_no_containers(self):
+        gltf, binary = self._parse(self._exporter.export_response({'containers': [], 'left_cargos': []}))
+
+        self.assertNotIn('scene', gltf)
+        self.assertNotIn('nodes', gltf)
+        self.assertEqual(len(binary), 0)
+
+    @staticmethod
+    def _parse(glb):
+        magic, version, length = struct.unpack_from('<4sII', glb)
+        assert magic == b'glTF' and version == 2 and length == len(glb)
+        json_length, json_type = struct.unpack_from('<I4s', glb, 12)
+        assert json_type == b'JSON'
+        if len(glb) == 20 + json_length:
+            return json.loads(glb[20:]), b''
+        binary_length, binary_type = struct.unpack_from('<I4s', glb, 20 + json_length)
+        assert binary_type == b'BIN\0'
+        binary = glb[28 + json_length:]
+        assert len(binary) == binary_length
+        return json.loads(glb[20:20 + json_length]), binary
+
+    @staticmethod
+    def _read_translations(gltf, binary, node):
+        accessor = gltf['accessors'][node['extensions']['EXT_mesh_gpu_instancing']['attributes']['TRANSLATION']]
+        buffer_view = gltf['bufferViews'][accessor['bufferView']]
+        start = buffer_view['byteOffset']
+        values = array('f', binary[start:start + buffer_view['byteLength']])
+        return [tuple(int(value) for value in values[i:i + 3]) for i in range(0, len(values), 3)]
+
+
+if __name__ == '__main__':
+    unittest.main()
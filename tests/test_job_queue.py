@@ -0,0 +1,129 @@
+import os
+import tempfile
+import time
+import unittest
+from abc import ABC, abstractmethod
+
+from src.jobs.in_process_job_queue import InProcessJobQueue
+from src.jobs.job import JobStatus
+from src.jobs.sqlite_job_queue import SqliteJobQueue
+
+try:
+    from src.jobs.job_worker_pool import JobWorkerPool
+except ImportError:
+    JobWorkerPool = None
+
+
+class JobQueueTests(ABC):
+    @abstractmethod
+    def create_job_queue(self):
+        pass
+
+    def test_claim_in_submit_order(self):
+        job_queue = self.create_job_queue()
+        first_job_id = job_queue.submit({'cargo': [1]})
+        second_job_id = job_queue.submit({'cargo': [2]})
+
+        job = job_queue.claim()
+        self.assertEqual(job.id, first_job_id)
+        self.assertEqual(job.status, JobStatus.RUNNING)
+        self.assertDictEqual(job.request, {'cargo': [1]})
+        self.assertEqual(job_queue.claim().id, second_job_id)
+        self.assertIsNone(job_queue.claim())
+
+    def test_progress_and_complete(self):
+        job_queue = self.create_job_queue()
+        job_id = job_queue.submit({'cargo': []})
+        self.assertEqual(job_queue.get(job_id).status, JobStatus.QUEUED)
+
+        job_queue.claim()
+        job_queue.update_progress(job_id, {'loaded_containers': 1, 'left_cargo_count': 5})
+        job = job_queue.get(job_id)
+        self.assertEqual(job.status, JobStatus.RUNNING)
+        self.assertDictEqual(job.progress, {'loaded_containers': 1, 'left_cargo_count': 5})
+
+        job_queue.complete(job_id, {'containers': []})
+        job = job_queue.get(job_id)
+        self.assertEqual(job.status, JobStatus.DONE)
+        self.assertDictEqual(job.build_response()['response'], {'containers': []})
+
+    def test_fail(self):
+        job_queue = self.create_job_queue()
+        job_id = job_queue.submit({'cargo': []})
+        job_queue.claim()
+        job_queue.fail(job_id, 'error')
+
+        self.assertEqual(job_queue.get(job_id).status, JobStatus.FAILED)
+        self.assertEqual(job_queue.get(job_id).error, 'error')
+
+    def test_unknown_job(self):
+        self.assertIsNone(self.create_job_queue().get('unknown'))
+
+
+class TestInProcessJobQueue(JobQueueTests, unittest.TestCase):
+    def create_job_queue(self):
+        return InProcessJobQueue()
+
+
+class TestSqliteJobQueue(JobQueueTests, unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'jobs.sqlite')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def create_job_queue(self, **kwargs):
+        return SqliteJobQueue(self._path, **kwargs)
+
+    def test_shared_between_instances(self):
+        job_id = self.create_job_queue().submit({'cargo': []})
+        self.assertEqual(self.create_job_queue().claim().id, job_id)
+
+    def test_expired_lease(self):
+        job_queue = self.create_job_queue(lease=-1, max_attempts=2)
+        job_id = job_queue.submit({'cargo': []})
+
+        self.assertEqual(job_queue.claim().id, job_id)
+        self.assertEqual(job_queue.claim().id, job_id)
+        self.assertIsNone(job_queue.claim())
+        self.assertEqual(job_queue.get(job_id).status, JobStatus.FAILED)
+
+    def test_refreshed_lease(self):
+        job_queue = self.create_job_queue(lease=0.2)
+        job_id = job_queue.submit({'cargo': []})
+        job_queue.claim()
+        time.sleep(0.3)
+        job_queue.refresh_lease(job_id)
+
+        self.assertIsNone(job_queue.claim())
+
+
+@unittest.skipIf(JobWorkerPool is None, 'loguru is not installed')
+class TestJobWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_lease_refreshed_while_job_runs(self):
+        job_queue = SqliteJobQueue(os.path.join(self._directory.name, 'jobs.sqlite'), lease=0.3)
+        job_id = job_queue.submit({'cargo': []})
+        claims = []
+
+        def handle(request, on_container_loaded):
+            for _ in range(4):
+                time.sleep(0.2)
+                claims.append(job_queue.claim())
+            return {'containers': []}
+
+        job_worker_pool = JobWorkerPool(job_queue, handle, poll_interval=0.05, heartbeat_interval=0.05)
+        job_worker_pool.start()
+        try:
+            while job_queue.get(job_id).status != JobStatus.DONE:
+                time.sleep(0.05)
+        finally:
+            job_worker_pool.stop()
+
+        self.assertListEqual(claims, [None] * 4)
@@ -1,5 +1,7 @@
 import unittest
 
+from src.loading.loading_type import LoadingType
+from src.loading.point.places_array import PlacesArray
 from src.loading.point.point import Point
 from src.loading.point.places_manager import PlacesManager
 from src.loading.point.points_update_info_resolver import PointsUpdateInfoResolver
@@ -97,3 +99,56 @@ class TestLoadablePointsManager(unittest.TestCase):
         for opening_p, closing_ps in self._places_manager.places.items():
             self.assertTrue(opening_p in expected_places)
             self.assertSetEqual(closing_ps, expected_places[opening_p])
+
+    def test_ordered_opening_points(self):
+        self._places_manager.update(Point(0, 0, 0), Point(2, 2, 2), True)
+        self._places_manager.update(Point(3, 0, 0), Point(5, 2, 2), True)
+        self._places_manager.update(Point(0, 3, 0), Point(2, 5, 2), False)
+
+        opening_points = self._places_manager.get_opening_points()
+        self.assertListEqual(
+            list(self._places_manager.get_ordered_opening_points(LoadingType.COMPACT)),
+            sorted(opening_points, key=lambda p: (p.x, p.y, p.z)))
+        self.assertListEqual(
+            list(self._places_manager.get_ordered_opening_points(LoadingType.STABLE)),
+            sorted(opening_points, key=lambda p: (p.z, p.x, p.y)))
+
+    def test_select_opening_point(self):
+        self._places_manager.update(Point(0, 0, 0), Point(2, 2, 2), True)
+
+        sizes = [(2000, 1, 1), (3, 3, 3)]
+        self.assertTupleEqual(
+            self._places_manager.select_opening_point(sizes, LoadingType.COMPACT), (1, Point(0, 0, 3)))
+        self.assertTupleEqual(
+            self._places_manager.select_opening_point(sizes, LoadingType.STABLE), (1, Point(0, 3, 0)))
+        self.assertIsNone(self._places_manager.select_opening_point(sizes[:1], LoadingType.COMPACT))
+
+    @unittest.skipUnless(PlacesArray.is_available(), 'numpy is not installed')
+    def test_places_array_from_min_places(self):
+        places_manager = PlacesManager(VolumeParameters(1000, 1000, 1000, 0), PointsUpdateInfoResolver(), 4)
+        loads = [(Point(0, 0, 0), Point(2, 2, 2), True), (Point(3, 0, 0), Point(5, 2, 2), True)]
+        for opening_p, closing_p, with_top_places in loads:
+            places_manager.update(opening_p, closing_p, with_top_places)
+            self._places_manager.update(opening_p, closing_p, with_top_places)
+        self.assertFalse(places_manager.is_array_attached)
+
+        places_manager.update(Point(0, 3, 0), Point(2, 5, 2), False)
+        self._places_manager.update(Point(0, 3, 0), Point(2, 5, 2), False)
+        self.assertTrue(places_manager.is_array_attached)
+        sizes = [(2000, 1, 1), (998, 994, 3), (3, 3, 3)]
+        for loading_type in LoadingType:
+            self.assertTupleEqual(
+                places_manager.select_opening_point(sizes, loading_type),
+                self._places_manager.select_opening_point(sizes, loading_type))
+
+        places_manager.reset()
+        self.assertFalse(places_manager.is_array_attached)
+
+    def test_interned_points(self):
+        self._places_manager.update(Point(0, 0, 0), Point(2, 2, 2), True)
+        self._places_manager.update(Point(3, 0, 0), Point(5, 2, 2), True)
+
+        points = {}
+        for opening_p, closing_ps in self._places_manager.places.items():
+            for point in (opening_p, *closing_ps):
+                self.assertIs(points.setdefault(point, point), point)
@@ -0,0 +1,40 @@
+import unittest
+
+from src.items.container import Container
+from src.items.shipment import Shipment
+from src.loading.loader.loading_order_resolver import LoadingOrderResolver
+from src.loading.point.point import Point
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestLoadingOrderResolver(unittest.TestCase):
+    def setUp(self):
+        self._container = Container(ContainerParameters('test', 1000, 1000, 1000, 1000), 1)
+        self._shipment_params = ShipmentParameters(
+            'box', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+
+    def test_wall_by_wall(self):
+        wide_shipment_params = self._shipment_params.with_volume_params(300, 800, 500)
+        self._container.load(Point(300, 0, 0), Shipment(self._shipment_params, 2))
+        self._container.load(Point(0, 400, 0), Shipment(self._shipment_params, 3))
+        self._container.load(Point(0, 0, 500), Shipment(wide_shipment_params, 4))
+        self._container.load(Point(0, 0, 0), Shipment(self._shipment_params, 5))
+
+        loading_order_resolver = LoadingOrderResolver(self._container.parameters)
+        self.assertListEqual(loading_order_resolver.resolve(self._container), [5, 3, 4, 2])
+
+    def test_door_side_neighbour(self):
+        # The shipment at x = 0 rests on a plank which rests on a shipment far from it,
+        # the tall one touching it from the door side still has to wait for it
+        container = Container(ContainerParameters('test', 2000, 1000, 1000, 1000), 1)
+        container.load(Point(1000, 0, 0), Shipment(self._shipment_params.with_volume_params(300, 200, 500), 2))
+        container.load(Point(200, 0, 500), Shipment(self._shipment_params.with_volume_params(1100, 200, 100), 3))
+        container.load(Point(0, 0, 600), Shipment(self._shipment_params.with_volume_params(400, 400, 200), 4))
+        container.load(Point(400, 200, 0), Shipment(self._shipment_params.with_volume_params(300, 200, 1000), 5))
+
+        loading_order_resolver = LoadingOrderResolver(container.parameters)
+        self.assertListEqual(loading_order_resolver.resolve(container), [2, 3, 4, 5])
+
+if __name__ == '__main__':
+    unittest.main()
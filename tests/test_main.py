@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+try:
+    from click.testing import CliRunner
+
+    import main
+except ImportError:
+    main = None
+
+SHIPMENTS_CSV = (
+    'Name,Cargo type,Length (cm),Width / Diameter for barrels (cm),Height (cm),Weight (kg),'
+    'Stack,Turn over (height),Turn over (length),Turn over (width),Extension,Q-ty\n'
+    'box,box,120,80,50,20,x,x,,,0,10\n'
+)
+CONTAINERS_CSV = 'Name,Length,Width,Height,Lifting capacity,Quantity\n20DV,5895,2350,2393,28200,1\n'
+
+
+@unittest.skipIf(main is None, 'click, loguru, matplotlib or pandas is not installed')
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self._directory.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_find_manifests(self):
+        a_shipments_path = self._write('a_shipments.csv', SHIPMENTS_CSV)
+        a_containers_path = self._write('a_containers.csv', CONTAINERS_CSV)
+        b_shipments_path = self._write('b_shipments.csv', SHIPMENTS_CSV)
+        self._write('c_containers.csv', CONTAINERS_CSV)
+        self._write('d_shipments.txt', SHIPMENTS_CSV)
+
+        self.assertListEqual(
+            main.find_manifests(self._directory.name),
+            [(a_shipments_path, a_containers_path), (b_shipments_path, None)])
+        self.assertListEqual(
+            main.find_manifests(os.path.join(self._directory.name, 'b_*')), [(b_shipments_path, None)])
+
+    def test_batch(self):
+        self._write('a_shipments.csv', SHIPMENTS_CSV)
+        self._write('a_containers.csv', CONTAINERS_CSV)
+        self._write('b_shipments.csv', SHIPMENTS_CSV)
+
+        result = CliRunner().invoke(main.cli, ['batch', self._directory.name, '-w', '1'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(os.path.join(self._directory.name, 'a_result.json')) as f:
+            response = json.load(f)
+        self.assertEqual(len(response['containers']), 1)
+        self.assertEqual(response['containers'][0]['type'], '20DV')
+        self.assertTrue(os.path.exists(os.path.join(self._directory.name, 'b_result.json')))
+
+    def test_failed_batch(self):
+        self._write('a_shipments.csv', SHIPMENTS_CSV)
+        self._write('b_shipments.csv', SHIPMENTS_CSV.replace(',120,', ',long,'))
+
+        result = CliRunner().invoke(main.cli, ['batch', self._directory.name, '-w', '1'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('failed', result.output)
+        self.assertTrue(os.path.exists(os.path.join(self._directory.name, 'a_result.json')))
+        self.assertFalse(os.path.exists(os.path.join(self._directory.name, 'b_result.json')))
+
+        result = CliRunner().invoke(main.cli, ['batch', os.path.join(self._directory.name, 'c_*')])
+        self.assertEqual(result.exit_code, 1)
+
+    def test_load_without_command(self):
+        shipments_path = self._write('a_shipments.csv', SHIPMENTS_CSV)
+        containers_path = self._write('a_containers.csv', CONTAINERS_CSV)
+        for command in [[], ['load']]:
+            gltf_path = os.path.join(self._directory.name, f'{len(command)}.glb')
+
+            result = CliRunner().invoke(
+                main.cli, command + ['-s', shipments_path, '-c', containers_path, '-g', gltf_path, '-v', 'ERROR'])
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertTrue(os.path.exists(gltf_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+try:
+    from src.manifests.manifest_reader import ManifestReader
+except ImportError:
+    ManifestReader = None
+
+SHIPMENTS_CSV = (
+    'Name,Cargo type,Length (cm),Width / Diameter for barrels (cm),Height (cm),Weight (kg),'
+    'Stack,Turn over (height),Turn over (length),Turn over (width),Extension,Q-ty\n'
+    'box,box,120,80,50.5,20,x,x,,,5,10\n'
+    'barrel,barrel,,60,90,150,,x,,,0,4\n'
+)
+CONTAINERS_CSV = 'Name,Length,Width,Height,Lifting capacity,Quantity\n20DV,5895,2350,2393,28200,2\n'
+
+
+@unittest.skipIf(ManifestReader is None, 'pandas is not installed')
+class TestManifestReader(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._reader = ManifestReader(['red'])
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self._directory.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_shipments(self):
+        shipment_counts = self._reader.read_shipment_counts(self._write('shipments.csv', SHIPMENTS_CSV))
+
+        (box, box_count), (barrel, barrel_count) = shipment_counts.items()
+        self.assertListEqual([box.length, box.width, box.height, box.weight], [1200, 800, 505, 20])
+        self.assertListEqual([box.can_stack, box.height_as_height, box.length_as_height], [True, True, False])
+        self.assertAlmostEqual(box.extension, 0.05)
+        self.assertEqual(box_count, 10)
+        self.assertListEqual([barrel.length, barrel.width, barrel.height], [600, 600, 900])
+        self.assertFalse(barrel.can_stack)
+        self.assertEqual(barrel_count, 4)
+
+    def test_containers(self):
+        container_counts = self._reader.read_container_counts(self._write('containers.csv', CONTAINERS_CSV))
+
+        (container_params, count), = container_counts.items()
+        self.assertEqual(container_params.name, '20DV')
+        self.assertListEqual(
+            [container_params.length, container_params.width, container_params.height], [5895, 2350, 2393])
+        self.assertEqual(count, 2)
+
+    def test_invalid_numbers(self):
+        path = self._write('shipments.csv', SHIPMENTS_CSV.replace('20,x,x', 'heavy,x,x'))
+        with self.assertRaisesRegex(ValueError, r'Weight \(kg\).*\[2\]'):
+            self._reader.read_shipment_counts(path)
+
+    def test_missing_columns(self):
+        path = self._write('containers.csv', CONTAINERS_CSV.replace(',Quantity', '').replace(',2\n', '\n'))
+        with self.assertRaisesRegex(ValueError, 'Quantity'):
+            self._reader.read_container_counts(path)
+
+    def test_cache(self):
+        path = self._write('containers.csv', CONTAINERS_CSV)
+        self._reader.read_container_counts(path)
+        self.assertTrue(os.path.exists(os.path.join(self._directory.name, '.containers.csv.containers.cache')))
+
+        # The cache is used while the manifest is not modified
+        stat = os.stat(path)
+        self._write('containers.csv', CONTAINERS_CSV.replace(',2\n', ',3\n'))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertListEqual(list(self._reader.read_container_counts(path).values()), [2])
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertListEqual(list(self._reader.read_container_counts(path).values()), [3])
+
+    def test_broken_cache(self):
+        path = self._write('containers.csv', CONTAINERS_CSV)
+        for cache in [b'{"key": [1', b'\x80\x04\x95', b'[1, 2]', b'{"key": null}']:
+            with open(os.path.join(self._directory.name, '.containers.csv.containers.cache'), 'wb') as f:
+                f.write(cache)
+
+            self.assertListEqual(list(self._reader.read_container_counts(path).values()), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
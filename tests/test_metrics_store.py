@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from src.api.metrics_store import MetricsStore
+from src.statistics.timings import Timings
+
+
+class TestMetricsStore(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'metrics.sqlite')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_render_histograms(self):
+        timings = Timings()
+        timings.add_phase('parse', 0.002)
+        timings.add_phase('parse', 0.002)
+        timings.add_container_trial('20DV', 0.3)
+        timings.add_container_trial('20DV', 3)
+        MetricsStore(self._path).record(timings)
+        MetricsStore(self._path).record(timings)
+
+        lines = MetricsStore(self._path).render().splitlines()
+        self.assertIn('# TYPE load_calculator_phase_seconds histogram', lines)
+        self.assertIn('load_calculator_phase_seconds_bucket{phase="parse",le="0.005"} 2', lines)
+        self.assertIn('load_calculator_phase_seconds_count{phase="parse"} 2', lines)
+        self.assertIn('load_calculator_container_trial_seconds_bucket{container_type="20DV",le="0.25"} 0', lines)
+        self.assertIn('load_calculator_container_trial_seconds_bucket{container_type="20DV",le="0.5"} 2', lines)
+        self.assertIn('load_calculator_container_trial_seconds_bucket{container_type="20DV",le="+Inf"} 4', lines)
+        self.assertIn('load_calculator_container_trial_seconds_count{container_type="20DV"} 4', lines)
+
+    def test_escaped_labels(self):
+        timings = Timings()
+        timings.add_container_trial('40"HQ', 1)
+        metrics_store = MetricsStore(self._path)
+        metrics_store.record(timings)
+        self.assertIn('load_calculator_container_trial_seconds_count{container_type="40\\"HQ"} 1',
+                      metrics_store.render().splitlines())
+
+    def test_timings_response(self):
+        timings = Timings()
+        with timings.measure('parse'):
+            pass
+        timings.add_container_trial('20DV', 1)
+        timings.add_container_trial('20DV', 2)
+
+        response = timings.build_response()
+        self.assertSetEqual(set(response['phases'].keys()), {'parse'})
+        self.assertDictEqual(response['container_trials'], {'20DV': {'count': 2, 'seconds': 3}})
@@ -0,0 +1,24 @@
+import unittest
+
+from src.loading.orientation_table import OrientationTable
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestOrientationTable(unittest.TestCase):
+    def test_square_footprint(self):
+        shipment_params = ShipmentParameters('box', 'box', 400, 400, 500, 10, 'red', True, True, False, True, 0)
+        orientations = OrientationTable([shipment_params]).get(shipment_params)
+
+        self.assertTupleEqual(orientations.sizes, ((500, 400, 400), (400, 500, 400), (400, 400, 500)))
+        self.assertEqual(len(orientations.variations), 3)
+        self.assertEqual(orientations.weight, 10)
+
+    def test_loading_sizes(self):
+        shipment_params = ShipmentParameters('box', 'box', 300, 200, 100, 10, 'red', True, True, False, False, 0.21)
+        orientations = OrientationTable([]).get(shipment_params)
+
+        self.assertTupleEqual(orientations.sizes, ((330, 220, 100), (220, 330, 100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
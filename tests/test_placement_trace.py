@@ -0,0 +1,39 @@
+import unittest
+
+from src.loading.placement_trace import PlacementTrace, TraceEvent
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestPlacementTrace(unittest.TestCase):
+    def setUp(self):
+        self.container_params = ContainerParameters('20DV', 5895, 2350, 2393, 28200)
+        self.shipment_params = ShipmentParameters('box', 'box', 1000, 800, 600, 10, 'red', True, True, False, False, 0)
+
+    def test_dump(self):
+        trace = PlacementTrace()
+        trace.add(TraceEvent.CONTAINER_TRIAL, self.container_params)
+        trace.add(TraceEvent.SHIPMENT_LOADED, self.shipment_params, 0, 0, 0)
+        self.assertEqual(
+            {'events': [['CONTAINER_TRIAL', '20DV'], ['SHIPMENT_LOADED', 'box 1000x800x600', 0, 0, 0]], 'dropped': 0},
+            trace.dump())
+
+    def test_capacity(self):
+        trace = PlacementTrace(capacity=2)
+        for x in range(5):
+            trace.add(TraceEvent.SHIPMENT_LOADED, self.shipment_params, x, 0, 0)
+        dump = trace.dump()
+        self.assertEqual(3, dump['dropped'])
+        self.assertEqual([3, 4], [event[2] for event in dump['events']])
+
+    def test_format_dump(self):
+        trace = PlacementTrace(capacity=1)
+        trace.add(TraceEvent.CONTAINER_TRIAL, self.container_params)
+        trace.add(TraceEvent.BLOCK_LOADED, self.shipment_params, 0, 800, 0, 2, 1, 3)
+        self.assertEqual(
+            ['... 1 earlier events dropped', 'Loaded block 2x1x3 of box 1000x800x600 to (0, 800, 0)'],
+            list(PlacementTrace.format_dump(trace.dump())))
+
+
+if __name__ == '__main__':
+    unittest.main()
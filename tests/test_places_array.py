@@ -0,0 +1,44 @@
+import unittest
+
+from src.iterators.horizontal_points_iterator import HorizontalPointsIterator
+from src.iterators.vertical_points_iterator import VerticalPointsIterator
+from src.loading.loading_type import LoadingType
+from src.loading.point.places_array import PlacesArray
+from src.loading.point.point import Point
+
+
+@unittest.skipUnless(PlacesArray.is_available(), 'numpy is not installed')
+class TestPlacesArray(unittest.TestCase):
+    def setUp(self):
+        self._places_array = PlacesArray({
+            LoadingType.COMPACT: VerticalPointsIterator.get_point_order_key,
+            LoadingType.STABLE: HorizontalPointsIterator.get_point_order_key
+        })
+        self._places_array.add(Point(0, 0, 3), Point(2, 2, 999))
+        self._places_array.add(Point(0, 3, 0), Point(999, 999, 999))
+        self._places_array.add(Point(3, 0, 0), Point(999, 999, 999))
+
+    def test_find_fitting(self):
+        fitting = self._places_array.find_fitting([(3, 3, 3), (998, 4, 4)])
+        self.assertListEqual(fitting.tolist(), [[True, True, True], [False, True, False]])
+
+    def test_select_opening_point(self):
+        sizes = [(2000, 1, 1), (3, 3, 3)]
+        self.assertTupleEqual(self._places_array.select_opening_point(sizes, LoadingType.COMPACT), (1, Point(0, 0, 3)))
+        self.assertTupleEqual(self._places_array.select_opening_point(sizes, LoadingType.STABLE), (1, Point(0, 3, 0)))
+
+    def test_discard(self):
+        self._places_array.discard(Point(0, 0, 3), Point(2, 2, 999))
+        self.assertTupleEqual(
+            self._places_array.select_opening_point([(3, 3, 3)], LoadingType.COMPACT), (0, Point(0, 3, 0)))
+
+        self._places_array.add(Point(5, 5, 5), Point(7, 7, 7))
+        self.assertListEqual(self._places_array.find_fitting([(3, 3, 3)]).tolist(), [[True, True, True]])
+
+    def test_grow_and_clear(self):
+        for x in range(300):
+            self._places_array.add(Point(x, 0, 0), Point(x, 0, 0))
+        self.assertEqual(self._places_array.find_fitting([(1, 1, 1)]).sum(), 303)
+
+        self._places_array.clear()
+        self.assertIsNone(self._places_array.select_opening_point([(1, 1, 1)], LoadingType.COMPACT))
@@ -0,0 +1,47 @@
+import unittest
+
+from src.loading.point.places_index import PlacesIndex
+from src.loading.point.point import Point
+from src.parameters.util_parameters.volume_parameters import VolumeParameters
+
+
+class TestPlacesIndex(unittest.TestCase):
+    def setUp(self):
+        self._places_index = PlacesIndex(VolumeParameters(1600, 1000, 1000, 0))
+
+    def test_find_by_level(self):
+        self._places_index.add(Point(0, 0, 0), Point(1599, 999, 999))
+        self._places_index.add(Point(0, 0, 500), Point(99, 99, 999))
+
+        self.assertListEqual(self._places_index.find(0, 0, 10), [Point(0, 0, 0)])
+        self.assertListEqual(self._places_index.find(500, 0, 10), [Point(0, 0, 500)])
+        self.assertListEqual(self._places_index.find(300, 0, 10), [])
+
+    def test_find_by_length_slice(self):
+        self._places_index.add(Point(0, 0, 0), Point(99, 999, 999))
+        self._places_index.add(Point(1000, 0, 0), Point(1599, 999, 999))
+
+        self.assertListEqual(self._places_index.find(0, 1100, 1200), [Point(1000, 0, 0)])
+        self.assertListEqual(self._places_index.find(0, 0, 1599), [Point(0, 0, 0), Point(1000, 0, 0)])
+
+    def test_prune(self):
+        self._places_index.add(Point(0, 0, 0), Point(1599, 999, 999))
+        self._places_index.add(Point(0, 0, 0), Point(99, 999, 999))
+        self._places_index.remove(Point(0, 0, 0), Point(1599, 999, 999))
+        self._places_index.prune()
+
+        self.assertListEqual(self._places_index.find(0, 1000, 1100), [])
+        self.assertListEqual(self._places_index.find(0, 0, 10), [Point(0, 0, 0)])
+
+        self._places_index.remove(Point(0, 0, 0), Point(99, 999, 999))
+        self._places_index.prune()
+
+        self.assertListEqual(self._places_index.get_opening_points(), [])
+        self.assertListEqual(self._places_index.find(0, 0, 10), [])
+
+    def test_lookup_keeps_order(self):
+        self._places_index.get_closing_points(Point(0, 0, 0))
+        self._places_index.add(Point(500, 0, 0), Point(1599, 999, 999))
+        self._places_index.add(Point(0, 0, 0), Point(99, 999, 999))
+
+        self.assertListEqual(self._places_index.find(0, 0, 1599), [Point(0, 0, 0), Point(500, 0, 0)])
@@ -0,0 +1,29 @@
+import unittest
+
+from src.api.point_columns import PointColumns
+from src.loading.point.point import Point
+
+
+class TestPointColumns(unittest.TestCase):
+    def test_equal_steps(self):
+        points = [Point(0, 0, 0), Point(0, 400, 0), Point(0, 800, 0), Point(0, 1200, 0), Point(300, 0, 0)]
+        response = PointColumns.from_points(points).build_response(2)
+
+        self.assertEqual(response['cargo_id'], 2)
+        self.assertEqual(response['count'], 5)
+        self.assertListEqual(response['x'], [0, 0, 300])
+        self.assertListEqual(response['y'], [0, 400, -1200])
+        self.assertListEqual(response['z'], [0, 0, 0])
+        self.assertListEqual(response['runs'], [1, 3, 1])
+        self.assertListEqual(PointColumns.decode(response), points)
+
+    def test_first_point(self):
+        points = [Point(100, 200, 300), Point(200, 400, 600)]
+        response = PointColumns.from_points(points).build_response(1)
+
+        self.assertListEqual(response['runs'], [2])
+        self.assertListEqual(PointColumns.decode(response), points)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from src.api.portfolio_plan import PortfolioPlan
+
+
+class TestPortfolioPlan(unittest.TestCase):
+    @staticmethod
+    def _create_plan(
+            shipment_ordering_name: str,
+            truncated: bool = False,
+            left_count: int = 0,
+            container_count: int = 2,
+            container_volume: int = 100
+    ) -> PortfolioPlan:
+        return PortfolioPlan(
+            'compact', shipment_ordering_name, {}, truncated, left_count, container_count, container_volume, 1.0)
+
+    def test_fewer_containers_win(self):
+        plans = [self._create_plan('default', container_count=3), self._create_plan('volume', container_count=2)]
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'volume')
+
+    def test_less_container_volume_wins(self):
+        plans = [self._create_plan('default', container_volume=120), self._create_plan('weight', container_volume=90)]
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'weight')
+
+    def test_fewer_left_shipments_win(self):
+        plans = [
+            self._create_plan('default', left_count=1, container_count=1),
+            self._create_plan('footprint', container_count=2)
+        ]
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'footprint')
+
+    def test_complete_plan_wins(self):
+        plans = [
+            self._create_plan('default', truncated=True, container_count=1),
+            self._create_plan('volume', container_count=3)
+        ]
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'volume')
+
+    def test_earlier_plan_wins_tie(self):
+        plans = [self._create_plan('default'), self._create_plan('volume')]
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'default')
+        self.assertIsNone(PortfolioPlan.select_best([]))
+
+    def test_failed_plan_is_not_selected(self):
+        failed_plan = PortfolioPlan.create_failed('compact', 'default', 'ValueError: failed')
+        plans = [failed_plan, self._create_plan('volume', truncated=True, left_count=10)]
+
+        self.assertEqual(PortfolioPlan.select_best(plans).shipment_ordering_name, 'volume')
+        self.assertIsNone(PortfolioPlan.select_best([failed_plan]))
+        self.assertDictEqual(
+            failed_plan.build_response(),
+            {'loading_type': 'compact', 'shipment_ordering': 'default', 'error': 'ValueError: failed'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+
+from src.api.request_canonicalizer import RequestCanonicalizer
+from src.api.request_data import RequestData
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestRequestCanonicalizer(unittest.TestCase):
+    def setUp(self):
+        self._request_canonicalizer = RequestCanonicalizer()
+        self._first_shipment_params = ShipmentParameters(
+            'a', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+        self._second_shipment_params = ShipmentParameters(
+            'b', 'box', 300, 400, 500, 10, 'red', True, True, False, False, 0)
+        self._container_params = ContainerParameters('20DV', 5895, 2350, 2393, 28200)
+
+    def test_reordered_requests(self):
+        request_data = RequestData(
+            {self._first_shipment_params: 1, self._second_shipment_params: 2}, None, 'compact', False)
+        reordered_request_data = RequestData(
+            {self._second_shipment_params: 2, self._first_shipment_params: 1}, None, 'COMPACT', False)
+
+        canonical_request_data = self._request_canonicalizer.canonicalize(request_data)
+        canonical_reordered_request_data = self._request_canonicalizer.canonicalize(reordered_request_data)
+
+        self.assertListEqual(
+            list(canonical_reordered_request_data.shipment_params.keys()),
+            [self._first_shipment_params, self._second_shipment_params])
+        self.assertEqual(canonical_reordered_request_data.loading_type_name, 'compact')
+        self.assertEqual(
+            self._request_canonicalizer.compute_hash(canonical_request_data),
+            self._request_canonicalizer.compute_hash(canonical_reordered_request_data))
+
+    def test_default_loading_type(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, None, False)
+        self.assertEqual(self._request_canonicalizer.canonicalize(request_data).loading_type_name, 'compact')
+
+    def test_different_requests(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False)
+        other_requests_data = [
+            RequestData({self._first_shipment_params: 2}, None, 'compact', False),
+            RequestData({self._first_shipment_params: 1}, {self._container_params: 1}, 'compact', False),
+            RequestData({self._first_shipment_params: 1}, None, 'stable', False),
+            RequestData({self._first_shipment_params: 1}, None, 'compact', True),
+            RequestData(
+                {ShipmentParameters('a', 'box', 300, 400, 500, 10, 'red', False, True, False, False, 0): 1},
+                None, 'compact', False),
+        ]
+
+        request_hash = self._request_canonicalizer.compute_hash(request_data)
+        for other_request_data in other_requests_data:
+            self.assertNotEqual(request_hash, self._request_canonicalizer.compute_hash(other_request_data))
+
+    def test_timings_do_not_change_hash(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False)
+        timed_request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False, True)
+
+        canonical_timed_request_data = self._request_canonicalizer.canonicalize(timed_request_data)
+        self.assertTrue(canonical_timed_request_data.with_timings)
+        self.assertEqual(
+            self._request_canonicalizer.compute_hash(self._request_canonicalizer.canonicalize(request_data)),
+            self._request_canonicalizer.compute_hash(canonical_timed_request_data))
+
+    def test_time_budget_does_not_change_hash(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False)
+        budgeted_request_data = RequestData(
+            {self._first_shipment_params: 1}, None, 'compact', False, time_budget=10)
+
+        canonical_budgeted_request_data = self._request_canonicalizer.canonicalize(budgeted_request_data)
+        self.assertEqual(canonical_budgeted_request_data.time_budget, 10)
+        self.assertEqual(
+            self._request_canonicalizer.compute_hash(self._request_canonicalizer.canonicalize(request_data)),
+            self._request_canonicalizer.compute_hash(canonical_budgeted_request_data))
+
+    def test_shipment_ordering_and_portfolio(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False)
+        ordered_request_data = RequestData(
+            {self._first_shipment_params: 1}, None, 'compact', False, shipment_ordering_name='Volume')
+        portfolio_request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False, portfolio=True)
+
+        canonical_request_data = self._request_canonicalizer.canonicalize(request_data)
+        canonical_ordered_request_data = self._request_canonicalizer.canonicalize(ordered_request_data)
+        canonical_portfolio_request_data = self._request_canonicalizer.canonicalize(portfolio_request_data)
+        self.assertEqual(canonical_request_data.shipment_ordering_name, 'default')
+        self.assertEqual(canonical_ordered_request_data.shipment_ordering_name, 'volume')
+        self.assertTrue(canonical_portfolio_request_data.portfolio)
+
+        request_hash = self._request_canonicalizer.compute_hash(canonical_request_data)
+        self.assertNotEqual(request_hash, self._request_canonicalizer.compute_hash(canonical_ordered_request_data))
+        self.assertNotEqual(request_hash, self._request_canonicalizer.compute_hash(canonical_portfolio_request_data))
+
+    def test_response_format(self):
+        request_data = RequestData({self._first_shipment_params: 1}, None, 'compact', False)
+        columnar_request_data = RequestData(
+            {self._first_shipment_params: 1}, None, 'compact', False, response_format_name='COLUMNAR')
+
+        canonical_request_data = self._request_canonicalizer.canonicalize(request_data)
+        canonical_columnar_request_data = self._request_canonicalizer.canonicalize(columnar_request_data)
+        self.assertEqual(canonical_request_data.response_format_name, 'json')
+        self.assertEqual(canonical_columnar_request_data.response_format_name, 'columnar')
+        self.assertNotEqual(
+            self._request_canonicalizer.compute_hash(canonical_request_data),
+            self._request_canonicalizer.compute_hash(canonical_columnar_request_data))
@@ -0,0 +1,50 @@
+import gzip
+import json
+import unittest
+
+from src.api.response_encoder import ResponseEncoder
+
+
+class TestResponseEncoder(unittest.TestCase):
+    def setUp(self):
+        self._response_encoder = ResponseEncoder()
+        self._small_response = {'containers': [], 'left_cargos': []}
+        self._large_response = {'containers': [{'load_points': [[{'x': i, 'y': 0, 'z': 0}] for i in range(100)]}]}
+
+    def test_json(self):
+        body, headers = self._response_encoder.encode(self._small_response, ResponseEncoder.JSON_MIMETYPE, False)
+
+        self.assertDictEqual(json.loads(body), self._small_response)
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(self._response_encoder.mimetypes[0], ResponseEncoder.JSON_MIMETYPE)
+
+    def test_gzip(self):
+        body, headers = self._response_encoder.encode(self._large_response, ResponseEncoder.JSON_MIMETYPE, True)
+
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertDictEqual(json.loads(gzip.decompress(body)), self._large_response)
+
+    def test_small_bodies_are_not_compressed(self):
+        body, headers = self._response_encoder.encode(self._small_response, ResponseEncoder.JSON_MIMETYPE, True)
+
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertDictEqual(json.loads(body), self._small_response)
+
+    @unittest.skipUnless(ResponseEncoder.is_msgpack_available(), 'msgpack is not installed')
+    def test_msgpack(self):
+        import msgpack
+
+        body, _ = self._response_encoder.encode(self._large_response, ResponseEncoder.MSGPACK_MIMETYPE, False)
+        self.assertDictEqual(msgpack.unpackb(body), self._large_response)
+        self.assertIn(ResponseEncoder.MSGPACK_MIMETYPE, self._response_encoder.mimetypes)
+
+    def test_gltf(self):
+        body, _ = self._response_encoder.encode(self._small_response, ResponseEncoder.GLTF_MIMETYPE, False)
+
+        self.assertEqual(body[:4], b'glTF')
+        self.assertIn(ResponseEncoder.GLTF_MIMETYPE, self._response_encoder.scene_mimetypes)
+        self.assertNotIn(ResponseEncoder.GLTF_MIMETYPE, self._response_encoder.mimetypes)
+
+
+if __name__ == '__main__':
+    unittest.main()
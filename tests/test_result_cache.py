@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+
+from src.api.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'results.sqlite')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_hit_and_miss(self):
+        result_cache = ResultCache(self._path)
+        self.assertIsNone(result_cache.get('a'))
+        result_cache.put('a', {'containers': [], 'left_cargos': []})
+
+        self.assertDictEqual(result_cache.get('a'), {'containers': [], 'left_cargos': []})
+        self.assertDictEqual(result_cache.get_stats(), {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 1000})
+
+    def test_shared_between_instances(self):
+        ResultCache(self._path).put('a', {'containers': []})
+        self.assertDictEqual(ResultCache(self._path).get('a'), {'containers': []})
+
+    def test_size_eviction(self):
+        result_cache = ResultCache(self._path, max_size=2)
+        result_cache.put('a', {})
+        result_cache.put('b', {})
+        result_cache.put('c', {})
+
+        self.assertIsNone(result_cache.get('a'))
+        self.assertIsNotNone(result_cache.get('c'))
+        self.assertEqual(result_cache.get_stats()['size'], 2)
+
+    def test_age_eviction(self):
+        result_cache = ResultCache(self._path, max_age=-1)
+        result_cache.put('a', {})
+        self.assertIsNone(result_cache.get('a'))
@@ -0,0 +1,37 @@
+import unittest
+
+from src.loading.shipment_ordering import ShipmentOrdering
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestShipmentOrdering(unittest.TestCase):
+    def setUp(self):
+        self._heavy = ShipmentParameters('heavy', 'box', 200, 200, 200, 50, 'red', True, True, False, False, 0)
+        self._large = ShipmentParameters('large', 'box', 1000, 500, 300, 20, 'red', True, True, False, False, 0)
+        self._tall = ShipmentParameters('tall', 'box', 400, 400, 1200, 10, 'red', True, True, False, False, 0)
+        self._barrel = ShipmentParameters('barrel', 'barrel', 300, 300, 300, 5, 'red', True, True, False, False, 0)
+        self._shipment_params = [self._tall, self._heavy, self._barrel, self._large]
+
+    def test_default(self):
+        self.assertListEqual(
+            ShipmentOrdering.from_name('default').sort(self._shipment_params),
+            [self._barrel, self._heavy, self._large, self._tall])
+
+    def test_volume(self):
+        self.assertListEqual(
+            ShipmentOrdering.from_name('volume').sort(self._shipment_params),
+            [self._tall, self._large, self._barrel, self._heavy])
+
+    def test_footprint(self):
+        self.assertListEqual(
+            ShipmentOrdering.from_name('footprint').sort(self._shipment_params),
+            [self._large, self._tall, self._barrel, self._heavy])
+
+    def test_weight(self):
+        self.assertListEqual(
+            ShipmentOrdering.from_name('WEIGHT').sort(self._shipment_params),
+            [self._heavy, self._large, self._tall, self._barrel])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from src.loading.loader.trial_pruner import TrialPruner
+from src.loading.orientation_table import OrientationTable
+from src.parameters.container_parameters import ContainerParameters
+from src.parameters.shipment_parameters import ShipmentParameters
+
+
+class TestTrialPruner(unittest.TestCase):
+    def setUp(self):
+        self._shipment_params = ShipmentParameters(
+            'box', 'box', 1000, 1000, 1000, 100, 'red', True, True, False, False, 0)
+        self._small_container_params = ContainerParameters('small', 2000, 2000, 2000, 10000)
+        self._large_container_params = ContainerParameters('large', 4000, 2000, 2000, 10000)
+        self._light_container_params = ContainerParameters('light', 4000, 2000, 2000, 250)
+        self._low_container_params = ContainerParameters('low', 4000, 2000, 500, 10000)
+
+    def _create_trial_pruner(self, count, container_params):
+        shipment_params = {self._shipment_params: count}
+        return TrialPruner(shipment_params, container_params, OrientationTable(shipment_params))
+
+    def test_bounds(self):
+        trial_pruner = self._create_trial_pruner(20, [
+            self._small_container_params,
+            self._large_container_params,
+            self._light_container_params,
+            self._low_container_params
+        ])
+
+        self.assertListEqual(trial_pruner.bounds, [8e9, 16e9, 2.5e9, 0])
+        self.assertListEqual(trial_pruner.order(), [1, 0, 2])
+
+    def test_skips_smaller_containers(self):
+        trial_pruner = self._create_trial_pruner(20, [self._small_container_params, self._large_container_params])
+        trial_pruner.add_trial(1, 16e9, {self._shipment_params: 16})
+
+        self.assertFalse(trial_pruner.can_win(0))
+
+    def test_skips_later_containers_when_all_shipments_are_loaded(self):
+        trial_pruner = self._create_trial_pruner(4, [self._small_container_params, self._large_container_params])
+
+        self.assertListEqual(trial_pruner.order(), [0, 1])
+        trial_pruner.add_trial(0, 4e9, {self._shipment_params: 4})
+        self.assertFalse(trial_pruner.can_win(1))
+
+    def test_keeps_earlier_containers_on_tie(self):
+        trial_pruner = self._create_trial_pruner(4, [self._small_container_params, self._large_container_params])
+        trial_pruner.add_trial(1, 4e9, {self._shipment_params: 4})
+
+        self.assertTrue(trial_pruner.can_win(0))
+
+
+if __name__ == '__main__':
+    unittest.main()